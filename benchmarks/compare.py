@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark result files produced by ``run_benchmarks.py``.
+
+Usage:
+    python benchmarks/compare.py baseline.json candidate.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+METRICS = ("seconds", "payload_bytes", "peak_rss_bytes")
+
+
+def _index(report: Dict[str, Any]) -> Dict[Tuple[int, str], Dict[str, Any]]:
+    return {(r["size"], r["case"]): r for r in report["results"]}
+
+
+def main() -> None:
+    """Print the candidate/baseline ratio of each metric per case and size."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    print(
+        f"baseline:  {baseline['commit'][:12]}  "
+        f"candidate: {candidate['commit'][:12]}"
+    )
+
+    base_index = _index(baseline)
+    header = f"{'case':<22}{'size':>10}" + "".join(f"{m:>18}" for m in METRICS)
+    print(header)
+    print("-" * len(header))
+    for key, result in sorted(_index(candidate).items()):
+        before = base_index.get(key)
+        if before is None:
+            continue
+        cells = []
+        for metric in METRICS:
+            old, new = before.get(metric), result.get(metric)
+            if old and new is not None:
+                cells.append(f"{new / old:>17.2f}x")
+            else:
+                cells.append(f"{'-':>18}")
+        print(f"{key[1]:<22}{key[0]:>10,}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
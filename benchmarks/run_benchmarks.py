@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Benchmark the MCP tools and the conversion pipeline at increasing scale.
+
+Generates actuarial workbooks with the vectorized example data generator,
+then times each case in a fresh spawned process so peak RSS is measured per
+case. Results are written as JSON for comparison across commits
+(see ``benchmarks/compare.py``).
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 1000 100000 --output results.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "examples"))
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+# Sheet used for the single-sheet read cases
+POLICY_SHEET = "Policies"
+
+
+def create_workbook(path: Path, rows: int) -> None:
+    """Write an actuarial workbook whose policy and claim sheets have ``rows`` rows."""
+    from generate_scaled_actuarial_data import sheet_sizes, write_xlsx
+
+    write_xlsx(path, sheet_sizes(policies=rows, claims=rows), seed=42)
+
+
+def _payload_bytes(result: Dict[str, Any]) -> int:
+    return len(json.dumps(result, default=str).encode())
+
+
+def _peak_rss_bytes() -> int:
+    from excel_polars_mcp.streaming import process_peak_rss_bytes
+
+    return process_peak_rss_bytes() or 0
+
+
+def case_list_sheets(path: str) -> Dict[str, Any]:
+    from excel_polars_mcp.server import ListSheetsArgs, list_sheets
+
+    start = time.perf_counter()
+    result = asyncio.run(list_sheets(ListSheetsArgs(file_path=path)))
+    return {
+        "seconds": time.perf_counter() - start,
+        "payload_bytes": _payload_bytes(result),
+    }
+
+
+def case_parse_and_serialize(path: str) -> Dict[str, Any]:
+    from excel_polars_mcp.reader import load_sheet
+    from excel_polars_mcp.serialization import frame_payload
+
+    start = time.perf_counter()
+    df = load_sheet(path, sheet_name=POLICY_SHEET)
+    parsed = time.perf_counter()
+    payload = frame_payload(df)
+    done = time.perf_counter()
+    return {
+        "seconds": done - start,
+        "parse_seconds": parsed - start,
+        "serialize_seconds": done - parsed,
+        "rows": df.height,
+        "payload_bytes": _payload_bytes(payload),
+    }
+
+
+def case_read_excel(path: str) -> Dict[str, Any]:
+    from excel_polars_mcp.server import ReadExcelArgs, read_excel
+
+    args = ReadExcelArgs(file_path=path, sheet_name=POLICY_SHEET)
+    start = time.perf_counter()
+    result = asyncio.run(read_excel(args))
+    cold = time.perf_counter()
+    asyncio.run(read_excel(args))
+    warm = time.perf_counter()
+    return {
+        "seconds": cold - start,
+        "warm_seconds": warm - cold,
+        "rows": result.get("total_rows"),
+        "payload_bytes": _payload_bytes(result),
+        "error": result.get("error"),
+    }
+
+
+def case_read_excel_sheet(path: str) -> Dict[str, Any]:
+    from excel_polars_mcp.server import ReadExcelSheetArgs, read_excel_sheet
+
+    args = ReadExcelSheetArgs(file_path=path, sheet_name="Claims")
+    start = time.perf_counter()
+    result = asyncio.run(read_excel_sheet(args))
+    return {
+        "seconds": time.perf_counter() - start,
+        "rows": result.get("total_rows"),
+        "payload_bytes": _payload_bytes(result),
+        "error": result.get("error"),
+    }
+
+
+def _convert(path: str, workers: int) -> Dict[str, Any]:
+    from convert_actuarial_data import convert_excel_to_polars
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            convert_excel_to_polars(path, output_dir, workers=workers)
+        seconds = time.perf_counter() - start
+        output_bytes = sum(f.stat().st_size for f in Path(output_dir).iterdir())
+    return {"seconds": seconds, "workers": workers, "output_bytes": output_bytes}
+
+
+def case_convert(path: str) -> Dict[str, Any]:
+    return _convert(path, workers=1)
+
+
+def case_convert_parallel(path: str) -> Dict[str, Any]:
+    return _convert(path, workers=max(2, os.cpu_count() or 1))
+
+
+CASES: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "list_sheets": case_list_sheets,
+    "parse_and_serialize": case_parse_and_serialize,
+    "read_excel": case_read_excel,
+    "read_excel_sheet": case_read_excel_sheet,
+    "convert": case_convert,
+    "convert_parallel": case_convert_parallel,
+}
+
+
+def _run_case(name: str, path: str) -> Dict[str, Any]:
+    """Entry point inside the spawned process."""
+    from excel_polars_mcp.engines import resolve_engine
+
+    # Resolving "auto" loads or runs engine calibration, which would
+    # otherwise be timed as part of the first read
+    engine = resolve_engine("auto", path)
+    result = CASES[name](path)
+    result["engine"] = engine
+    result["peak_rss_bytes"] = _peak_rss_bytes()
+    return result
+
+
+def run_case_isolated(name: str, path: str) -> Dict[str, Any]:
+    """Run one case in a fresh process so caches and RSS start clean."""
+    # Executor workers are not daemonic, so cases may start their own pools
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_run_case, name, path).result()
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(sizes: List[int], cases: List[str], workdir: Path) -> Dict[str, Any]:
+    """Generate each workbook size and run every case against it."""
+    import polars as pl
+
+    results = []
+    for size in sizes:
+        path = workdir / f"actuarial_{size}.xlsx"
+        if not path.exists():
+            print(f"📊 Generating {size:,}-row workbook...", file=sys.stderr)
+            start = time.perf_counter()
+            create_workbook(path, size)
+            print(f"   done in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+        for name in cases:
+            print(f"⏱️  {name} @ {size:,} rows", file=sys.stderr)
+            result = run_case_isolated(name, str(path))
+            results.append({
+                "size": size,
+                "case": name,
+                "workbook_bytes": path.stat().st_size,
+                **result,
+            })
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and emit JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--cases", nargs="+", choices=sorted(CASES), default=list(CASES)
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=ROOT / "benchmarks" / "data",
+        help="Where generated workbooks are kept between runs",
+    )
+    parser.add_argument("--output", type=Path, help="JSON file (default: stdout)")
+    args = parser.parse_args()
+
+    args.workdir.mkdir(parents=True, exist_ok=True)
+    report = run(args.sizes, args.cases, args.workdir)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text)
+        print(f"✅ Results written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,39 @@
 """Convert actuarial Excel file to Polars format using direct Polars methods."""
 
+import argparse
+import hashlib
+import io
 import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import polars as pl
-from openpyxl import load_workbook
 
+from excel_polars_mcp.reader import list_sheet_names
+from excel_polars_mcp.stats import describe_frame
 
-def convert_excel_to_polars(excel_path: str, output_dir: str):
-    """Convert Excel file to Polars format and save outputs."""
+
+def convert_excel_to_polars(
+    excel_path: str, output_dir: str, workers: int = 1, force: bool = False
+):
+    """
+    Convert Excel file to Polars format and save outputs.
+
+    With ``workers`` > 1, sheets are read concurrently in a process pool and
+    each sheet's Parquet, CSV, JSON and schema files are written from a
+    thread pool. With one worker every sheet is read in a single pass and
+    written in turn. Per-stage timings are returned and included in
+    ``conversion_summary.md``.
+
+    Conversion is incremental: ``conversion_manifest.json`` in the output
+    directory records the workbook fingerprint, a content hash per sheet and
+    the size/mtime of every output file. An unchanged workbook is not read
+    at all unless outputs are missing or were modified, and a sheet whose
+    content hash is unchanged only rewrites its stale outputs. ``force``
+    ignores the manifest and reconverts everything.
+    """
     excel_file = Path(excel_path)
     output_path = Path(output_dir)
     
@@ -19,105 +44,344 @@ def convert_excel_to_polars(excel_path: str, output_dir: str):
     output_path.mkdir(exist_ok=True)
     
     print(f"📖 Reading Excel file: {excel_file}")
+    started = time.perf_counter()
+    
+    manifest = {} if force else load_manifest(output_path)
+    source = _source_fingerprint(excel_file, manifest.get("source"))
+    entries = manifest.get("sheets", {})
+    
+    # With the workbook unchanged, only sheets with stale outputs are read
+    pending = None
+    fresh = []
+    recorded_hash = manifest.get("source", {}).get("sha256")
+    if recorded_hash and recorded_hash == source["sha256"]:
+        pending = [name for name, entry in entries.items()
+                   if _stale_outputs(name, entry, output_path)]
+        fresh = [_unchanged_result(name, entries[name])
+                 for name in entries if name not in pending]
+    
+    if pending == []:
+        results = []
+    elif workers > 1:
+        results = _convert_parallel(excel_file, output_path, workers,
+                                    entries, pending)
+    else:
+        results = _convert_sequential(excel_file, output_path, entries, pending)
+    if results is None:
+        return
+    
+    results = fresh + results
+    if pending is not None:
+        # Manifest entries are in workbook order
+        order = list(entries)
+        results.sort(key=lambda r: order.index(r["sheet_name"]))
+    
+    sheets = [result["sheet_name"] for result in results]
+    for result in results:
+        print(f"\n🔄 Processed sheet: {result['sheet_name']}")
+        if "error" in result:
+            print(f"   ❌ Error processing sheet {result['sheet_name']}: "
+                  f"{result['error']}")
+            continue
+        print(f"   📊 Shape: {tuple(result['shape'])}")
+        print(f"   📝 Columns: {', '.join(result['columns'])}")
+        for label, path in result["files"].items():
+            print(f"   💾 Saved {label}: {path}")
+        if result["skipped"]:
+            print(f"   ⏭️  Up to date: {', '.join(result['skipped'])}")
+    
+    save_manifest(output_path, source, results)
+    
+    timings = {
+        "workers": workers,
+        "total_seconds": time.perf_counter() - started,
+        "sheets": {r["sheet_name"]: r["timings"] for r in results},
+        "unchanged": [r["sheet_name"] for r in results
+                      if "error" not in r and not r["files"]],
+    }
+    print(f"\n✅ Conversion completed in {timings['total_seconds']:.2f}s! "
+          f"Output saved to: {output_path}")
+    
+    # Create summary report
+    create_summary_report(output_path, sheets, timings)
+    return timings
+
+
+# Output files written for each sheet, as (label, file suffix)
+OUTPUT_FORMATS = [
+    ("Parquet", ".parquet"),
+    ("CSV", ".csv"),
+    ("JSON", ".json"),
+    ("Schema", "_schema.json"),
+]
+
+MANIFEST_NAME = "conversion_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _output_paths(sheet_name: str, output_path: Path) -> dict:
+    base_name = sheet_name.lower()
+    return {
+        label: output_path / f"{base_name}{suffix}"
+        for label, suffix in OUTPUT_FORMATS
+    }
+
+
+def _file_fingerprint(path: Path) -> dict:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _source_fingerprint(excel_file: Path, recorded: dict = None) -> dict:
+    """Fingerprint the workbook, re-hashing only when size or mtime moved."""
+    fingerprint = _file_fingerprint(excel_file)
+    recorded = recorded or {}
+    if all(recorded.get(key) == value for key, value in fingerprint.items()):
+        return {**fingerprint, "sha256": recorded.get("sha256")}
+    digest = hashlib.sha256()
+    with open(excel_file, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return {**fingerprint, "sha256": digest.hexdigest()}
+
+
+def frame_hash(df: pl.DataFrame) -> str:
+    """Content hash of a sheet: SHA-256 of its uncompressed Arrow IPC bytes."""
+    buffer = io.BytesIO()
+    df.write_ipc(buffer, compression="uncompressed")
+    return hashlib.sha256(buffer.getbuffer()).hexdigest()
+
+
+def load_manifest(output_path: Path) -> dict:
+    """Return the manifest, or {} if it is missing or from another version."""
+    try:
+        manifest = json.loads((output_path / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    # Content hashes depend on the Polars IPC writer
+    if (manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("polars") != pl.__version__):
+        return {}
+    return manifest
+
+
+def save_manifest(output_path: Path, source: dict, results: list):
+    """Record successful sheets; failed ones are left out so they are retried."""
+    if any("error" in r for r in results):
+        # Forget the workbook hash so the next run reads every sheet again
+        source = {**source, "sha256": None}
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "polars": pl.__version__,
+        "source": source,
+        "sheets": {
+            r["sheet_name"]: {
+                "content_hash": r["content_hash"],
+                "shape": list(r["shape"]),
+                "columns": r["columns"],
+                "outputs": r["outputs"],
+            }
+            for r in results
+            if "error" not in r
+        },
+    }
+    path = output_path / MANIFEST_NAME
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    tmp_path.replace(path)
+
+
+def _stale_outputs(sheet_name: str, entry: dict, output_path: Path) -> list:
+    """Formats whose file is missing or differs from the recorded fingerprint."""
+    recorded = entry.get("outputs", {})
+    return [
+        label
+        for label, path in _output_paths(sheet_name, output_path).items()
+        if not path.exists() or recorded.get(label) != _file_fingerprint(path)
+    ]
+
+
+def _unchanged_result(sheet_name: str, entry: dict) -> dict:
+    return {
+        "sheet_name": sheet_name,
+        "shape": entry["shape"],
+        "columns": entry["columns"],
+        "content_hash": entry["content_hash"],
+        "outputs": entry["outputs"],
+        "files": {},
+        "skipped": [label for label, _ in OUTPUT_FORMATS],
+        "timings": {},
+    }
+
+
+def _write_output(df: pl.DataFrame, sheet_name: str, label: str, path: Path):
+    """Write one output file and return the seconds it took."""
+    start = time.perf_counter()
+    if label == "Parquet":
+        # 1. Parquet (efficient binary format)
+        df.write_parquet(path)
+    elif label == "CSV":
+        # 2. CSV (human readable)
+        df.write_csv(path)
+    elif label == "JSON":
+        # 3. JSON (structured data)
+        df.write_json(path)
+    else:
+        # 4. Schema information
+        schema_info = {
+            "sheet_name": sheet_name,
+            "shape": df.shape,
+            "columns": df.columns,
+            "dtypes": {col: str(dtype) for col, dtype in zip(df.columns, df.dtypes)},
+            "sample_data": df.head(3).to_dicts(),
+            "statistics": get_basic_stats(df)
+        }
+        with open(path, 'w') as f:
+            json.dump(schema_info, f, indent=2, default=str)
+    return time.perf_counter() - start
+
+
+def _write_sheet(
+    df: pl.DataFrame,
+    sheet_name: str,
+    output_path: Path,
+    entry: dict = None,
+    threads: int = 1,
+) -> dict:
+    """
+    Write one sheet's output formats, optionally from a thread pool.
+
+    When the sheet's content hash matches ``entry`` from the manifest, only
+    formats whose files are missing or stale are rewritten.
+    """
+    paths = _output_paths(sheet_name, output_path)
+    content_hash = frame_hash(df)
+    if entry and entry.get("content_hash") == content_hash:
+        labels = _stale_outputs(sheet_name, entry, output_path)
+    else:
+        labels = list(paths)
     
-    # Get list of sheets using openpyxl
+    start = time.perf_counter()
+    if threads > 1 and len(labels) > 1:
+        # Polars releases the GIL while encoding, so the writers overlap
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = {
+                label: pool.submit(_write_output, df, sheet_name, label, paths[label])
+                for label in labels
+            }
+            timings = {label: future.result() for label, future in futures.items()}
+    else:
+        timings = {
+            label: _write_output(df, sheet_name, label, paths[label])
+            for label in labels
+        }
+    timings["Write"] = time.perf_counter() - start
+    return {
+        "sheet_name": sheet_name,
+        "shape": df.shape,
+        "columns": df.columns,
+        "content_hash": content_hash,
+        "outputs": {label: _file_fingerprint(path) for label, path in paths.items()},
+        "files": {label: str(paths[label]) for label in labels},
+        "skipped": [label for label in paths if label not in labels],
+        "timings": timings,
+    }
+
+
+def _convert_sequential(
+    excel_file: Path, output_path: Path, entries: dict, sheets: list = None
+):
+    """Read the requested sheets (default: all) in one pass, then write each."""
+    # Read every sheet in a single pass so the archive and shared strings
+    # are only parsed once
+    start = time.perf_counter()
     try:
-        workbook = load_workbook(filename=str(excel_file), read_only=True)
-        sheets = workbook.sheetnames
-        workbook.close()
+        frames = pl.read_excel(
+            source=str(excel_file),
+            sheet_id=0 if sheets is None else None,
+            sheet_name=sheets,
+            has_header=True,
+        )
     except Exception as e:
         print(f"❌ Failed to read Excel file: {e}")
-        return
+        return None
+    read_seconds = time.perf_counter() - start
     
-    print(f"📋 Found {len(sheets)} sheets: {', '.join(sheets)}")
+    print(f"📋 Read {len(frames)} sheets: {', '.join(frames)}")
     
-    # Process each sheet
-    for sheet_name in sheets:
-        print(f"\n🔄 Processing sheet: {sheet_name}")
-        
+    results = []
+    for sheet_name, df in frames.items():
         try:
-            # Read sheet data using polars
-            df = pl.read_excel(
-                source=str(excel_file),
-                sheet_name=sheet_name,
-                has_header=True
-            )
-            
-            print(f"   📊 Shape: {df.shape}")
-            print(f"   📝 Columns: {', '.join(df.columns)}")
-            
-            # Save in multiple formats
-            base_name = sheet_name.lower()
-            
-            # 1. Parquet (efficient binary format)
-            parquet_path = output_path / f"{base_name}.parquet"
-            df.write_parquet(parquet_path)
-            print(f"   💾 Saved Parquet: {parquet_path}")
-            
-            # 2. CSV (human readable)
-            csv_path = output_path / f"{base_name}.csv"
-            df.write_csv(csv_path)
-            print(f"   💾 Saved CSV: {csv_path}")
-            
-            # 3. JSON (structured data)
-            json_path = output_path / f"{base_name}.json"
-            df.write_json(json_path)
-            print(f"   💾 Saved JSON: {json_path}")
-            
-            # 4. Schema information
-            schema_path = output_path / f"{base_name}_schema.json"
-            schema_info = {
-                "sheet_name": sheet_name,
-                "shape": df.shape,
-                "columns": df.columns,
-                "dtypes": {col: str(dtype) for col, dtype in zip(df.columns, df.dtypes)},
-                "sample_data": df.head(3).to_dicts(),
-                "statistics": get_basic_stats(df)
-            }
-            
-            with open(schema_path, 'w') as f:
-                json.dump(schema_info, f, indent=2, default=str)
-            print(f"   📋 Saved Schema: {schema_path}")
-            
+            result = _write_sheet(df, sheet_name, output_path, entries.get(sheet_name))
         except Exception as e:
-            print(f"   ❌ Error processing sheet {sheet_name}: {e}")
+            result = {"sheet_name": sheet_name, "error": str(e), "timings": {}}
+        # The single-pass read is shared; each sheet is charged an equal part
+        result["timings"]["Read"] = read_seconds / len(frames)
+        results.append(result)
+    return results
+
+
+def convert_sheet(
+    excel_path: str, sheet_name: str, output_dir: str, entry: dict = None
+) -> dict:
+    """Read one sheet and write its new or stale outputs (process pool task)."""
+    start = time.perf_counter()
+    try:
+        df = pl.read_excel(source=excel_path, sheet_name=sheet_name, has_header=True)
+        read_seconds = time.perf_counter() - start
+        result = _write_sheet(
+            df, sheet_name, Path(output_dir), entry, threads=len(OUTPUT_FORMATS)
+        )
+    except Exception as e:
+        return {"sheet_name": sheet_name, "error": str(e), "timings": {}}
+    result["timings"]["Read"] = read_seconds
+    return result
+
+
+def _convert_parallel(
+    excel_file: Path,
+    output_path: Path,
+    workers: int,
+    entries: dict,
+    sheets: list = None,
+):
+    """Convert the requested sheets (default: all), one process-pool task each."""
+    if sheets is None:
+        try:
+            # Only the workbook metadata is read, not any sheet
+            sheets = list_sheet_names(excel_file)
+        except Exception as e:
+            print(f"❌ Failed to read Excel file: {e}")
+            return None
     
-    print(f"\n✅ Conversion completed! Output saved to: {output_path}")
+    print(f"📋 Reading {len(sheets)} sheets: {', '.join(sheets)}")
     
-    # Create summary report
-    create_summary_report(output_path, sheets)
+    # Spawned workers each open the workbook themselves; results carry only
+    # shapes, hashes and timings, never the frames
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(sheets)), mp_context=context
+    ) as pool:
+        futures = [
+            pool.submit(
+                convert_sheet,
+                str(excel_file),
+                sheet,
+                str(output_path),
+                entries.get(sheet),
+            )
+            for sheet in sheets
+        ]
+        return [future.result() for future in futures]
 
 
 def get_basic_stats(df: pl.DataFrame) -> dict:
-    """Get basic statistics for the DataFrame."""
-    stats = {}
-    
-    for col in df.columns:
-        col_stats = {"type": str(df[col].dtype)}
-        
-        if df[col].dtype in [pl.Int64, pl.Int32, pl.Float64, pl.Float32]:
-            try:
-                col_stats.update({
-                    "min": df[col].min(),
-                    "max": df[col].max(),
-                    "mean": df[col].mean(),
-                    "null_count": df[col].null_count()
-                })
-            except Exception:
-                pass
-        elif df[col].dtype == pl.String:
-            col_stats.update({
-                "unique_count": df[col].n_unique(),
-                "null_count": df[col].null_count()
-            })
-        
-        stats[col] = col_stats
-    
-    return stats
+    """Get basic statistics for every column, computed in a single pass."""
+    return describe_frame(df)["columns"]
 
 
-def create_summary_report(output_path: Path, sheets: list):
-    """Create a summary report of the conversion."""
+def create_summary_report(output_path: Path, sheets: list, timings: dict = None):
+    """Create a summary report of the conversion, with stage timings if given."""
     from datetime import datetime
     
     report_path = output_path / "conversion_summary.md"
@@ -137,6 +401,9 @@ def create_summary_report(output_path: Path, sheets: list):
             f.write(f"- **JSON:** `{base_name}.json`\n")
             f.write(f"- **Schema:** `{base_name}_schema.json`\n\n")
         
+        if timings:
+            write_timing_section(f, timings)
+        
         f.write("## File Formats\n\n")
         f.write("- **Parquet:** Efficient binary format, best for data analysis\n")
         f.write("- **CSV:** Human-readable, compatible with Excel and other tools\n")
@@ -157,8 +424,43 @@ def create_summary_report(output_path: Path, sheets: list):
     print(f"📄 Summary report created: {report_path}")
 
 
+def write_timing_section(f, timings: dict):
+    """Write a per-sheet, per-stage timing table (seconds)."""
+    stages = ["Read"] + [label for label, _ in OUTPUT_FORMATS] + ["Write"]
+    f.write("## Timing\n\n")
+    f.write(f"**Workers:** {timings['workers']}\n")
+    f.write(f"**Total wall time:** {timings['total_seconds']:.3f}s\n")
+    if timings.get("unchanged"):
+        f.write(f"**Unchanged (not rewritten):** {', '.join(timings['unchanged'])}\n")
+    f.write("\n")
+    f.write("| Sheet | " + " | ".join(stages) + " |\n")
+    f.write("|---" * (len(stages) + 1) + "|\n")
+    for sheet, stage_times in timings["sheets"].items():
+        cells = [
+            f"{stage_times[stage]:.3f}" if stage in stage_times else "-"
+            for stage in stages
+        ]
+        f.write(f"| {sheet} | " + " | ".join(cells) + " |\n")
+    f.write("\nFormat writers for one sheet run concurrently when workers > 1, "
+            "so their times overlap; Write is the wall time for all of them.\n\n")
+
+
 def main():
     """Main function to run the conversion."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Sheets converted in parallel (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore conversion_manifest.json and rewrite every output",
+    )
+    args = parser.parse_args()
+    
     # First create the sample data if it doesn't exist
     excel_path = Path("sample_data/actuarial_data.xlsx")
     
@@ -173,7 +475,9 @@ def main():
     # Convert to Polars format
     convert_excel_to_polars(
         excel_path="sample_data/actuarial_data.xlsx",
-        output_dir="output"
+        output_dir="output",
+        workers=args.workers,
+        force=args.force,
     )
 
 
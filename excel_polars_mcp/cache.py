@@ -0,0 +1,120 @@
+"""In-process LRU cache of parsed Excel sheets."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+from excel_polars_mcp import config, metrics
+from excel_polars_mcp.lazy import polars as pl
+
+
+class FileFingerprint(NamedTuple):
+    """Identity of a file on disk at a point in time."""
+
+    path: str
+    mtime_ns: int
+    size: int
+
+
+def file_fingerprint(file_path: Union[str, Path]) -> FileFingerprint:
+    """Fingerprint a file by its resolved path, modification time and size."""
+    resolved = Path(file_path).resolve()
+    stat = resolved.stat()
+    return FileFingerprint(str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+class SheetKey(NamedTuple):
+    """Cache key for one parsed sheet of one version of a workbook."""
+
+    fingerprint: FileFingerprint
+    sheet_name: Optional[str]
+    has_header: bool
+    infer_schema_length: int
+    engine: str = "calamine"
+    columns: Optional[Tuple[str, ...]] = None
+    schema_overrides: Optional[Tuple[Tuple[str, str], ...]] = None
+    schema_inference: str = "head"
+
+
+class SheetCache:
+    """
+    Thread-safe LRU cache of parsed DataFrames bounded by estimated memory.
+
+    Frames are evicted least-recently-used first once the summed
+    ``DataFrame.estimated_size()`` exceeds ``max_bytes``. A frame larger than
+    the whole budget is never cached, and ``max_bytes=0`` disables caching.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[SheetKey, pl.DataFrame]" = OrderedDict()
+        self._sizes: Dict[SheetKey, int] = {}
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: SheetKey) -> Optional[pl.DataFrame]:
+        """Return the cached frame for ``key``, or None on a miss."""
+        with self._lock:
+            df = self._entries.get(key)
+            if df is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        metrics.record_cache_lookup(df is not None)
+        return df
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key: SheetKey, df: pl.DataFrame) -> None:
+        """Store ``df`` under ``key``, evicting older entries to fit the budget."""
+        size = df.estimated_size()
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = df
+            self._sizes[key] = size
+            self._current_bytes += size
+            while self._current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current memory usage."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: SheetKey) -> None:
+        del self._entries[key]
+        self._current_bytes -= self._sizes.pop(key)
+
+
+sheet_cache = SheetCache(config.cache_max_bytes())
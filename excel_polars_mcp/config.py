@@ -0,0 +1,128 @@
+"""Runtime configuration read from environment variables."""
+
+import os
+from pathlib import Path
+from typing import List
+
+ENV_PREFIX = "EXCEL_POLARS_MCP_"
+
+
+def env_str(name: str, default: str = "") -> str:
+    """Return the string value of ``EXCEL_POLARS_MCP_<name>`` or a default."""
+    return os.environ.get(ENV_PREFIX + name, default)
+
+
+def env_int(name: str, default: int) -> int:
+    """Return the integer value of ``EXCEL_POLARS_MCP_<name>`` or a default."""
+    value = os.environ.get(ENV_PREFIX + name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{ENV_PREFIX}{name} must be an integer, got {value!r}")
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Return ``EXCEL_POLARS_MCP_<name>`` as a flag (0/false/no/off are false)."""
+    value = os.environ.get(ENV_PREFIX + name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
+def cache_max_bytes() -> int:
+    """Memory budget for the parsed-sheet cache (0 disables caching)."""
+    return env_int("CACHE_MAX_BYTES", 512 * 1024 * 1024)
+
+
+def worker_count() -> int:
+    """Number of pool workers that may parse or serialize concurrently."""
+    return env_int("WORKERS", min(4, os.cpu_count() or 1))
+
+
+def worker_max_queue() -> int:
+    """Number of calls allowed to wait for a worker before new ones are rejected."""
+    return env_int("MAX_QUEUE", 64)
+
+
+def worker_kind() -> str:
+    """Worker pool flavour: ``thread`` (default) or ``process``."""
+    kind = env_str("POOL", "thread").lower()
+    if kind not in ("thread", "process"):
+        raise ValueError(
+            f"{ENV_PREFIX}POOL must be 'thread' or 'process', got {kind!r}"
+        )
+    return kind
+
+
+def sidecar_dir() -> str:
+    """Directory for Parquet sidecars of parsed sheets (empty disables them)."""
+    return env_str("SIDECAR_DIR")
+
+
+def cache_home() -> Path:
+    """Base directory for on-disk state such as engine calibration results."""
+    configured = env_str("CACHE_HOME")
+    if configured:
+        return Path(configured)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "excel-polars-mcp"
+
+
+def engine_calibration_path() -> Path:
+    """File holding the cached engine calibration timings."""
+    configured = env_str("ENGINE_CALIBRATION")
+    return Path(configured) if configured else cache_home() / "engine_calibration.json"
+
+
+def schema_cache_dir() -> str:
+    """Directory for schemas inferred from whole sheets (set empty to disable)."""
+    return env_str("SCHEMA_CACHE_DIR", str(cache_home() / "schemas"))
+
+
+def metrics_enabled() -> bool:
+    """Whether tool calls are measured (``EXCEL_POLARS_MCP_METRICS=0`` disables)."""
+    return env_bool("METRICS", True)
+
+
+def metrics_prometheus_file() -> str:
+    """File rewritten with metrics in Prometheus text format (empty disables)."""
+    return env_str("METRICS_FILE")
+
+
+def profile_all() -> bool:
+    """Whether every tool call is profiled."""
+    return env_bool("PROFILE", False)
+
+
+def profile_threshold_ms() -> int:
+    """Latency above which a call's profile is kept (0 disables auto-capture)."""
+    return env_int("PROFILE_THRESHOLD_MS", 0)
+
+
+def profile_dir() -> Path:
+    """Directory receiving profile captures."""
+    configured = env_str("PROFILE_DIR")
+    return Path(configured) if configured else cache_home() / "profiles"
+
+
+def compress_min_bytes() -> int:
+    """Encoded payload size from which an accepted compression is applied."""
+    return env_int("COMPRESS_MIN_BYTES", 64 * 1024)
+
+
+def warm_up_enabled() -> bool:
+    """Whether Polars and the Excel engines are imported in the background."""
+    return env_bool("WARMUP", True)
+
+
+def watch_dirs() -> List[str]:
+    """Directories whose workbooks are prewarmed (``os.pathsep``-separated)."""
+    return [path for path in env_str("WATCH_DIRS").split(os.pathsep) if path]
+
+
+def watch_interval() -> int:
+    """Seconds between scans of the watched directories."""
+    return env_int("WATCH_INTERVAL", 5)
@@ -0,0 +1,164 @@
+"""Excel engine discovery and benchmark-driven automatic selection."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Union
+
+from excel_polars_mcp import config
+from excel_polars_mcp.lazy import polars as pl
+
+EngineName = Literal["auto", "calamine", "openpyxl", "xlsx2csv"]
+
+# Python module backing each engine, in order of preference when untimed
+ENGINE_MODULES: Dict[str, str] = {
+    "calamine": "fastexcel",
+    "xlsx2csv": "xlsx2csv",
+    "openpyxl": "openpyxl",
+}
+
+# Engines able to read legacy BIFF (.xls) workbooks
+XLS_ENGINES = ("calamine",)
+
+# Files above this size use the "large" calibration bucket
+LARGE_FILE_BYTES = 1024 * 1024
+
+CALIBRATION_ROWS = {"small": 200, "large": 5_000}
+CALIBRATION_VERSION = 1
+
+_calibration: Optional[Dict[str, Dict[str, float]]] = None
+_calibration_lock = threading.Lock()
+
+
+def available_engines() -> List[str]:
+    """Return the engines whose backing package is importable."""
+    return [
+        engine
+        for engine, module in ENGINE_MODULES.items()
+        if importlib.util.find_spec(module) is not None
+    ]
+
+
+def _calibration_frame(rows: int) -> pl.DataFrame:
+    index = pl.int_range(rows)
+    return pl.select(
+        Policy_ID=pl.format("POL{}", index),
+        Face_Amount=index * 1000,
+        Annual_Premium=index * 1.5,
+        Issue_Date=pl.date(2020, 1, 1) + pl.duration(days=index % 1460),
+    )
+
+
+def calibrate() -> Dict[str, Dict[str, float]]:
+    """
+    Time every available engine on small and large synthetic workbooks.
+
+    Returns:
+        Mapping of size bucket to {engine: best-of-two seconds}; engines
+        that fail to read the workbook are left out
+    """
+    engines = available_engines()
+    timings: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for bucket, rows in CALIBRATION_ROWS.items():
+            path = Path(tmp) / f"calibration_{bucket}.xlsx"
+            _calibration_frame(rows).write_excel(path)
+            timings[bucket] = {}
+            for engine in engines:
+                best = None
+                for _ in range(2):
+                    start = time.perf_counter()
+                    try:
+                        pl.read_excel(path, engine=engine)  # type: ignore[arg-type]
+                    except Exception:
+                        best = None
+                        break
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                if best is not None:
+                    timings[bucket][engine] = best
+    return timings
+
+
+def _load_calibration() -> Dict[str, Dict[str, float]]:
+    """Return calibration timings from memory, disk, or a fresh run."""
+    global _calibration
+    with _calibration_lock:
+        if _calibration is not None:
+            return _calibration
+
+        path = config.engine_calibration_path()
+        identity = {
+            "version": CALIBRATION_VERSION,
+            "polars": pl.__version__,
+            "engines": available_engines(),
+        }
+        try:
+            stored = json.loads(path.read_text())
+            if all(stored.get(field) == value for field, value in identity.items()):
+                _calibration = stored["timings"]
+                return _calibration
+        except (OSError, ValueError, KeyError):
+            pass
+
+        timings = calibrate()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({**identity, "timings": timings}, indent=2))
+        except OSError:
+            pass  # An unwritable cache only costs a re-run next start
+        _calibration = timings
+        return timings
+
+
+def reset_calibration() -> None:
+    """Forget the in-memory calibration so the next auto choice reloads it."""
+    global _calibration
+    with _calibration_lock:
+        _calibration = None
+
+
+def resolve_engine(engine: str, file_path: Union[str, Path]) -> str:
+    """
+    Turn a requested engine (possibly ``auto``) into a concrete engine name.
+
+    ``auto`` picks the fastest calibrated engine for the file's type and
+    size bucket. Explicit engines are checked for availability and for
+    support of the file type.
+
+    Raises:
+        ValueError: If no suitable engine is installed
+    """
+    suffix = Path(file_path).suffix.lower()
+    installed = available_engines()
+    candidates = [
+        name for name in installed if suffix != ".xls" or name in XLS_ENGINES
+    ]
+
+    if engine != "auto":
+        if engine not in ENGINE_MODULES:
+            raise ValueError(f"Unknown engine: {engine}")
+        if engine not in installed:
+            raise ValueError(
+                f"Engine '{engine}' requires the '{ENGINE_MODULES[engine]}' package"
+            )
+        if engine not in candidates:
+            raise ValueError(f"Engine '{engine}' cannot read {suffix} files")
+        return engine
+
+    if not candidates:
+        raise ValueError(f"No installed Excel engine can read {suffix} files")
+    if len(candidates) == 1:
+        return candidates[0]
+
+    bucket = "large" if Path(file_path).stat().st_size > LARGE_FILE_BYTES else "small"
+    timings = _load_calibration().get(bucket, {})
+    timed = [name for name in candidates if name in timings]
+    if not timed:
+        return candidates[0]
+    return min(timed, key=lambda name: timings[name])
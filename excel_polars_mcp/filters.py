@@ -0,0 +1,106 @@
+"""Declarative row filters compiled to Polars expressions."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional
+
+from pydantic import BaseModel
+
+from excel_polars_mcp.lazy import polars as pl
+
+FilterOp = Literal[
+    "eq",
+    "ne",
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "in",
+    "not_in",
+    "is_null",
+    "is_not_null",
+    "contains",
+    "starts_with",
+]
+
+
+class FilterCondition(BaseModel):
+    """
+    A single ``column <op> value`` condition.
+
+    Values arrive as JSON, so dates, datetimes and times are given as ISO
+    strings ("2024-01-31", "2024-01-31 09:30:00") and parsed to the column's
+    dtype when the frame's schema is known.
+    """
+    column: str
+    op: FilterOp
+    value: Any = None
+
+
+_OPERATORS: Dict[str, Callable[[pl.Expr, Any], pl.Expr]] = {
+    "eq": lambda col, value: col == value,
+    "ne": lambda col, value: col != value,
+    "gt": lambda col, value: col > value,
+    "ge": lambda col, value: col >= value,
+    "lt": lambda col, value: col < value,
+    "le": lambda col, value: col <= value,
+    "in": lambda col, value: col.is_in(value),
+    "not_in": lambda col, value: ~col.is_in(value),
+    "is_null": lambda col, value: col.is_null(),
+    "is_not_null": lambda col, value: col.is_not_null(),
+    "contains": lambda col, value: col.str.contains(value, literal=True),
+    "starts_with": lambda col, value: col.str.starts_with(value),
+}
+
+
+def _parse_temporal(value: Any, column: str, dtype: pl.DataType) -> Any:
+    """Parse ISO strings given for a date, datetime or time column."""
+    values = value if isinstance(value, list) else [value]
+    if not values or not all(isinstance(item, str) for item in values):
+        return value
+    strings = pl.Series(values, dtype=pl.String)
+    try:
+        if dtype == pl.Date:
+            parsed = strings.str.to_date()
+        elif dtype == pl.Datetime:
+            parsed = strings.str.to_datetime(
+                time_unit=dtype.time_unit,  # type: ignore[attr-defined]
+                time_zone=dtype.time_zone,  # type: ignore[attr-defined]
+            )
+        elif dtype == pl.Time:
+            parsed = strings.str.to_time()
+        else:
+            return value
+    except pl.exceptions.PolarsError:
+        raise ValueError(f"Filter value {value!r} is not a valid {dtype} for {column}")
+    return parsed.to_list() if isinstance(value, list) else parsed[0]
+
+
+def build_filter_expr(
+    conditions: Optional[List[FilterCondition]],
+    schema: Optional[Mapping[str, pl.DataType]] = None,
+) -> Optional[pl.Expr]:
+    """
+    Combine conditions into one predicate; all conditions must hold.
+
+    Args:
+        conditions: Conditions to AND together, or None
+        schema: Dtypes of the filtered frame, used to parse string values
+            given for temporal columns
+
+    Returns:
+        The combined expression, or None when there is nothing to filter
+    """
+    if not conditions:
+        return None
+    exprs = []
+    for condition in conditions:
+        if condition.op in ("in", "not_in") and not isinstance(condition.value, list):
+            raise ValueError(f"Filter op '{condition.op}' requires a list value")
+        value = condition.value
+        dtype = schema.get(condition.column) if schema is not None else None
+        if value is not None and dtype is not None and dtype.is_temporal():
+            value = _parse_temporal(value, condition.column, dtype)
+        build = _OPERATORS[condition.op]
+        exprs.append(build(pl.col(condition.column), value))
+    return pl.all_horizontal(exprs)
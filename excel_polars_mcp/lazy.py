@@ -0,0 +1,62 @@
+"""Deferred imports of heavy dependencies, and a background warm-up."""
+
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+from typing import Any, Optional, Sequence
+
+# Imported by ``warm_up``, in order; engines that are not installed are skipped
+WARM_UP_MODULES = ("polars", "fastexcel", "openpyxl")
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    MCP clients spawn the server per session, so importing Polars at
+    startup would delay every handshake. ``from excel_polars_mcp.lazy
+    import polars as pl`` behaves like ``import polars as pl`` except that
+    Polars loads when ``pl.<name>`` is first used. Loading is thread-safe.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> ModuleType:
+        """Import the module if needed and return it."""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+polars = LazyModule("polars")
+
+
+def warm_up(modules: Sequence[str] = WARM_UP_MODULES) -> None:
+    """Import ``modules`` now so the first tool call does not pay for it."""
+    for name in modules:
+        if name == "polars":
+            polars.load()
+        elif importlib.util.find_spec(name) is not None:
+            importlib.import_module(name)
+
+
+def start_warm_up(modules: Sequence[str] = WARM_UP_MODULES) -> threading.Thread:
+    """Run ``warm_up`` in a daemon thread and return it."""
+    thread = threading.Thread(
+        target=warm_up, args=(modules,), name="excel-warm-up", daemon=True
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,339 @@
+"""Per-tool latency, throughput and cache metrics, with Prometheus text export."""
+
+import bisect
+import contextvars
+import functools
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+from excel_polars_mcp import config
+
+METRIC_PREFIX = "excel_polars_mcp"
+
+SECONDS_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+ROWS_BUCKETS = tuple(float(10**exponent) for exponent in range(8))
+BYTES_BUCKETS = tuple(float(4**exponent * 1024) for exponent in range(11))
+
+# Histogram name -> (bucket bounds, help text)
+HISTOGRAMS: Dict[str, Any] = {
+    "latency_seconds": (SECONDS_BUCKETS, "Wall time of the whole tool call"),
+    "parse_seconds": (SECONDS_BUCKETS, "Time reading and querying sheets"),
+    "serialize_seconds": (SECONDS_BUCKETS, "Time encoding frames for the response"),
+    "rows": (ROWS_BUCKETS, "Rows returned per call"),
+    "payload_bytes": (BYTES_BUCKETS, "Encoded size of the returned frame data"),
+}
+
+# Minimum seconds between rewrites of the Prometheus text file
+PROMETHEUS_WRITE_INTERVAL = 1.0
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a running sum, as in Prometheus."""
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.min = value if not self.count else min(self.min, value)
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by linear interpolation within its bucket,
+        clamped to the smallest and largest values observed.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if cumulative + count >= rank and count:
+                if index == len(self.bounds):
+                    return self.max
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index]
+                estimate = lower + (upper - lower) * (rank - cumulative) / count
+                return min(max(estimate, self.min), self.max)
+            cumulative += count
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        """Count, sum, mean, min, max and p50/p95/p99 estimates."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class CallRecord:
+    """Measurements of one tool call, filled in while it runs."""
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.payload_bytes: Optional[int] = None
+
+
+_current_call: "contextvars.ContextVar[Optional[CallRecord]]" = (
+    contextvars.ContextVar("excel_polars_mcp_call", default=None)
+)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Add the time spent in the block to ``phase`` of the current call."""
+    record = _current_call.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if record is not None:
+            elapsed = time.perf_counter() - start
+            record.phases[phase] = record.phases.get(phase, 0.0) + elapsed
+
+
+def record_cache_lookup(hit: bool) -> None:
+    """Count a parsed-sheet cache lookup against the current call, if any."""
+    record = _current_call.get()
+    if record is not None:
+        if hit:
+            record.cache_hits += 1
+        else:
+            record.cache_misses += 1
+
+
+def record_payload_bytes(size: int) -> None:
+    """Add the encoded size of a returned frame to the current call, if any."""
+    record = _current_call.get()
+    if record is not None:
+        record.payload_bytes = (record.payload_bytes or 0) + size
+
+
+class ToolStats:
+    """Counters and histograms of one tool."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.histograms = {
+            name: Histogram(bounds) for name, (bounds, _) in HISTOGRAMS.items()
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe per-tool metrics.
+
+    With ``prometheus_file`` set, the registry is written there in the
+    Prometheus text exposition format (for node_exporter's textfile
+    collector) at most once per ``PROMETHEUS_WRITE_INTERVAL`` seconds.
+    With ``cache_metrics`` off, cache counters are left out of both
+    outputs; process worker pools use it, since each worker's sheet cache is
+    invisible to the server process.
+    """
+
+    def __init__(
+        self, prometheus_file: Optional[str] = None, cache_metrics: bool = True
+    ) -> None:
+        self.prometheus_file = prometheus_file
+        self.cache_metrics = cache_metrics
+        self.started = time.time()
+        self._tools: Dict[str, ToolStats] = {}
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+
+    def observe(
+        self,
+        tool: str,
+        record: CallRecord,
+        latency: float,
+        error: bool,
+        rows: Optional[int],
+        payload_bytes: Optional[int],
+    ) -> None:
+        """Fold one finished call into the tool's metrics."""
+        with self._lock:
+            stats = self._tools.setdefault(tool, ToolStats())
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.cache_hits += record.cache_hits
+            stats.cache_misses += record.cache_misses
+            histograms = stats.histograms
+            histograms["latency_seconds"].observe(latency)
+            for phase in ("parse", "serialize"):
+                if phase in record.phases:
+                    histograms[f"{phase}_seconds"].observe(record.phases[phase])
+            if rows is not None:
+                histograms["rows"].observe(rows)
+            if payload_bytes is not None:
+                histograms["payload_bytes"].observe(payload_bytes)
+        self._maybe_write_prometheus()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-tool counters and histogram summaries."""
+        with self._lock:
+            tools = {}
+            for tool, stats in sorted(self._tools.items()):
+                summary: Dict[str, Any] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "error_rate": stats.errors / stats.calls if stats.calls else 0.0,
+                }
+                if self.cache_metrics:
+                    summary["cache_hits"] = stats.cache_hits
+                    summary["cache_misses"] = stats.cache_misses
+                for name, histogram in stats.histograms.items():
+                    summary[name] = histogram.summary()
+                tools[tool] = summary
+        return {"uptime_seconds": time.time() - self.started, "tools": tools}
+
+    def reset(self) -> None:
+        """Forget every measurement."""
+        with self._lock:
+            self._tools.clear()
+            self.started = time.time()
+
+    def prometheus_text(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            tools = sorted(self._tools.items())
+            counters = [
+                ("calls", "Tool calls"),
+                ("errors", "Tool calls that returned an error"),
+            ]
+            if self.cache_metrics:
+                counters += [
+                    ("cache_hits", "Parsed-sheet cache hits"),
+                    ("cache_misses", "Parsed-sheet cache misses"),
+                ]
+            for counter, help_text in counters:
+                name = f"{METRIC_PREFIX}_tool_{counter}_total"
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for tool, stats in tools:
+                    lines.append(f'{name}{{tool="{tool}"}} {getattr(stats, counter)}')
+            for histogram_name, (_, help_text) in HISTOGRAMS.items():
+                name = f"{METRIC_PREFIX}_tool_{histogram_name}"
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for tool, stats in tools:
+                    lines += _histogram_lines(
+                        name, tool, stats.histograms[histogram_name]
+                    )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Atomically write the Prometheus text file."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.prometheus_text())
+        os.replace(tmp_path, target)
+
+    def _maybe_write_prometheus(self) -> None:
+        if not self.prometheus_file:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_write < PROMETHEUS_WRITE_INTERVAL:
+                return
+            self._last_write = now
+        self.write_prometheus(self.prometheus_file)
+
+
+def _histogram_lines(name: str, tool: str, histogram: Histogram) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.bounds + [math.inf], histogram.counts):
+        cumulative += count
+        le = "+Inf" if math.isinf(bound) else f"{bound:g}"
+        lines.append(f'{name}_bucket{{tool="{tool}",le="{le}"}} {cumulative}')
+    lines.append(f'{name}_sum{{tool="{tool}"}} {histogram.sum:g}')
+    lines.append(f'{name}_count{{tool="{tool}"}} {histogram.count}')
+    return lines
+
+
+def _result_rows(result: Dict[str, Any]) -> Optional[int]:
+    """Rows in a tool response: its frame's height, or the sum over sheets/files."""
+    if "shape" in result:
+        return result["shape"][0]
+    frames = result.get("sheets", result.get("files"))
+    if isinstance(frames, dict):
+        return sum(frame["shape"][0] for frame in frames.values() if "shape" in frame)
+    return None
+
+
+registry = MetricsRegistry(
+    config.metrics_prometheus_file() or None,
+    cache_metrics=config.worker_kind() == "thread",
+)
+
+
+def instrument(
+    tool: Callable[..., Awaitable[Dict[str, Any]]],
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Record latency, phase times, rows, payload bytes, cache lookups and errors
+    of every call to an async tool into ``registry``.
+
+    A call counts as an error when it raises or returns an ``error`` key.
+    Payload bytes are the sizes of the frames the call encoded, reported by
+    ``record_payload_bytes`` where they are encoded, so the response is not
+    serialized a second time on the event loop.
+    """
+
+    @functools.wraps(tool)
+    async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        if not config.metrics_enabled():
+            return await tool(*args, **kwargs)
+        record = CallRecord()
+        token = _current_call.set(record)
+        start = time.perf_counter()
+        result: Optional[Dict[str, Any]] = None
+        try:
+            result = await tool(*args, **kwargs)
+            return result
+        finally:
+            _current_call.reset(token)
+            latency = time.perf_counter() - start
+            error = result is None or "error" in result
+            rows = payload_bytes = None
+            if result is not None and not error:
+                rows = _result_rows(result)
+                payload_bytes = record.payload_bytes
+            registry.observe(tool.__name__, record, latency, error, rows, payload_bytes)
+
+    return wrapper
@@ -0,0 +1,59 @@
+"""Opaque continuation cursors for paging through large sheets."""
+
+import base64
+import binascii
+import hashlib
+import json
+from typing import Any, NamedTuple, Optional
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or belongs to a different query."""
+
+
+class Cursor(NamedTuple):
+    """Decoded position of the next page."""
+
+    offset: int
+    limit: Optional[int]
+
+
+def query_digest(*parts: Any) -> str:
+    """
+    Hash the parameters that define a paged query.
+
+    The digest is embedded in every cursor so that a cursor cannot be replayed
+    against a different sheet, different read options or an edited workbook.
+    """
+    encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def encode_cursor(digest: str, offset: int, limit: Optional[int]) -> str:
+    """Encode the position of the next page as an opaque token."""
+    raw = json.dumps({"q": digest, "o": offset, "l": limit}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, digest: str) -> Cursor:
+    """
+    Decode a cursor produced by ``encode_cursor`` for the same query.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or was issued for a
+            different query (including an older version of the workbook).
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        fields = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_digest = fields["q"]
+        offset = int(fields["o"])
+        limit = None if fields["l"] is None else int(fields["l"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorError("Invalid cursor")
+    if cursor_digest != digest:
+        raise InvalidCursorError(
+            "Cursor does not match this query or the file has changed; "
+            "restart from offset 0"
+        )
+    return Cursor(offset=offset, limit=limit)
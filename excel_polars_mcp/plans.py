@@ -0,0 +1,155 @@
+"""Declarative aggregation, sort and join specs compiled to Polars lazy plans."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from excel_polars_mcp.filters import FilterCondition, build_filter_expr
+from excel_polars_mcp.lazy import polars as pl
+
+ArithmeticOp = Literal["add", "sub", "mul", "div"]
+
+AggregationFunc = Literal[
+    "count",
+    "sum",
+    "mean",
+    "median",
+    "min",
+    "max",
+    "std",
+    "n_unique",
+    "first",
+    "last",
+]
+
+JoinHow = Literal["inner", "left", "right", "full", "semi", "anti"]
+
+
+class ComputedColumn(BaseModel):
+    """``name = (left <op> right) * scale``, optionally rounded."""
+    name: str
+    left: str = Field(description="Column name")
+    op: ArithmeticOp
+    right: Union[float, str] = Field(description="Column name or number")
+    scale: float = 1.0
+    round: Optional[int] = None
+
+
+class Aggregation(BaseModel):
+    """One aggregate over a column; ``count`` without a column counts rows."""
+    func: AggregationFunc
+    column: Optional[str] = None
+    alias: Optional[str] = None
+    round: Optional[int] = None
+
+
+class SortKey(BaseModel):
+    """A column to sort the result by."""
+    column: str
+    descending: bool = False
+
+
+_ARITHMETIC: Dict[str, Callable[[pl.Expr, pl.Expr], pl.Expr]] = {
+    "add": lambda left, right: left + right,
+    "sub": lambda left, right: left - right,
+    "mul": lambda left, right: left * right,
+    "div": lambda left, right: left / right,
+}
+
+
+def computed_expr(column: ComputedColumn) -> pl.Expr:
+    """Compile a computed column to an aliased expression."""
+    if isinstance(column.right, str):
+        right = pl.col(column.right)
+    else:
+        right = pl.lit(column.right)
+    expr = _ARITHMETIC[column.op](pl.col(column.left), right)
+    if column.scale != 1.0:
+        expr = expr * column.scale
+    if column.round is not None:
+        expr = expr.round(column.round)
+    return expr.alias(column.name)
+
+
+def aggregation_expr(aggregation: Aggregation) -> pl.Expr:
+    """Compile an aggregation to an aliased expression."""
+    if aggregation.column is None:
+        if aggregation.func != "count":
+            raise ValueError(f"Aggregation '{aggregation.func}' requires a column")
+        expr = pl.len()
+        name = "count"
+    else:
+        expr = getattr(pl.col(aggregation.column), aggregation.func)()
+        name = f"{aggregation.column}_{aggregation.func}"
+    if aggregation.round is not None:
+        expr = expr.round(aggregation.round)
+    return expr.alias(aggregation.alias or name)
+
+
+def apply_rows(
+    lazy: pl.LazyFrame,
+    conditions: Optional[List[FilterCondition]] = None,
+    compute: Optional[List[ComputedColumn]] = None,
+) -> pl.LazyFrame:
+    """Filter rows, then add row-level computed columns."""
+    schema = lazy.collect_schema() if conditions else None
+    predicate = build_filter_expr(conditions, schema)
+    if predicate is not None:
+        lazy = lazy.filter(predicate)
+    if compute:
+        lazy = lazy.with_columns([computed_expr(column) for column in compute])
+    return lazy
+
+
+def apply_aggregation(
+    lazy: pl.LazyFrame,
+    group_by: Optional[List[str]],
+    aggregations: List[Aggregation],
+    derive: Optional[List[ComputedColumn]] = None,
+) -> pl.LazyFrame:
+    """Aggregate (per group, or over all rows), then derive result columns."""
+    exprs = [aggregation_expr(aggregation) for aggregation in aggregations]
+    if group_by:
+        lazy = lazy.group_by(group_by).agg(exprs)
+    else:
+        lazy = lazy.select(exprs)
+    if derive:
+        lazy = lazy.with_columns([computed_expr(column) for column in derive])
+    return lazy
+
+
+def apply_sort(lazy: pl.LazyFrame, sort: Optional[List[SortKey]]) -> pl.LazyFrame:
+    """Sort by the given keys in order."""
+    if not sort:
+        return lazy
+    return lazy.sort(
+        [key.column for key in sort],
+        descending=[key.descending for key in sort],
+    )
+
+
+def apply_join(
+    left: pl.LazyFrame,
+    right: pl.LazyFrame,
+    how: JoinHow,
+    on: Optional[List[str]] = None,
+    left_on: Optional[List[str]] = None,
+    right_on: Optional[List[str]] = None,
+    suffix: str = "_right",
+) -> pl.LazyFrame:
+    """
+    Join two lazy frames on shared or paired key columns.
+
+    Raises:
+        ValueError: If neither ``on`` nor matching ``left_on``/``right_on``
+            are given
+    """
+    if on:
+        return left.join(right, on=on, how=how, suffix=suffix)
+    if not left_on or not right_on or len(left_on) != len(right_on):
+        raise ValueError("Join needs 'on', or 'left_on' and 'right_on' of equal length")
+    return left.join(
+        right, left_on=left_on, right_on=right_on, how=how, suffix=suffix
+    )
@@ -0,0 +1,274 @@
+"""Fast sheet listing and dimension probing without parsing cell data."""
+
+import posixpath
+import re
+import struct
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_STRICT_NS = "http://purl.oclc.org/ooxml/spreadsheetml/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_STRICT_REL_NS = "http://purl.oclc.org/ooxml/officeDocument/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_DIMENSION_RE = re.compile(rb'<(?:\w+:)?dimension\s+ref="([^"]+)"')
+_CELL_RE = re.compile(r"^\$?([A-Z]+)\$?(\d+)$")
+
+# Bytes read from the start of each sheet part when looking for <dimension>
+_DIMENSION_PROBE_BYTES = 64 * 1024
+
+
+# Sheet name, index, visibility and approximate used-range size
+SheetInfo = Dict[str, Any]
+
+
+def _cell_position(ref: str) -> Tuple[int, int]:
+    match = _CELL_RE.match(ref.upper())
+    if match is None:
+        raise ValueError(f"Invalid cell reference: {ref}")
+    letters, row = match.groups()
+    column = 0
+    for letter in letters:
+        column = column * 26 + (ord(letter) - ord("A") + 1)
+    return int(row), column
+
+
+def _range_size(ref: str) -> Tuple[Optional[int], Optional[int]]:
+    """Return (rows, columns) spanned by an A1-style range such as ``A1:L1001``."""
+    try:
+        first, _, last = ref.partition(":")
+        first_row, first_col = _cell_position(first)
+        last_row, last_col = _cell_position(last or first)
+    except ValueError:
+        return None, None
+    return last_row - first_row + 1, last_col - first_col + 1
+
+
+def _xlsx_sheets(file_path: Union[str, Path]) -> List[SheetInfo]:
+    with zipfile.ZipFile(file_path) as archive:
+        workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+        rels = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+        targets = {
+            rel.get("Id"): rel.get("Target", "")
+            for rel in rels.iter(f"{{{_PKG_REL_NS}}}Relationship")
+        }
+
+        sheets: List[SheetInfo] = []
+        for ns, rel_ns in ((_MAIN_NS, _REL_NS), (_STRICT_NS, _STRICT_REL_NS)):
+            for index, sheet in enumerate(workbook.iter(f"{{{ns}}}sheet")):
+                target = targets.get(sheet.get(f"{{{rel_ns}}}id"), "")
+                if target.startswith("/"):
+                    part = target.lstrip("/")
+                else:
+                    part = posixpath.normpath(posixpath.join("xl", target))
+                dimension = _xlsx_dimension(archive, part)
+                rows, columns = _range_size(dimension) if dimension else (None, None)
+                sheets.append(dict(
+                    name=sheet.get("name"),
+                    index=index,
+                    state=sheet.get("state", "visible"),
+                    type="chart" if "chartsheets/" in part else "worksheet",
+                    dimension=dimension,
+                    rows=rows,
+                    columns=columns,
+                ))
+            if sheets:
+                break
+        return sheets
+
+
+def _xlsx_dimension(archive: zipfile.ZipFile, part: str) -> Optional[str]:
+    """Read the <dimension ref> near the start of a sheet part, if present."""
+    try:
+        with archive.open(part) as stream:
+            head = stream.read(_DIMENSION_PROBE_BYTES)
+    except KeyError:
+        return None
+    match = _DIMENSION_RE.search(head)
+    return match.group(1).decode() if match else None
+
+
+# --- Legacy .xls: OLE2 compound file + BIFF records -------------------------
+
+_CFB_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_END_OF_CHAIN = 0xFFFFFFFE
+_FREE_SECTOR = 0xFFFFFFFF
+
+_BIFF_BOF = 0x0809
+_BIFF_EOF = 0x000A
+_BIFF_BOUNDSHEET = 0x0085
+_BIFF_DIMENSIONS = 0x0200
+
+_SHEET_STATES = {0: "visible", 1: "hidden", 2: "veryHidden"}
+_SHEET_TYPES = {0: "worksheet", 1: "macro", 2: "chart", 6: "vba"}
+
+
+class _CompoundFile:
+    """Minimal reader for the OLE2 compound file container used by .xls."""
+
+    def __init__(self, data: bytes) -> None:
+        if data[:8] != _CFB_SIGNATURE:
+            raise ValueError("Not an OLE2 compound file")
+        self.data = data
+        self.sector_size = 1 << struct.unpack_from("<H", data, 0x1E)[0]
+        self.mini_sector_size = 1 << struct.unpack_from("<H", data, 0x20)[0]
+        (
+            num_fat_sectors,
+            self.first_dir_sector,
+            _transaction,
+            self.mini_cutoff,
+            self.first_minifat_sector,
+            _num_minifat,
+            first_difat_sector,
+            num_difat_sectors,
+        ) = struct.unpack_from("<8I", data, 0x2C)
+
+        fat_sectors = [
+            s for s in struct.unpack_from("<109I", data, 0x4C) if s != _FREE_SECTOR
+        ]
+        difat_sector = first_difat_sector
+        per_sector = self.sector_size // 4
+        for _ in range(num_difat_sectors):
+            if difat_sector in (_END_OF_CHAIN, _FREE_SECTOR):
+                break
+            entries = struct.unpack_from(
+                f"<{per_sector}I", data, self._offset(difat_sector)
+            )
+            fat_sectors.extend(s for s in entries[:-1] if s != _FREE_SECTOR)
+            difat_sector = entries[-1]
+
+        self.fat: List[int] = []
+        for sector in fat_sectors[:num_fat_sectors]:
+            self.fat.extend(
+                struct.unpack_from(f"<{per_sector}I", data, self._offset(sector))
+            )
+
+    def _offset(self, sector: int) -> int:
+        return (sector + 1) * self.sector_size
+
+    def _chain(self, start: int, table: List[int]) -> List[int]:
+        chain = []
+        sector = start
+        # The length guard stops cycles in corrupt files
+        while sector not in (_END_OF_CHAIN, _FREE_SECTOR) and len(chain) < len(table):
+            chain.append(sector)
+            sector = table[sector]
+        return chain
+
+    def _read_chain(self, start: int) -> bytes:
+        return b"".join(
+            self.data[self._offset(s):self._offset(s) + self.sector_size]
+            for s in self._chain(start, self.fat)
+        )
+
+    def read_stream(self, names: Tuple[str, ...]) -> bytes:
+        """Return the contents of the first directory entry matching ``names``."""
+        directory = self._read_chain(self.first_dir_sector)
+        entries = [directory[i:i + 128] for i in range(0, len(directory), 128)]
+        root_start = struct.unpack_from("<I", entries[0], 0x74)[0]
+        for entry in entries:
+            name_length = struct.unpack_from("<H", entry, 0x40)[0]
+            name = entry[:max(name_length - 2, 0)].decode("utf-16-le", "replace")
+            if entry[0x42] != 2 or name not in names:
+                continue
+            start, size = struct.unpack_from("<II", entry, 0x74)
+            if size >= self.mini_cutoff:
+                return self._read_chain(start)[:size]
+            # Small streams live in the mini stream, addressed by the mini FAT
+            mini_stream = self._read_chain(root_start)
+            mini_fat_bytes = self._read_chain(self.first_minifat_sector)
+            mini_fat = list(
+                struct.unpack(f"<{len(mini_fat_bytes) // 4}I", mini_fat_bytes)
+            )
+            size_per = self.mini_sector_size
+            return b"".join(
+                mini_stream[s * size_per:(s + 1) * size_per]
+                for s in self._chain(start, mini_fat)
+            )[:size]
+        raise ValueError(f"No {' or '.join(names)} stream in compound file")
+
+
+def _biff_records(
+    stream: bytes, offset: int = 0
+) -> Iterator[Tuple[int, bytes]]:
+    while offset + 4 <= len(stream):
+        record_type, length = struct.unpack_from("<HH", stream, offset)
+        yield record_type, stream[offset + 4:offset + 4 + length]
+        offset += 4 + length
+        if record_type == _BIFF_EOF:
+            return
+
+
+def _xls_sheets(file_path: Union[str, Path]) -> List[SheetInfo]:
+    stream = _CompoundFile(Path(file_path).read_bytes()).read_stream(
+        ("Workbook", "Book")
+    )
+    biff8 = True
+    sheets: List[SheetInfo] = []
+    positions: List[int] = []
+    for record_type, body in _biff_records(stream):
+        if record_type == _BIFF_BOF and len(body) >= 2:
+            biff8 = struct.unpack_from("<H", body)[0] == 0x0600
+        elif record_type == _BIFF_BOUNDSHEET:
+            position, state, sheet_type, length = struct.unpack_from("<IBBB", body)
+            if biff8:
+                wide = body[7] & 0x01
+                raw = body[8:8 + length * (2 if wide else 1)]
+                name = raw.decode("utf-16-le" if wide else "latin-1")
+            else:
+                name = body[7:7 + length].decode("cp1252", "replace")
+            positions.append(position)
+            sheets.append(dict(
+                name=name,
+                index=len(sheets),
+                state=_SHEET_STATES.get(state & 0x03, "visible"),
+                type=_SHEET_TYPES.get(sheet_type, "worksheet"),
+                dimension=None,
+                rows=None,
+                columns=None,
+            ))
+
+    for sheet, position in zip(sheets, positions):
+        for record_type, body in _biff_records(stream, position):
+            if record_type != _BIFF_DIMENSIONS:
+                continue
+            if biff8:
+                first_row, last_row, first_col, last_col = struct.unpack_from(
+                    "<IIHH", body
+                )
+            else:
+                first_row, last_row, first_col, last_col = struct.unpack_from(
+                    "<HHHH", body
+                )
+            # rwMac/colMac are one past the last used row/column
+            sheet["rows"] = max(last_row - first_row, 0)
+            sheet["columns"] = max(last_col - first_col, 0)
+            break
+    return sheets
+
+
+def probe_sheets(file_path: Union[str, Path]) -> List[SheetInfo]:
+    """
+    List a workbook's sheets with approximate used-range sizes.
+
+    For .xlsx only ``xl/workbook.xml``, its relationships and the first bytes
+    of each sheet part (for the ``<dimension>`` element) are read. For .xls
+    the BIFF BOUNDSHEET and DIMENSIONS records are read from the compound
+    file's Workbook stream. No cell values are decoded in either case.
+
+    Counts come from metadata the writer recorded, include any header row,
+    and are None when the writer omitted them.
+
+    Args:
+        file_path: Path to the .xlsx or .xls file
+
+    Returns:
+        One dict per sheet with name, index, state, type, dimension, rows
+        and columns
+    """
+    if Path(file_path).suffix.lower() == ".xls":
+        return _xls_sheets(file_path)
+    return _xlsx_sheets(file_path)
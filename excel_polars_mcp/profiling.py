@@ -0,0 +1,206 @@
+"""Opt-in cProfile and tracemalloc captures of slow or flagged tool calls."""
+
+import contextvars
+import cProfile
+import functools
+import io
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from excel_polars_mcp import config
+
+T = TypeVar("T")
+
+# Functions and allocation sites listed in the text report
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+# Frames kept per allocation traceback
+TRACEMALLOC_FRAMES = 10
+
+# Held by the pool call being profiled: from Python 3.12 only one cProfile
+# profiler can be active in the process at a time
+_profiler_lock = threading.Lock()
+
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+# Whether tracing was started by a session (rather than PYTHONTRACEMALLOC)
+_tracemalloc_owned = False
+
+_recent: Deque[Dict[str, Any]] = deque(maxlen=20)
+
+
+class ProfileSession:
+    """
+    Profiles of the worker-pool calls made during one tool call.
+
+    cProfile only sees the thread it is enabled in, and the tool's parsing
+    and serialization run in pool threads, so each pool call gets its own
+    profiler and the results are merged when the session is saved. Only one
+    profiler may run at a time, so a pool call that overlaps another
+    profiled one runs unprofiled and the capture is marked ``partial``.
+    tracemalloc is process-wide: allocation sites of concurrent calls are
+    included too.
+    """
+
+    def __init__(self) -> None:
+        self.profiles: List[cProfile.Profile] = []
+        self.partial = False
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.traced_peak_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Begin tracing allocations (shared with other active sessions)."""
+        global _tracemalloc_users, _tracemalloc_owned
+        with _tracemalloc_lock:
+            if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                _tracemalloc_owned = True
+            _tracemalloc_users += 1
+
+    def stop(self) -> None:
+        """Take the allocation snapshot and release tracemalloc."""
+        global _tracemalloc_users, _tracemalloc_owned
+        with _tracemalloc_lock:
+            if tracemalloc.is_tracing():
+                self.snapshot = tracemalloc.take_snapshot()
+                self.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+            _tracemalloc_users -= 1
+            if _tracemalloc_users == 0 and _tracemalloc_owned:
+                tracemalloc.stop()
+                _tracemalloc_owned = False
+
+    def run(self, fn: Callable[[], T]) -> T:
+        """Call ``fn`` under a profiler of its own, if none is active."""
+        if not _profiler_lock.acquire(blocking=False):
+            self.partial = True
+            return fn()
+        try:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiling tool (e.g. a debugger) is active
+                self.partial = True
+                return fn()
+            try:
+                return fn()
+            finally:
+                profile.disable()
+                with self._lock:
+                    self.profiles.append(profile)
+        finally:
+            _profiler_lock.release()
+
+    def save(self, directory: Path, tool: str, seconds: float) -> Dict[str, Any]:
+        """
+        Write ``<stamp>-<tool>-<ms>ms.prof`` (pstats) and a ``.txt`` report.
+
+        The report lists the top functions by cumulative time and the top
+        allocation sites by size.
+
+        Returns:
+            The capture's tool, seconds and file paths
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        stem = f"{stamp}-{tool}-{seconds * 1000:.0f}ms"
+        stem = re.sub(r"[^\w.-]", "_", stem)
+        report = io.StringIO()
+        report.write(f"{tool}: {seconds:.3f}s\n\n")
+
+        capture: Dict[str, Any] = {
+            "tool": tool,
+            "seconds": seconds,
+            "partial": self.partial,
+        }
+        if self.partial:
+            report.write("Partial: some calls overlapped another profile\n\n")
+        if self.profiles:
+            stats = pstats.Stats(self.profiles[0], stream=report)
+            for profile in self.profiles[1:]:
+                stats.add(profile)
+            prof_path = directory / f"{stem}.prof"
+            stats.dump_stats(prof_path)
+            capture["profile_path"] = str(prof_path)
+            stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+
+        if self.snapshot is not None:
+            capture["traced_peak_bytes"] = self.traced_peak_bytes
+            report.write(f"Peak traced memory: {self.traced_peak_bytes:,} bytes\n")
+            report.write(f"Top {TOP_ALLOCATIONS} allocation sites (live at end)\n")
+            for stat in self.snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+                report.write(f"{stat}\n")
+
+        report_path = directory / f"{stem}.txt"
+        report_path.write_text(report.getvalue())
+        capture["report_path"] = str(report_path)
+        _recent.append(capture)
+        return capture
+
+
+_current_session: "contextvars.ContextVar[Optional[ProfileSession]]" = (
+    contextvars.ContextVar("excel_polars_mcp_profile", default=None)
+)
+
+
+def wrap_worker_call(call: Callable[[], T]) -> Callable[[], T]:
+    """Profile a thread-pool call if the calling tool is being profiled."""
+    session = _current_session.get()
+    if session is None:
+        return call
+    return functools.partial(session.run, call)
+
+
+def recent_captures() -> List[Dict[str, Any]]:
+    """The most recent profile captures, oldest first."""
+    return list(_recent)
+
+
+def profile_calls(
+    tool: Callable[..., Awaitable[Dict[str, Any]]],
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Capture a profile of an async tool call when asked to, or when slow.
+
+    A call is profiled when ``EXCEL_POLARS_MCP_PROFILE`` is on or its args
+    set ``profile``; the capture is always saved. With
+    ``EXCEL_POLARS_MCP_PROFILE_THRESHOLD_MS`` set, every call is profiled
+    and saved only if it took at least that long. The tool's result is
+    returned unchanged.
+    """
+
+    @functools.wraps(tool)
+    async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        requested = config.profile_all() or any(
+            getattr(arg, "profile", False) for arg in (*args, *kwargs.values())
+        )
+        threshold_ms = config.profile_threshold_ms()
+        if not requested and threshold_ms <= 0:
+            return await tool(*args, **kwargs)
+
+        session = ProfileSession()
+        session.start()
+        token = _current_session.set(session)
+        start = time.perf_counter()
+        try:
+            return await tool(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            _current_session.reset(token)
+            session.stop()
+            if requested or seconds * 1000 >= threshold_ms:
+                try:
+                    session.save(config.profile_dir(), tool.__name__, seconds)
+                except OSError:
+                    # A capture must never change the tool's result
+                    pass
+
+    return wrapper
@@ -0,0 +1,334 @@
+"""Loading Excel sheets into Polars DataFrames."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+from excel_polars_mcp import schemas, sidecar
+from excel_polars_mcp.cache import SheetKey, file_fingerprint, sheet_cache
+from excel_polars_mcp.engines import resolve_engine
+from excel_polars_mcp.lazy import polars as pl
+from excel_polars_mcp.probe import probe_sheets
+from excel_polars_mcp.schemas import normalize_overrides, resolve_schema
+
+
+def list_sheet_names(file_path: Union[str, Path]) -> List[str]:
+    """Return the sheet names of an Excel file without parsing any cells."""
+    return [sheet["name"] for sheet in probe_sheets(file_path)]
+
+
+def _sheet_key(
+    file_path: Union[str, Path],
+    sheet_name: Optional[str],
+    has_header: bool,
+    infer_schema_length: int,
+    engine: str,
+    schema_overrides: Optional[Mapping[str, str]] = None,
+    schema_inference: str = "head",
+) -> SheetKey:
+    if sheet_name is None:
+        # Key the first sheet by name, so a default read shares cache entries,
+        # sidecars and stored schemas with reads (and prewarming) that name it
+        worksheets = [
+            sheet["name"]
+            for sheet in probe_sheets(file_path)
+            if sheet["type"] == "worksheet"
+        ]
+        sheet_name = worksheets[0] if worksheets else None
+    return SheetKey(
+        fingerprint=file_fingerprint(file_path),
+        sheet_name=sheet_name,
+        has_header=has_header,
+        infer_schema_length=infer_schema_length,
+        engine=resolve_engine(engine, file_path),
+        schema_overrides=normalize_overrides(schema_overrides),
+        schema_inference=schema_inference,
+    )
+
+
+def _read_excel(
+    file_path: Union[str, Path],
+    key: SheetKey,
+    columns: Optional[Sequence[str]],
+) -> pl.DataFrame:
+    return pl.read_excel(
+        source=file_path,
+        sheet_name=key.sheet_name,
+        has_header=key.has_header,
+        infer_schema_length=key.infer_schema_length,
+        engine=key.engine,  # type: ignore[arg-type]
+        columns=list(columns) if columns is not None else None,
+        schema_overrides=resolve_schema(file_path, key),
+    )
+
+
+def _read_full_sheet(file_path: Union[str, Path], key: SheetKey) -> pl.DataFrame:
+    """Read a whole sheet from its Parquet sidecar, or parse it and write one."""
+    store = sidecar.sidecar_store
+    if store is not None:
+        sidecar_path = store.lookup(key)
+        if sidecar_path is not None:
+            return pl.scan_parquet(sidecar_path).collect()
+    df = _read_excel(file_path, key, None)
+    if store is not None:
+        store.write(key, df)
+    return df
+
+
+def load_sheet(
+    file_path: Union[str, Path],
+    sheet_name: Optional[str] = None,
+    has_header: bool = True,
+    infer_schema_length: int = 100,
+    columns: Optional[Sequence[str]] = None,
+    engine: str = "auto",
+    schema_overrides: Optional[Mapping[str, str]] = None,
+    schema_inference: str = "head",
+) -> pl.DataFrame:
+    """
+    Read one sheet of an Excel file, reusing a cached parse when possible.
+
+    The cache key includes the file's modification time and size, so an
+    edited workbook is always re-parsed. When ``columns`` is given, a cached
+    full parse of the sheet is projected; otherwise only those columns are
+    read from the file and cached separately. With a sidecar store
+    configured, whole sheets are read from (or written to) Parquet instead.
+
+    Args:
+        file_path: Path to the .xlsx or .xls file
+        sheet_name: Sheet to read; None reads the first sheet
+        has_header: Whether the first row holds column names
+        infer_schema_length: Number of rows used for dtype inference
+        columns: Optional subset of columns to return, in the given order
+        engine: Excel engine name, or "auto" for the fastest calibrated one
+        schema_overrides: Dtype names for columns, e.g. {"Amount": "Float64"}
+        schema_inference: "head" infers dtypes from the first
+            ``infer_schema_length`` rows; "sampled" from every row of the
+            sheet, cached per workbook version
+
+    Returns:
+        The parsed sheet as a DataFrame
+    """
+    key = _sheet_key(
+        file_path,
+        sheet_name,
+        has_header,
+        infer_schema_length,
+        engine,
+        schema_overrides,
+        schema_inference,
+    )
+    if columns is not None:
+        if key in sheet_cache:
+            full = sheet_cache.get(key)
+            if full is not None:
+                return full.select(columns)
+        if sidecar.sidecar_store is None:
+            # Nothing to persist, so only parse the requested columns
+            key = key._replace(columns=tuple(columns))
+            df = sheet_cache.get(key)
+            if df is None:
+                df = _read_excel(file_path, key, columns)
+                sheet_cache.put(key, df)
+            return df
+
+    df = sheet_cache.get(key)
+    if df is None:
+        df = _read_full_sheet(file_path, key)
+        sheet_cache.put(key, df)
+    return df if columns is None else df.select(columns)
+
+
+def sheet_schema_overrides(
+    file_path: Union[str, Path],
+    sheet_name: Optional[str] = None,
+    has_header: bool = True,
+    infer_schema_length: int = 100,
+    engine: str = "auto",
+    schema_overrides: Optional[Mapping[str, str]] = None,
+    schema_inference: str = "head",
+) -> Optional[Dict[str, pl.DataType]]:
+    """
+    Dtypes that ``load_sheet`` with the same options would impose on columns.
+
+    Lets readers that do not go through Polars' Excel parsing, such as
+    streaming reads, type their columns like an eager read.
+
+    Returns:
+        Mapping of column name to dtype, or None when nothing is imposed
+    """
+    key = _sheet_key(
+        file_path,
+        sheet_name,
+        has_header,
+        infer_schema_length,
+        engine,
+        schema_overrides,
+        schema_inference,
+    )
+    return resolve_schema(file_path, key)
+
+
+def prewarm_workbook(
+    file_path: Union[str, Path],
+    has_header: bool = True,
+    infer_schema_length: int = 100,
+    engine: str = "auto",
+) -> List[str]:
+    """
+    Fill the persistent caches for every sheet of a workbook ahead of use.
+
+    Each sheet's Parquet sidecar is written, or, without a sidecar store, the
+    parsed sheet is put in the in-process cache. With a schema store, the
+    sheet's "sampled" schema is inferred and stored too. Entries that are
+    still valid are left alone, so prewarming an unchanged workbook is cheap.
+
+    Returns:
+        The names of the sheets prewarmed
+    """
+    names = list_sheet_names(file_path)
+    store = sidecar.sidecar_store
+    for name in names:
+        key = _sheet_key(file_path, name, has_header, infer_schema_length, engine)
+        if store is None:
+            load_sheet(file_path, name, has_header, infer_schema_length, None, engine)
+        elif store.lookup(key) is None:
+            store.write(key, _read_excel(file_path, key, None))
+        if schemas.schema_store is not None:
+            resolve_schema(file_path, key._replace(schema_inference="sampled"))
+    return names
+
+
+def collect_streaming(lazy: pl.LazyFrame) -> pl.DataFrame:
+    """Collect on the streaming engine, falling back for older Polars."""
+    try:
+        return lazy.collect(engine="streaming")
+    except TypeError:
+        return lazy.collect(streaming=True)
+
+
+def scan_sheet(
+    file_path: Union[str, Path],
+    sheet_name: Optional[str] = None,
+    has_header: bool = True,
+    infer_schema_length: int = 100,
+    columns: Optional[Sequence[str]] = None,
+    engine: str = "auto",
+    schema_overrides: Optional[Mapping[str, str]] = None,
+    schema_inference: str = "head",
+) -> pl.LazyFrame:
+    """
+    Return a sheet as a LazyFrame so filters and projections can be pushed down.
+
+    A valid Parquet sidecar is scanned directly with ``pl.scan_parquet``;
+    otherwise the sheet is loaded via ``load_sheet``. ``columns`` only limits
+    what must be parsed from Excel; the caller still selects the columns it
+    wants from the returned frame.
+    """
+    key = _sheet_key(
+        file_path,
+        sheet_name,
+        has_header,
+        infer_schema_length,
+        engine,
+        schema_overrides,
+        schema_inference,
+    )
+    store = sidecar.sidecar_store
+    if store is not None and key not in sheet_cache:
+        sidecar_path = store.lookup(key)
+        if sidecar_path is not None:
+            return pl.scan_parquet(sidecar_path)
+    return load_sheet(
+        file_path,
+        sheet_name,
+        has_header,
+        infer_schema_length,
+        columns,
+        engine,
+        schema_overrides,
+        schema_inference,
+    ).lazy()
+
+
+def read_workbook(
+    file_path: Union[str, Path],
+    sheet_names: Optional[Sequence[str]] = None,
+    has_header: bool = True,
+    infer_schema_length: int = 100,
+    engine: str = "auto",
+    schema_overrides: Optional[Mapping[str, str]] = None,
+    schema_inference: str = "head",
+) -> Dict[str, pl.DataFrame]:
+    """
+    Read several sheets of a workbook, opening the file at most once.
+
+    Sheets already in the cache (or with a valid sidecar) are reused; all
+    remaining sheets are parsed together in a single ``pl.read_excel`` call,
+    so the archive and its shared strings are only read once. Sheets that
+    need dtype overrides (given, or from sampled inference) are parsed one by
+    one instead, since their overrides differ per sheet.
+
+    Args:
+        file_path: Path to the .xlsx or .xls file
+        sheet_names: Sheets to read, in order; None reads every sheet
+        has_header: Whether the first row holds column names
+        infer_schema_length: Number of rows used for dtype inference
+        engine: Excel engine name, or "auto" for the fastest calibrated one
+        schema_overrides: Dtype names for columns, e.g. {"Amount": "Float64"}
+        schema_inference: "head" or "sampled", as in ``load_sheet``
+
+    Returns:
+        Mapping of sheet name to DataFrame, in the requested order
+    """
+    if sheet_names is None:
+        sheet_names = list_sheet_names(file_path)
+    names = list(sheet_names)
+    store = sidecar.sidecar_store
+    engine = resolve_engine(engine, file_path)
+    keys = {
+        name: _sheet_key(
+            file_path,
+            name,
+            has_header,
+            infer_schema_length,
+            engine,
+            schema_overrides,
+            schema_inference,
+        )
+        for name in names
+    }
+
+    frames: Dict[str, pl.DataFrame] = {}
+    missing: List[str] = []
+    for name, key in keys.items():
+        df = sheet_cache.get(key)
+        if df is None and store is not None:
+            sidecar_path = store.lookup(key)
+            if sidecar_path is not None:
+                df = pl.scan_parquet(sidecar_path).collect()
+                sheet_cache.put(key, df)
+        if df is None:
+            missing.append(name)
+        else:
+            frames[name] = df
+
+    parsed: Dict[str, pl.DataFrame] = {}
+    if missing and (schema_overrides or schema_inference != "head"):
+        parsed = {name: _read_excel(file_path, keys[name], None) for name in missing}
+    elif missing:
+        parsed = pl.read_excel(
+            source=file_path,
+            sheet_name=missing,
+            has_header=has_header,
+            infer_schema_length=infer_schema_length,
+            engine=engine,  # type: ignore[arg-type]
+        )
+    for name, df in parsed.items():
+        sheet_cache.put(keys[name], df)
+        if store is not None:
+            store.write(keys[name], df)
+        frames[name] = df
+
+    return {name: frames[name] for name in names}
@@ -0,0 +1,219 @@
+"""Sheet schemas: dtype overrides, whole-sheet inference and a persistent cache."""
+
+from __future__ import annotations
+
+import ast
+import datetime
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple, Union
+
+from excel_polars_mcp import config
+from excel_polars_mcp.cache import SheetKey
+from excel_polars_mcp.lazy import polars as pl
+
+SchemaInference = Literal["head", "sampled"]
+
+# How calamine renders a date or datetime cell when read as a string
+_CELL_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_BOOLEANS = {"true", "false"}
+
+
+def parse_dtype(name: str) -> pl.DataType:
+    """
+    Parse a dtype written as in ``str(dtype)``, e.g. ``Int64``, ``String``,
+    ``Datetime(time_unit='ms')`` or ``Decimal(precision=12, scale=2)``.
+
+    Raises:
+        ValueError: If ``name`` is not a Polars dtype expression
+    """
+    try:
+        node = ast.parse(name.strip(), mode="eval").body
+        dtype = _build_dtype(node)
+    except (SyntaxError, TypeError, ValueError):
+        raise ValueError(f"Unknown dtype: {name!r}")
+    return dtype() if isinstance(dtype, type) else dtype
+
+
+def _build_dtype(node: ast.AST) -> Union[pl.DataType, type]:
+    """Evaluate a dtype expression, allowing only Polars dtype classes."""
+    if isinstance(node, ast.Name):
+        dtype = getattr(pl, node.id, None)
+        if not (isinstance(dtype, type) and issubclass(dtype, pl.DataType)):
+            raise ValueError(node.id)
+        return dtype
+    if isinstance(node, ast.Call):
+        dtype = _build_dtype(node.func)
+        args = [_dtype_argument(arg) for arg in node.args]
+        kwargs = {kw.arg: _dtype_argument(kw.value) for kw in node.keywords}
+        return dtype(*args, **kwargs)  # type: ignore[operator]
+    raise ValueError(ast.dump(node))
+
+
+def _dtype_argument(node: ast.AST) -> Any:
+    if isinstance(node, (ast.Name, ast.Call)):
+        return _build_dtype(node)
+    return ast.literal_eval(node)
+
+
+def normalize_overrides(
+    overrides: Optional[Mapping[str, str]],
+) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """
+    Validate dtype overrides and return them as a hashable, ordered tuple.
+
+    Raises:
+        ValueError: If a dtype cannot be parsed
+    """
+    if not overrides:
+        return None
+    return tuple(
+        sorted((column, str(parse_dtype(dtype))) for column, dtype in overrides.items())
+    )
+
+
+def _infer_column(values: pl.Series) -> pl.DataType:
+    """Narrowest dtype every non-empty string in ``values`` converts to."""
+    values = values.drop_nulls().str.strip_chars()
+    values = values.filter(values != "")
+    if values.is_empty():
+        return pl.String()
+    if values.str.to_lowercase().is_in(list(_BOOLEANS)).all():
+        return pl.Boolean()
+    for dtype in (pl.Int64(), pl.Float64()):
+        if values.cast(dtype, strict=False).null_count() == 0:
+            return dtype
+    # Only cells Excel stores as dates; text that merely looks like one stays text
+    parsed = values.str.to_datetime(_CELL_DATETIME_FORMAT, strict=False)
+    if parsed.null_count() == 0:
+        if (parsed.dt.time() == datetime.time(0)).all():
+            return pl.Date()
+        return pl.Datetime("us")
+    return pl.String()
+
+
+def infer_sampled_schema(file_path: Union[str, Path], key: SheetKey) -> Dict[str, str]:
+    """
+    Infer a sheet's dtypes from every row of the sheet.
+
+    The sheet is read once with every cell as a string and each column is
+    checked in full with vectorized casts, so a column holding text ("N/A")
+    or decimals in a single late row is typed as String or Float64 instead
+    of the Int64 the first rows suggest (which silently nulls those cells).
+
+    Returns:
+        Mapping of column name to dtype name
+    """
+    raw = pl.read_excel(
+        source=file_path,
+        sheet_name=key.sheet_name,
+        has_header=key.has_header,
+        infer_schema_length=0,
+        engine=key.engine,  # type: ignore[arg-type]
+    )
+    return {name: str(_infer_column(raw[name])) for name in raw.columns}
+
+
+def sheet_columns(file_path: Union[str, Path], key: SheetKey) -> List[str]:
+    """Return a sheet's column names without reading any data rows."""
+    return pl.read_excel(
+        source=file_path,
+        sheet_name=key.sheet_name,
+        has_header=key.has_header,
+        engine="calamine",
+        read_options={"n_rows": 0},
+    ).columns
+
+
+class SchemaStore:
+    """
+    Inferred sheet schemas as JSON files, one per (workbook, sheet, options).
+
+    An entry records the workbook's mtime and size and is only used while
+    both still match, so an edited workbook is re-inferred.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def lookup(self, key: SheetKey) -> Optional[Dict[str, str]]:
+        """Return the stored schema for ``key`` if the workbook is unchanged."""
+        try:
+            entry = json.loads(self._path(key).read_text())
+        except (OSError, ValueError):
+            return None
+        fingerprint = key.fingerprint
+        if entry.get("mtime_ns") != fingerprint.mtime_ns:
+            return None
+        if entry.get("size") != fingerprint.size:
+            return None
+        return entry["schema"]
+
+    def write(self, key: SheetKey, schema: Dict[str, str]) -> None:
+        """Persist ``schema`` for ``key``, replacing any older entry."""
+        path = self._path(key)
+        entry = {
+            "source": key.fingerprint.path,
+            "sheet_name": key.sheet_name,
+            "mtime_ns": key.fingerprint.mtime_ns,
+            "size": key.fingerprint.size,
+            "schema": schema,
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, path)
+
+    def _path(self, key: SheetKey) -> Path:
+        identity = json.dumps(
+            [
+                key.fingerprint.path,
+                key.sheet_name,
+                key.has_header,
+                key.engine,
+                key.schema_inference,
+            ]
+        )
+        stem = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        return self.cache_dir / f"{stem}.json"
+
+
+schema_store: Optional[SchemaStore] = (
+    SchemaStore(config.schema_cache_dir()) if config.schema_cache_dir() else None
+)
+
+
+def resolve_schema(
+    file_path: Union[str, Path], key: SheetKey
+) -> Optional[Dict[str, pl.DataType]]:
+    """
+    Dtypes to pass as ``schema_overrides`` when parsing ``key``'s sheet.
+
+    In "sampled" mode the stored schema is reused, or inferred and stored;
+    the caller's overrides take precedence over it. Overrides for columns
+    the sheet (or the requested ``columns``) lacks are skipped, since Polars
+    rejects them; this lets one set of overrides serve several sheets.
+    """
+    schema: Dict[str, str] = {}
+    if key.schema_inference == "sampled":
+        store = schema_store
+        stored = store.lookup(key) if store is not None else None
+        if stored is None:
+            stored = infer_sampled_schema(file_path, key)
+            if store is not None:
+                store.write(key, stored)
+        schema.update(stored)
+    if key.schema_overrides:
+        available = schema or sheet_columns(file_path, key)
+        schema.update(
+            (c, dtype) for c, dtype in key.schema_overrides if c in available
+        )
+    if key.columns is not None:
+        schema = {c: d for c, d in schema.items() if c in key.columns}
+    return {c: parse_dtype(d) for c, d in schema.items()} or None
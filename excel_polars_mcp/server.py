@@ -1,21 +1,139 @@
 """MCP Server for converting Excel files to Polars DataFrames."""
 
+from __future__ import annotations
+
 import asyncio
+import glob
 import json
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
-import polars as pl
 from fastmcp import FastMCP
-from pydantic import BaseModel
+from fastmcp.server.middleware import Middleware
+from pydantic import BaseModel, Field
 
+from excel_polars_mcp import config
+from excel_polars_mcp.cache import file_fingerprint, sheet_cache
+from excel_polars_mcp.engines import EngineName, resolve_engine
+from excel_polars_mcp.filters import FilterCondition, build_filter_expr
+from excel_polars_mcp.lazy import polars as pl
+from excel_polars_mcp.lazy import start_warm_up
+from excel_polars_mcp.metrics import (
+    instrument,
+    record_payload_bytes,
+    registry,
+    timed,
+)
+from excel_polars_mcp.pagination import decode_cursor, encode_cursor, query_digest
+from excel_polars_mcp.plans import (
+    Aggregation,
+    ComputedColumn,
+    JoinHow,
+    SortKey,
+    apply_aggregation,
+    apply_join,
+    apply_rows,
+    apply_sort,
+)
+from excel_polars_mcp.probe import probe_sheets
+from excel_polars_mcp.profiling import profile_calls, recent_captures
+from excel_polars_mcp.reader import (
+    collect_streaming,
+    list_sheet_names,
+    read_workbook as read_workbook_frames,
+    scan_sheet,
+    sheet_schema_overrides,
+)
+from excel_polars_mcp.schemas import SchemaInference
+from excel_polars_mcp.serialization import (
+    Compression,
+    ResponseFormat,
+    frame_payload,
+    payload_data_bytes,
+)
+from excel_polars_mcp.stats import (
+    DEFAULT_QUANTILES,
+    DEFAULT_SAMPLE_SIZE,
+    describe_frame,
+)
+from excel_polars_mcp.streaming import (
+    DEFAULT_PAGE_ROWS,
+    iter_sheet_batches,
+    process_peak_rss_bytes,
+)
+from excel_polars_mcp.watcher import directory_watcher
+from excel_polars_mcp.workers import worker_pool
 
-class ReadExcelArgs(BaseModel):
-    """Arguments for reading Excel file."""
-    file_path: str
-    sheet_name: Optional[str] = None
+
+class ReadOptions(BaseModel):
+    """Options shared by the tools that parse sheets."""
     has_header: bool = True
     infer_schema_length: int = 100
+    schema_overrides: Optional[Dict[str, str]] = Field(
+        default=None,
+        description='Column dtypes, e.g. {"Amount": "Float64"}; skipped where absent',
+    )
+    schema_inference: SchemaInference = Field(
+        default="head",
+        description="head: infer from the first rows; sampled: from every row",
+    )
+    engine: EngineName = Field(
+        default="auto",
+        description="Excel engine; auto picks the fastest calibrated engine",
+    )
+    profile: bool = Field(
+        default=False,
+        description="Save a cProfile/tracemalloc capture of this call on the server",
+    )
+
+
+class PayloadOptions(BaseModel):
+    """Options shared by the tools that return frame data."""
+    format: ResponseFormat = Field(
+        default="json",
+        description="json, or base64-encoded arrow_ipc / parquet columnar payload",
+    )
+    compression: Optional[List[Compression]] = Field(
+        default=None,
+        description="Accepted payload compressions, preferred first (zstd, gzip)",
+    )
+    compress_min_bytes: Optional[int] = Field(
+        default=None, ge=0, description="Compress only payloads at least this large"
+    )
+
+
+class SheetReadOptions(ReadOptions, PayloadOptions):
+    """Options shared by the tools that read sheet data."""
+    file_path: str
+    offset: int = Field(default=0, ge=0, description="First row of the page")
+    limit: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum rows per page (None for all; 10,000 when streaming)",
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="next_cursor from a previous page; overrides offset/limit",
+    )
+    columns: Optional[List[str]] = Field(
+        default=None, description="Columns to return (default: all)"
+    )
+    filter: Optional[List[FilterCondition]] = Field(
+        default=None, description="Row conditions that must all hold"
+    )
+    mode: Literal["eager", "streaming"] = Field(
+        default="eager",
+        description="streaming reads .xlsx rows in batches with bounded memory",
+    )
+    batch_size: int = Field(
+        default=10_000, ge=1, description="Rows per batch in streaming mode"
+    )
+
+
+class ReadExcelArgs(SheetReadOptions):
+    """Arguments for reading Excel file."""
+    sheet_name: Optional[str] = None
 
 
 class ListSheetsArgs(BaseModel):
@@ -23,29 +141,700 @@ class ListSheetsArgs(BaseModel):
     file_path: str
 
 
-class ReadExcelSheetArgs(BaseModel):
+class ReadExcelSheetArgs(SheetReadOptions):
     """Arguments for reading specific Excel sheet."""
-    file_path: str
     sheet_name: str
-    has_header: bool = True
-    infer_schema_length: int = 100
+
+
+class ReadWorkbookArgs(ReadOptions, PayloadOptions):
+    """Arguments for reading several sheets of a workbook at once."""
+    file_path: str
+    sheet_names: Optional[List[str]] = Field(
+        default=None, description="Sheets to read (default: all)"
+    )
+
+
+class ReadManyArgs(ReadOptions, PayloadOptions):
+    """Arguments for reading the same sheet from many workbooks at once."""
+    file_paths: Optional[List[str]] = Field(
+        default=None, description="Workbooks to read, in order"
+    )
+    glob: Optional[str] = Field(
+        default=None,
+        description="Pattern such as /data/2024-*.xlsx (** recurses); sorted",
+    )
+    max_files: int = Field(
+        default=100, ge=1, description="Refuse calls matching more workbooks"
+    )
+    sheet_name: Optional[str] = Field(
+        default=None, description="Sheet read from each workbook (default: first)"
+    )
+    columns: Optional[List[str]] = Field(
+        default=None, description="Columns to return (default: all)"
+    )
+    filter: Optional[List[FilterCondition]] = Field(
+        default=None, description="Row conditions that must all hold"
+    )
+    combine: Literal["separate", "concat"] = Field(
+        default="separate",
+        description=(
+            "separate: one result per file; concat: one frame stacked by column "
+            "name, with a source file column"
+        ),
+    )
+    source_column: str = Field(
+        default="source_file", description="Name of the source file column (concat)"
+    )
+    limit: Optional[int] = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum rows per file, or in total with concat (None for all)",
+    )
+
+
+class DescribeSheetArgs(ReadOptions):
+    """Arguments for summarizing the columns of a sheet."""
+    file_path: str
+    sheet_name: Optional[str] = None
+    columns: Optional[List[str]] = Field(
+        default=None, description="Columns to describe (default: all)"
+    )
+    quantiles: List[float] = Field(
+        default=list(DEFAULT_QUANTILES),
+        description="Quantiles (0-1) reported for numeric columns",
+    )
+    approximate: bool = Field(
+        default=False,
+        description="HyperLogLog n_unique and sampled quantiles, with error bounds",
+    )
+    sample_size: int = Field(
+        default=DEFAULT_SAMPLE_SIZE,
+        ge=1,
+        description="Rows sampled for approximate quantiles",
+    )
+
+
+class QuerySqlArgs(ReadOptions, PayloadOptions):
+    """Arguments for running a SQL query over workbook sheets."""
+    query: str = Field(
+        description=(
+            "SQL query; each sheet is a table named after the sheet, or "
+            "<file stem>_<sheet> when several workbooks are given"
+        )
+    )
+    file_paths: List[str] = Field(min_length=1, description="Workbooks to query")
+    limit: Optional[int] = Field(
+        default=10_000, ge=1, description="Maximum rows returned (None for all)"
+    )
+
+
+class ServerStatsArgs(BaseModel):
+    """Arguments for reading the server's metrics."""
+    reset: bool = Field(
+        default=False, description="Clear the tool metrics after reading them"
+    )
+
+
+class PlanOptions(ReadOptions, PayloadOptions):
+    """Options shared by the tools that run a declarative query plan."""
+    sort: Optional[List[SortKey]] = Field(
+        default=None, description="Result sort keys, applied in order"
+    )
+    limit: Optional[int] = Field(
+        default=10_000, ge=1, description="Maximum rows returned (None for all)"
+    )
+
+
+class AggregateArgs(PlanOptions):
+    """Arguments for a filtered, grouped aggregation over one sheet."""
+    file_path: str
+    sheet_name: Optional[str] = None
+    filter: Optional[List[FilterCondition]] = Field(
+        default=None, description="Row conditions applied before aggregating"
+    )
+    compute: Optional[List[ComputedColumn]] = Field(
+        default=None, description="Row-level columns added before aggregating"
+    )
+    group_by: Optional[List[str]] = Field(
+        default=None, description="Group columns (default: one row over all rows)"
+    )
+    aggregations: List[Aggregation] = Field(min_length=1)
+    derive: Optional[List[ComputedColumn]] = Field(
+        default=None, description="Columns computed from the aggregated results"
+    )
+
+
+class FilterRowsArgs(PlanOptions):
+    """Arguments for returning the rows of one sheet that match a filter."""
+    file_path: str
+    sheet_name: Optional[str] = None
+    filter: List[FilterCondition] = Field(
+        min_length=1, description="Row conditions that must all hold"
+    )
+    compute: Optional[List[ComputedColumn]] = None
+    columns: Optional[List[str]] = Field(
+        default=None, description="Columns to return (default: all)"
+    )
+    limit: Optional[int] = Field(
+        default=1_000, ge=1, description="Maximum rows returned (None for all)"
+    )
+
+
+class JoinSheetsArgs(PlanOptions):
+    """Arguments for joining two sheets, optionally aggregating the result."""
+    file_path: str
+    left_sheet: str
+    right_sheet: str
+    right_file_path: Optional[str] = Field(
+        default=None, description="Workbook of right_sheet (default: file_path)"
+    )
+    how: JoinHow = "inner"
+    on: Optional[List[str]] = Field(
+        default=None, description="Key columns present in both sheets"
+    )
+    left_on: Optional[List[str]] = None
+    right_on: Optional[List[str]] = None
+    suffix: str = "_right"
+    left_filter: Optional[List[FilterCondition]] = None
+    right_filter: Optional[List[FilterCondition]] = None
+    columns: Optional[List[str]] = Field(
+        default=None, description="Columns kept after the join (default: all)"
+    )
+    group_by: Optional[List[str]] = None
+    aggregations: Optional[List[Aggregation]] = Field(
+        default=None, description="Aggregate the joined rows instead of returning them"
+    )
+    derive: Optional[List[ComputedColumn]] = None
 
 
 # Create FastMCP server
 mcp = FastMCP("Excel to Polars Converter")
 
 
+class WarmUpAfterHandshake(Middleware):
+    """
+    Start the background import of Polars and the engines after the handshake.
+
+    A client's first message is the handshake (``initialize``, or
+    ``server/discover`` in newer protocol versions), so the warm-up thread
+    starts once that message has been answered.
+    """
+
+    def __init__(self) -> None:
+        self.started = False
+
+    async def on_message(self, context: Any, call_next: Any) -> Any:
+        """Answer the message, then start the warm-up thread if not yet started."""
+        result = await call_next(context)
+        if not self.started:
+            self.started = True
+            start_warm_up()
+        return result
+
+
+def _select_rows(
+    file_path: str,
+    sheet_name: Optional[str],
+    has_header: bool,
+    infer_schema_length: int,
+    columns: Optional[List[str]],
+    conditions: Optional[List[FilterCondition]],
+    engine: str,
+    schema_overrides: Optional[Dict[str, str]] = None,
+    schema_inference: str = "head",
+) -> pl.DataFrame:
+    """Load a sheet, then apply the row filter and column projection."""
+    read_columns = columns
+    if columns is not None and conditions:
+        # Filter columns must be read even when they are not returned
+        filter_columns = [c.column for c in conditions or [] if c.column not in columns]
+        read_columns = columns + list(dict.fromkeys(filter_columns))
+
+    lazy = scan_sheet(
+        file_path,
+        sheet_name=sheet_name,
+        has_header=has_header,
+        infer_schema_length=infer_schema_length,
+        columns=read_columns,
+        engine=engine,
+        schema_overrides=schema_overrides,
+        schema_inference=schema_inference,
+    )
+    if conditions:
+        lazy = lazy.filter(build_filter_expr(conditions, lazy.collect_schema()))
+    if columns is not None:
+        lazy = lazy.select(columns)
+    return lazy.collect()
+
+
+def _describe_sheet(
+    file_path: str,
+    sheet_name: Optional[str],
+    has_header: bool,
+    infer_schema_length: int,
+    columns: Optional[List[str]],
+    engine: str,
+    quantiles: List[float],
+    approximate: bool,
+    sample_size: int,
+    schema_overrides: Optional[Dict[str, str]] = None,
+    schema_inference: str = "head",
+) -> Dict[str, Any]:
+    """Compute column statistics over the sheet's lazy scan."""
+    lazy = scan_sheet(
+        file_path,
+        sheet_name=sheet_name,
+        has_header=has_header,
+        infer_schema_length=infer_schema_length,
+        columns=columns,
+        engine=engine,
+        schema_overrides=schema_overrides,
+        schema_inference=schema_inference,
+    )
+    return describe_frame(lazy, columns, quantiles, approximate, sample_size)
+
+
+def _sql_tables(file_paths: List[str]) -> Dict[str, Tuple[str, str]]:
+    """Map SQL table names to (workbook, sheet)."""
+    tables: Dict[str, Tuple[str, str]] = {}
+    for file_path in file_paths:
+        for sheet_name in list_sheet_names(file_path):
+            name = sheet_name
+            if len(file_paths) > 1:
+                name = f"{Path(file_path).stem}_{sheet_name}"
+            if name in tables:
+                raise ValueError(f"Duplicate table name: {name}")
+            tables[name] = (file_path, sheet_name)
+    return tables
+
+
+def _run_sql(
+    query: str,
+    file_paths: List[str],
+    has_header: bool,
+    infer_schema_length: int,
+    engine: str,
+    limit: Optional[int],
+    schema_overrides: Optional[Dict[str, str]] = None,
+    schema_inference: str = "head",
+) -> Tuple[pl.DataFrame, bool, List[str]]:
+    """Run ``query`` over lazy sheet tables; return (rows, truncated, tables)."""
+    tables = _sql_tables(file_paths)
+    context = pl.SQLContext()
+    for name, (file_path, sheet_name) in tables.items():
+        # Only sheets the query mentions are loaded or scanned
+        if re.search(rf"(?<!\w){re.escape(name)}(?!\w)", query, re.IGNORECASE):
+            context.register(
+                name,
+                scan_sheet(
+                    file_path,
+                    sheet_name=sheet_name,
+                    has_header=has_header,
+                    infer_schema_length=infer_schema_length,
+                    engine=engine,
+                    schema_overrides=schema_overrides,
+                    schema_inference=schema_inference,
+                ),
+            )
+    df, truncated = _collect_limited(context.execute(query, eager=False), limit)
+    return df, truncated, list(tables)
+
+
+def _collect_limited(
+    lazy: pl.LazyFrame, limit: Optional[int]
+) -> Tuple[pl.DataFrame, bool]:
+    """Collect at most ``limit`` rows on the streaming engine; flag truncation."""
+    if limit is not None:
+        # One extra row tells whether the result was cut off
+        lazy = lazy.head(limit + 1)
+    df = collect_streaming(lazy)
+    truncated = limit is not None and df.height > limit
+    return (df.head(limit) if truncated else df), truncated
+
+
+def _encode_frame(
+    df: pl.DataFrame,
+    fmt: ResponseFormat,
+    compression: Optional[List[str]],
+    min_bytes: int,
+) -> Tuple[Dict[str, Any], int]:
+    """Build the frame payload and measure its data, in a worker."""
+    payload = frame_payload(df, fmt, compression, min_bytes)
+    return payload, payload_data_bytes(df, payload)
+
+
+async def _payload(df: pl.DataFrame, args: Any) -> Dict[str, Any]:
+    """Encode ``df`` in the worker pool, timed as the call's serialize phase."""
+    min_bytes = args.compress_min_bytes
+    if min_bytes is None:
+        min_bytes = config.compress_min_bytes()
+    with timed("serialize"):
+        payload, size = await worker_pool.run(
+            _encode_frame, df, args.format, args.compression, min_bytes
+        )
+    record_payload_bytes(size)
+    return payload
+
+
+def _scan(args: PlanOptions, file_path: str, sheet_name: Optional[str]) -> pl.LazyFrame:
+    return scan_sheet(
+        file_path,
+        sheet_name=sheet_name,
+        has_header=args.has_header,
+        infer_schema_length=args.infer_schema_length,
+        engine=args.engine,
+        schema_overrides=args.schema_overrides,
+        schema_inference=args.schema_inference,
+    )
+
+
+def _aggregate(args: AggregateArgs) -> Tuple[pl.DataFrame, bool]:
+    lazy = apply_rows(
+        _scan(args, args.file_path, args.sheet_name), args.filter, args.compute
+    )
+    lazy = apply_aggregation(lazy, args.group_by, args.aggregations, args.derive)
+    return _collect_limited(apply_sort(lazy, args.sort), args.limit)
+
+
+def _filter_rows(args: FilterRowsArgs) -> Tuple[pl.DataFrame, bool]:
+    lazy = apply_rows(
+        _scan(args, args.file_path, args.sheet_name), args.filter, args.compute
+    )
+    if args.columns is not None:
+        lazy = lazy.select(args.columns)
+    return _collect_limited(apply_sort(lazy, args.sort), args.limit)
+
+
+def _join_sheets(args: JoinSheetsArgs) -> Tuple[pl.DataFrame, bool]:
+    left = apply_rows(_scan(args, args.file_path, args.left_sheet), args.left_filter)
+    right = apply_rows(
+        _scan(args, args.right_file_path or args.file_path, args.right_sheet),
+        args.right_filter,
+    )
+    lazy = apply_join(
+        left, right, args.how, args.on, args.left_on, args.right_on, args.suffix
+    )
+    if args.columns is not None:
+        lazy = lazy.select(args.columns)
+    if args.aggregations:
+        lazy = apply_aggregation(lazy, args.group_by, args.aggregations, args.derive)
+    return _collect_limited(apply_sort(lazy, args.sort), args.limit)
+
+
+async def _run_plan(
+    build: Callable[[Any], Tuple[pl.DataFrame, bool]],
+    args: PlanOptions,
+    file_paths: List[str],
+    action: str,
+) -> Dict[str, Any]:
+    """Validate the workbooks, run a plan builder in the pool and respond."""
+    try:
+        for path in file_paths:
+            file_path = Path(path)
+            
+            if not file_path.exists():
+                return {"error": f"File not found: {path}"}
+            
+            if not file_path.suffix.lower() in ['.xlsx', '.xls']:
+                return {"error": "File must be an Excel file (.xlsx or .xls)"}
+        
+        with timed("parse"):
+            df, truncated = await worker_pool.run(build, args)
+        payload = await _payload(df, args)
+        
+        return {"success": True, **payload, "truncated": truncated}
+        
+    except Exception as e:
+        return {"error": f"Failed to {action}: {str(e)}"}
+
+
+def _expand_paths(file_paths: Optional[List[str]], pattern: Optional[str]) -> List[str]:
+    """Explicit paths followed by the sorted Excel files matching ``pattern``."""
+    paths = list(file_paths or [])
+    if pattern:
+        paths += sorted(
+            path
+            for path in glob.glob(pattern, recursive=True)
+            if Path(path).suffix.lower() in (".xlsx", ".xls")
+            # Excel's lock files for workbooks open in Excel
+            and not Path(path).name.startswith("~$")
+        )
+    return list(dict.fromkeys(paths))
+
+
+async def _read_sources(
+    args: ReadManyArgs, paths: List[str]
+) -> Tuple[Dict[str, pl.DataFrame], Dict[str, str]]:
+    """
+    Read the sheet from every workbook concurrently in the worker pool.
+
+    Returns:
+        Frames of the workbooks read, and error messages of the others
+    """
+    # At most one call per worker, so a large batch does not fill the
+    # pool's queue and turn away other clients' calls
+    slots = asyncio.Semaphore(worker_pool.max_workers)
+
+    async def read_one(path: str) -> pl.DataFrame:
+        file_path = Path(path)
+        if not file_path.exists():
+            raise ValueError(f"File not found: {path}")
+        if not file_path.suffix.lower() in ['.xlsx', '.xls']:
+            raise ValueError("File must be an Excel file (.xlsx or .xls)")
+        async with slots:
+            return await worker_pool.run(
+                _select_rows,
+                path,
+                args.sheet_name,
+                args.has_header,
+                args.infer_schema_length,
+                args.columns,
+                args.filter,
+                args.engine,
+                args.schema_overrides,
+                args.schema_inference,
+            )
+
+    with timed("parse"):
+        results = await asyncio.gather(
+            *(read_one(path) for path in paths), return_exceptions=True
+        )
+    frames: Dict[str, pl.DataFrame] = {}
+    errors: Dict[str, str] = {}
+    for path, result in zip(paths, results):
+        if isinstance(result, Exception):
+            errors[path] = str(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            frames[path] = result
+    return frames, errors
+
+
+def _concat_sources(
+    frames: Dict[str, pl.DataFrame], source_column: str, limit: Optional[int]
+) -> Tuple[pl.DataFrame, bool]:
+    """
+    Stack the frames by column name, first adding a column naming each file.
+
+    Columns missing from a file are null in its rows, and dtypes that differ
+    between files are widened to a common supertype.
+    """
+    parts = []
+    for path, df in frames.items():
+        if source_column in df.columns:
+            raise ValueError(
+                f"{path} already has a column named {source_column!r}; "
+                "choose another source_column"
+            )
+        parts.append(df.lazy().select(pl.lit(path).alias(source_column), pl.all()))
+    if not parts:
+        return pl.DataFrame(schema={source_column: pl.String}), False
+    return _collect_limited(pl.concat(parts, how="diagonal_relaxed"), limit)
+
+
+def _stream_rows(
+    file_path: str,
+    sheet_name: Optional[str],
+    has_header: bool,
+    columns: Optional[List[str]],
+    conditions: Optional[List[FilterCondition]],
+    offset: int,
+    limit: Optional[int],
+    batch_size: int,
+    infer_schema_length: int = 100,
+    engine: str = "auto",
+    schema_overrides: Optional[Dict[str, str]] = None,
+    schema_inference: SchemaInference = "head",
+) -> Tuple[pl.DataFrame, bool, Dict[str, Any]]:
+    """
+    Collect one page of matching rows by streaming the sheet in batches.
+
+    Reading stops as soon as the page is full and one further matching row
+    proves there is a next page, so memory stays bounded by the batch size
+    plus the page itself. Schema overrides and sampled inference type the
+    batches as they would an eager read; sampled inference itself parses
+    the whole sheet once, unless its schema is already stored.
+
+    Returns:
+        The page, whether more matching rows follow it, and streaming metadata
+    """
+    predicate: Optional[pl.Expr] = None
+    parts: List[pl.DataFrame] = []
+    skip = offset
+    wanted = limit
+    has_more = False
+    batches_read = 0
+    peak_batch_bytes = 0
+    dtypes = None
+    if schema_overrides or schema_inference != "head":
+        dtypes = sheet_schema_overrides(
+            file_path,
+            sheet_name,
+            has_header,
+            infer_schema_length,
+            engine,
+            schema_overrides,
+            schema_inference,
+        )
+    batches = iter_sheet_batches(file_path, sheet_name, batch_size, has_header, dtypes)
+    for batch in batches:
+        batches_read += 1
+        peak_batch_bytes = max(peak_batch_bytes, batch.estimated_size())
+        if conditions and predicate is None:
+            # Every batch has the first batch's dtypes
+            predicate = build_filter_expr(conditions, batch.schema)
+        if predicate is not None:
+            batch = batch.filter(predicate)
+        if columns is not None:
+            batch = batch.select(columns)
+        if skip:
+            skipped = min(skip, batch.height)
+            batch = batch.slice(skipped)
+            skip -= skipped
+        if wanted is not None:
+            has_more = batch.height > wanted
+            batch = batch.head(wanted)
+            wanted -= batch.height
+        if batch.height:
+            parts.append(batch)
+        if has_more:
+            break
+
+    page = pl.concat(parts, how="vertical_relaxed") if parts else pl.DataFrame()
+    metadata = {
+        "batch_size": batch_size,
+        "batches_read": batches_read,
+        "peak_batch_bytes": peak_batch_bytes,
+        "process_peak_rss_bytes": process_peak_rss_bytes(),
+    }
+    return page, has_more, metadata
+
+
+async def _read_sheet(
+    args: SheetReadOptions, sheet_name: Optional[str]
+) -> Dict[str, Any]:
+    """Read one page of a sheet and build the tool response."""
+    engine = "openpyxl"
+    if args.mode != "streaming":
+        # Resolving "auto" may run the one-off calibration, so keep it off the loop
+        engine = await worker_pool.run(resolve_engine, args.engine, args.file_path)
+    digest = query_digest(
+        file_fingerprint(args.file_path),
+        sheet_name,
+        args.has_header,
+        args.infer_schema_length,
+        args.columns,
+        [condition.model_dump() for condition in args.filter or []],
+        args.mode,
+        engine,
+        args.schema_overrides,
+        args.schema_inference,
+    )
+    offset, limit = args.offset, args.limit
+    if args.cursor:
+        offset, limit = decode_cursor(args.cursor, digest)
+
+    if args.mode == "streaming":
+        if limit is None:
+            limit = DEFAULT_PAGE_ROWS
+        return await _read_sheet_streaming(args, sheet_name, digest, offset, limit)
+
+    # Parse in the worker pool; the cache keeps the frame between pages
+    with timed("parse"):
+        df = await worker_pool.run(
+            _select_rows,
+            args.file_path,
+            sheet_name,
+            args.has_header,
+            args.infer_schema_length,
+            args.columns,
+            args.filter,
+            engine,
+            args.schema_overrides,
+            args.schema_inference,
+        )
+    page = df.slice(offset, limit)
+
+    # Serialize off the event loop as well
+    payload = await _payload(page, args)
+
+    next_offset = offset + page.height
+    next_cursor = None
+    if limit is not None and next_offset < df.height:
+        next_cursor = encode_cursor(digest, next_offset, limit)
+
+    return {
+        "success": True,
+        **payload,
+        "sheet_name": sheet_name,
+        "engine": engine,
+        "total_rows": df.height,
+        "offset": offset,
+        "limit": limit,
+        "next_cursor": next_cursor,
+    }
+
+
+async def _read_sheet_streaming(
+    args: SheetReadOptions,
+    sheet_name: Optional[str],
+    digest: str,
+    offset: int,
+    limit: Optional[int],
+) -> Dict[str, Any]:
+    """Read one page of a sheet in streaming mode and build the tool response."""
+    with timed("parse"):
+        page, has_more, streaming = await worker_pool.run(
+            _stream_rows,
+            args.file_path,
+            sheet_name,
+            args.has_header,
+            args.columns,
+            args.filter,
+            offset,
+            limit,
+            args.batch_size,
+            args.infer_schema_length,
+            args.engine,
+            args.schema_overrides,
+            args.schema_inference,
+        )
+    payload = await _payload(page, args)
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(digest, offset + page.height, limit)
+
+    return {
+        "success": True,
+        **payload,
+        "sheet_name": sheet_name,
+        "engine": "openpyxl",
+        # The row count is only known once the sheet has been read to the end
+        "total_rows": None if has_more else offset + page.height,
+        "offset": offset,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "streaming": streaming,
+    }
+
+
 @mcp.tool()
+@instrument
+@profile_calls
 async def read_excel(args: ReadExcelArgs) -> Dict[str, Any]:
     """
     Read an Excel file and convert it to Polars DataFrame format.
     
     Args:
         args: ReadExcelArgs containing file_path, optional sheet_name, 
-              has_header flag, and infer_schema_length
+              has_header flag, infer_schema_length and optional
+              offset/limit/cursor paging
     
     Returns:
-        Dictionary containing the DataFrame data and metadata
+        Dictionary containing the DataFrame data and metadata, plus
+        total_rows and a next_cursor while more pages remain
     """
     try:
         file_path = Path(args.file_path)
@@ -56,31 +845,15 @@ async def read_excel(args: ReadExcelArgs) -> Dict[str, Any]:
         if not file_path.suffix.lower() in ['.xlsx', '.xls']:
             return {"error": "File must be an Excel file (.xlsx or .xls)"}
         
-        # Read Excel file with Polars
-        df = pl.read_excel(
-            source=args.file_path,
-            sheet_name=args.sheet_name,
-            has_header=args.has_header,
-            infer_schema_length=args.infer_schema_length
-        )
-        
-        # Convert to dictionary format
-        result = {
-            "success": True,
-            "data": df.to_dict(as_series=False),
-            "schema": {col: str(dtype) for col, dtype in df.schema.items()},
-            "shape": df.shape,
-            "sheet_name": args.sheet_name,
-            "columns": df.columns
-        }
-        
-        return result
+        return await _read_sheet(args, args.sheet_name)
         
     except Exception as e:
         return {"error": f"Failed to read Excel file: {str(e)}"}
 
 
 @mcp.tool()
+@instrument
+@profile_calls
 async def list_sheets(args: ListSheetsArgs) -> Dict[str, Any]:
     """
     List all sheet names in an Excel file.
@@ -89,7 +862,8 @@ async def list_sheets(args: ListSheetsArgs) -> Dict[str, Any]:
         args: ListSheetsArgs containing file_path
     
     Returns:
-        Dictionary containing list of sheet names
+        Dictionary containing list of sheet names, plus sheet_info with each
+        sheet's index, visibility and approximate row/column counts
     """
     try:
         file_path = Path(args.file_path)
@@ -100,24 +874,14 @@ async def list_sheets(args: ListSheetsArgs) -> Dict[str, Any]:
         if not file_path.suffix.lower() in ['.xlsx', '.xls']:
             return {"error": "File must be an Excel file (.xlsx or .xls)"}
         
-        # Get sheet names using openpyxl for .xlsx files
-        if file_path.suffix.lower() == '.xlsx':
-            from openpyxl import load_workbook
-            workbook = load_workbook(filename=args.file_path, read_only=True)
-            sheets = workbook.sheetnames
-            workbook.close()
-        else:
-            # For .xls files, we'll try to read and catch the error to get sheet info
-            try:
-                # This is a workaround as polars doesn't directly provide sheet listing
-                pl.read_excel(source=args.file_path, sheet_name=0)
-                sheets = ["Sheet1"]  # Default assumption for .xls
-            except Exception:
-                sheets = []
+        # Only workbook metadata is read, never cell data
+        with timed("parse"):
+            sheet_info = await worker_pool.run(probe_sheets, args.file_path)
         
         return {
             "success": True,
-            "sheets": sheets,
+            "sheets": [sheet["name"] for sheet in sheet_info],
+            "sheet_info": sheet_info,
             "file_path": args.file_path
         }
         
@@ -126,16 +890,20 @@ async def list_sheets(args: ListSheetsArgs) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@instrument
+@profile_calls
 async def read_excel_sheet(args: ReadExcelSheetArgs) -> Dict[str, Any]:
     """
     Read a specific sheet from an Excel file and convert to Polars DataFrame.
     
     Args:
         args: ReadExcelSheetArgs containing file_path, sheet_name, 
-              has_header flag, and infer_schema_length
+              has_header flag, infer_schema_length and optional
+              offset/limit/cursor paging
     
     Returns:
-        Dictionary containing the DataFrame data and metadata for the specific sheet
+        Dictionary containing the DataFrame data and metadata for the specific sheet,
+        plus total_rows and a next_cursor while more pages remain
     """
     try:
         file_path = Path(args.file_path)
@@ -146,32 +914,342 @@ async def read_excel_sheet(args: ReadExcelSheetArgs) -> Dict[str, Any]:
         if not file_path.suffix.lower() in ['.xlsx', '.xls']:
             return {"error": "File must be an Excel file (.xlsx or .xls)"}
         
-        # Read specific sheet with Polars
-        df = pl.read_excel(
-            source=args.file_path,
-            sheet_name=args.sheet_name,
-            has_header=args.has_header,
-            infer_schema_length=args.infer_schema_length
-        )
+        return await _read_sheet(args, args.sheet_name)
+        
+    except Exception as e:
+        return {"error": f"Failed to read Excel sheet '{args.sheet_name}': {str(e)}"}
+
+
+@mcp.tool()
+@instrument
+@profile_calls
+async def read_workbook(args: ReadWorkbookArgs) -> Dict[str, Any]:
+    """
+    Read every sheet (or a selected list) of an Excel file in a single pass.
+    
+    Args:
+        args: ReadWorkbookArgs containing file_path, optional sheet_names,
+              has_header flag, infer_schema_length and response format
+    
+    Returns:
+        Dictionary mapping each sheet name to its data and metadata
+    """
+    try:
+        file_path = Path(args.file_path)
+        
+        if not file_path.exists():
+            return {"error": f"File not found: {args.file_path}"}
+        
+        if not file_path.suffix.lower() in ['.xlsx', '.xls']:
+            return {"error": "File must be an Excel file (.xlsx or .xls)"}
+        
+        with timed("parse"):
+            frames = await worker_pool.run(
+                read_workbook_frames,
+                args.file_path,
+                args.sheet_names,
+                args.has_header,
+                args.infer_schema_length,
+                args.engine,
+                args.schema_overrides,
+                args.schema_inference,
+            )
+        sheets = {}
+        for name, df in frames.items():
+            sheets[name] = await _payload(df, args)
+        
+        return {
+            "success": True,
+            "sheet_names": list(frames),
+            "sheets": sheets,
+            "file_path": args.file_path
+        }
+        
+    except Exception as e:
+        return {"error": f"Failed to read workbook: {str(e)}"}
+
+
+@mcp.tool()
+@instrument
+@profile_calls
+async def read_many(args: ReadManyArgs) -> Dict[str, Any]:
+    """
+    Read the same sheet from many workbooks in one call, parsing concurrently.
+    
+    Args:
+        args: ReadManyArgs containing file_paths and/or a glob, optional
+              sheet_name, columns and filter, and combine mode
+    
+    Returns:
+        With combine="separate", a dictionary mapping each file to its data
+        and metadata; with "concat", one frame of every file's rows with a
+        source file column. Files that could not be read are listed under
+        errors instead of failing the call
+    """
+    try:
+        paths = _expand_paths(args.file_paths, args.glob)
+        if not paths:
+            return {"error": "No Excel files given or matched"}
+        if len(paths) > args.max_files:
+            return {
+                "error": f"{len(paths)} files matched, more than max_files "
+                f"({args.max_files})"
+            }
+        
+        frames, errors = await _read_sources(args, paths)
+        
+        if args.combine == "concat":
+            with timed("parse"):
+                df, truncated = await worker_pool.run(
+                    _concat_sources, frames, args.source_column, args.limit
+                )
+            payload = await _payload(df, args)
+            return {
+                "success": True,
+                **payload,
+                "truncated": truncated,
+                "file_paths": list(frames),
+                "errors": errors,
+            }
+        
+        files = {}
+        for path, df in frames.items():
+            truncated = args.limit is not None and df.height > args.limit
+            page = df.head(args.limit) if truncated else df
+            files[path] = {
+                **await _payload(page, args),
+                "total_rows": df.height,
+                "truncated": truncated,
+            }
+        
+        return {
+            "success": True,
+            "file_paths": list(frames),
+            "files": files,
+            "errors": errors,
+        }
+        
+    except Exception as e:
+        return {"error": f"Failed to read workbooks: {str(e)}"}
+
+
+@mcp.tool()
+@instrument
+@profile_calls
+async def describe_sheet(args: DescribeSheetArgs) -> Dict[str, Any]:
+    """
+    Compute summary statistics for every column of a sheet in one pass.
+    
+    Args:
+        args: DescribeSheetArgs containing file_path, optional sheet_name,
+              has_header flag, infer_schema_length, optional columns,
+              quantiles and the approximate/sample_size options
+    
+    Returns:
+        Dictionary with the row count and, per column, its dtype, count,
+        null_count and the min/max/mean/std/quantile, n_unique or
+        true_count statistics that apply to the dtype; approximate results
+        add error_bounds
+    """
+    try:
+        file_path = Path(args.file_path)
+        
+        if not file_path.exists():
+            return {"error": f"File not found: {args.file_path}"}
+        
+        if not file_path.suffix.lower() in ['.xlsx', '.xls']:
+            return {"error": "File must be an Excel file (.xlsx or .xls)"}
+        
+        engine = await worker_pool.run(resolve_engine, args.engine, args.file_path)
+        # A valid sidecar is scanned lazily rather than loaded
+        with timed("parse"):
+            summary = await worker_pool.run(
+                _describe_sheet,
+                args.file_path,
+                args.sheet_name,
+                args.has_header,
+                args.infer_schema_length,
+                args.columns,
+                engine,
+                args.quantiles,
+                args.approximate,
+                args.sample_size,
+                args.schema_overrides,
+                args.schema_inference,
+            )
         
-        # Convert to dictionary format
-        result = {
+        return {
             "success": True,
-            "data": df.to_dict(as_series=False),
-            "schema": {col: str(dtype) for col, dtype in df.schema.items()},
-            "shape": df.shape,
             "sheet_name": args.sheet_name,
-            "columns": df.columns
+            "engine": engine,
+            **summary,
         }
         
-        return result
+    except Exception as e:
+        return {"error": f"Failed to describe sheet: {str(e)}"}
+
+
+@mcp.tool()
+@instrument
+@profile_calls
+async def query_sql(args: QuerySqlArgs) -> Dict[str, Any]:
+    """
+    Run a SQL query over the sheets of one or more Excel files.
+    
+    Each sheet is registered as a lazy table backed by the parsed-sheet
+    cache or its Parquet sidecar, so only the result set is returned.
+    
+    Args:
+        args: QuerySqlArgs containing the query, file_paths, has_header
+              flag, infer_schema_length, engine, row limit and format
+    
+    Returns:
+        Dictionary containing the result data and metadata, the available
+        table names and whether the result was truncated at limit
+    """
+    try:
+        for path in args.file_paths:
+            file_path = Path(path)
+            
+            if not file_path.exists():
+                return {"error": f"File not found: {path}"}
+            
+            if not file_path.suffix.lower() in ['.xlsx', '.xls']:
+                return {"error": "File must be an Excel file (.xlsx or .xls)"}
+        
+        with timed("parse"):
+            df, truncated, tables = await worker_pool.run(
+                _run_sql,
+                args.query,
+                args.file_paths,
+                args.has_header,
+                args.infer_schema_length,
+                args.engine,
+                args.limit,
+                args.schema_overrides,
+                args.schema_inference,
+            )
+        payload = await _payload(df, args)
+        
+        return {
+            "success": True,
+            **payload,
+            "tables": tables,
+            "truncated": truncated,
+        }
         
     except Exception as e:
-        return {"error": f"Failed to read Excel sheet '{args.sheet_name}': {str(e)}"}
+        return {"error": f"Failed to run SQL query: {str(e)}"}
+
+
+@mcp.tool()
+@instrument
+@profile_calls
+async def aggregate(args: AggregateArgs) -> Dict[str, Any]:
+    """
+    Filter, group and aggregate a sheet on the server.
+    
+    The spec is compiled to a Polars lazy plan and run on the streaming
+    engine, so only the aggregated rows are returned.
+    
+    Args:
+        args: AggregateArgs containing file_path, sheet_name, optional
+              filter and computed columns, group_by, aggregations, derived
+              columns, sort and limit
+    
+    Returns:
+        Dictionary containing the aggregated data and metadata
+    """
+    return await _run_plan(_aggregate, args, [args.file_path], "aggregate sheet")
+
+
+@mcp.tool()
+@instrument
+@profile_calls
+async def filter_rows(args: FilterRowsArgs) -> Dict[str, Any]:
+    """
+    Return the rows of a sheet that match a filter, sorted and limited.
+    
+    Args:
+        args: FilterRowsArgs containing file_path, sheet_name, filter,
+              optional computed columns, columns, sort and limit
+    
+    Returns:
+        Dictionary containing the matching rows and whether they were
+        truncated at limit
+    """
+    return await _run_plan(_filter_rows, args, [args.file_path], "filter rows")
+
+
+@mcp.tool()
+@instrument
+@profile_calls
+async def join_sheets(args: JoinSheetsArgs) -> Dict[str, Any]:
+    """
+    Join two sheets on key columns, optionally aggregating the joined rows.
+    
+    Args:
+        args: JoinSheetsArgs containing file_path, left_sheet, right_sheet,
+              optional right_file_path, join keys and type, per-side
+              filters, columns, and optional group_by/aggregations/derive,
+              sort and limit
+    
+    Returns:
+        Dictionary containing the joined (or aggregated) data and metadata
+    """
+    file_paths = [args.file_path]
+    if args.right_file_path:
+        file_paths.append(args.right_file_path)
+    return await _run_plan(_join_sheets, args, file_paths, "join sheets")
+
+
+@mcp.tool()
+async def server_stats(args: ServerStatsArgs) -> Dict[str, Any]:
+    """
+    Report per-tool latency, throughput, cache and error metrics.
+    
+    Args:
+        args: ServerStatsArgs with an optional reset flag
+    
+    Returns:
+        Dictionary with uptime and, per tool, call/error counts, cache
+        hits/misses and count/sum/mean/p50/p95/p99 summaries of latency,
+        parse and serialize seconds, rows and payload bytes; plus the
+        parsed-sheet cache and worker pool state, recent profile captures
+        and the watched-directory prewarmer's counters (None when off).
+        With a process pool, each worker keeps its own sheet cache, so the
+        cache state and per-tool cache counts are omitted
+    """
+    try:
+        snapshot = registry.snapshot()
+        if args.reset:
+            registry.reset()
+        
+        return {
+            "success": True,
+            **snapshot,
+            "sheet_cache": (
+                sheet_cache.stats() if worker_pool.kind == "thread" else None
+            ),
+            "worker_pool": worker_pool.stats(),
+            "profiles": recent_captures(),
+            "watcher": (
+                directory_watcher.stats() if directory_watcher is not None else None
+            ),
+        }
+        
+    except Exception as e:
+        return {"error": f"Failed to read server stats: {str(e)}"}
 
 
 def main() -> None:
     """Run the MCP server."""
+    if config.warm_up_enabled():
+        # Imported in the background after the handshake, so the imports do
+        # not compete with it
+        mcp.add_middleware(WarmUpAfterHandshake())
+    if directory_watcher is not None:
+        directory_watcher.start()
     mcp.run()
 
 
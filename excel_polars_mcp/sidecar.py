@@ -0,0 +1,114 @@
+"""Persistent Parquet copies of parsed sheets, reused across server restarts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from excel_polars_mcp import config
+from excel_polars_mcp.cache import SheetKey
+from excel_polars_mcp.lazy import polars as pl
+
+
+def file_sha256(file_path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SidecarStore:
+    """
+    Parquet sidecar files for parsed sheets, one per (workbook, sheet, options).
+
+    Each sidecar has a JSON metadata file recording the source's mtime, size
+    and SHA-256. A sidecar is valid while mtime and size match; if only the
+    mtime moved (e.g. the file was touched or copied) the content hash decides.
+    Stale sidecars are deleted on lookup.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]) -> None:
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+
+    def lookup(self, key: SheetKey) -> Optional[Path]:
+        """Return the sidecar for ``key`` if it matches the current file."""
+        parquet_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not parquet_path.exists():
+            return None
+
+        fingerprint = key.fingerprint
+        same_size = meta["size"] == fingerprint.size
+        if same_size and meta["mtime_ns"] == fingerprint.mtime_ns:
+            return parquet_path
+        if same_size:
+            if file_sha256(fingerprint.path) == meta["sha256"]:
+                meta["mtime_ns"] = fingerprint.mtime_ns
+                self._write_text(meta_path, json.dumps(meta))
+                return parquet_path
+        self._discard(parquet_path, meta_path)
+        return None
+
+    def write(self, key: SheetKey, df: pl.DataFrame) -> Path:
+        """Persist ``df`` as the sidecar for ``key``."""
+        parquet_path, meta_path = self._paths(key)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "source": key.fingerprint.path,
+            "sheet_name": key.sheet_name,
+            "mtime_ns": key.fingerprint.mtime_ns,
+            "size": key.fingerprint.size,
+            "sha256": file_sha256(key.fingerprint.path),
+        }
+        tmp_path = parquet_path.with_name(
+            f"{parquet_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        df.write_parquet(tmp_path)
+        with self._lock:
+            os.replace(tmp_path, parquet_path)
+            self._write_text(meta_path, json.dumps(meta))
+        return parquet_path
+
+    def _paths(self, key: SheetKey) -> Tuple[Path, Path]:
+        parts = [
+            key.fingerprint.path,
+            key.sheet_name,
+            key.has_header,
+            key.infer_schema_length,
+            key.engine,
+        ]
+        if key.schema_overrides or key.schema_inference != "head":
+            # Appended only when set, so existing sidecars keep their names
+            parts += [key.schema_overrides, key.schema_inference]
+        identity = json.dumps(parts)
+        stem = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        return self.cache_dir / f"{stem}.parquet", self.cache_dir / f"{stem}.json"
+
+    @staticmethod
+    def _write_text(path: Path, text: str) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _discard(*paths: Path) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+sidecar_store: Optional[SidecarStore] = (
+    SidecarStore(config.sidecar_dir()) if config.sidecar_dir() else None
+)
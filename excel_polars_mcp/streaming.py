@@ -0,0 +1,164 @@
+"""Bounded-memory, batch-at-a-time reading of large .xlsx sheets."""
+
+from __future__ import annotations
+
+import datetime
+import sys
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from excel_polars_mcp.lazy import polars as pl
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Page size of streaming reads that give no limit; an unbounded page would
+# hold the whole sheet in memory
+DEFAULT_PAGE_ROWS = 10_000
+
+
+def _column_names(header: Sequence[Any], width: int) -> List[str]:
+    """Build unique column names from a header row, filling blanks."""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for idx in range(width):
+        value = header[idx] if idx < len(header) else None
+        name = str(value) if value is not None else f"column_{idx + 1}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_duplicated_{seen[name] - 1}"
+        else:
+            seen[name] = 1
+        names.append(name)
+    return names
+
+
+def _batch_frame(rows: List[Tuple[Any, ...]], names: List[str]) -> pl.DataFrame:
+    width = len(names)
+    padded = [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+    return pl.DataFrame(
+        padded, schema=names, orient="row", strict=False, infer_schema_length=None
+    )
+
+
+def _first_batch_dtype(values: pl.Series) -> pl.DataType:
+    """Dtype a column takes from its first batch, as in a calamine eager read."""
+    if values.dtype == pl.Null:
+        return pl.String()
+    if values.dtype == pl.Datetime:
+        # openpyxl returns date cells as datetimes; calamine types a column
+        # whose cells are all at midnight as Date, and others in milliseconds
+        if (values.drop_nulls().dt.time() == datetime.time(0)).all():
+            return pl.Date()
+        return pl.Datetime("ms")
+    return values.dtype
+
+
+def _conform_dtypes(
+    batch: pl.DataFrame,
+    schema: Dict[str, Any],
+    overrides: Optional[Mapping[str, pl.DataType]] = None,
+) -> pl.DataFrame:
+    """
+    Cast ``batch`` to the dtypes of the batches before it, updating ``schema``.
+
+    The first batch fixes each column's dtype (see ``_first_batch_dtype``),
+    so filters see the same dtypes in every batch, as in eager reads where
+    the first rows decide. An integer column widens to Float64 when a
+    later batch holds decimals; other values that do not fit become null.
+    Columns in ``overrides`` always take the given dtype.
+    """
+    casts = {}
+    for name, dtype in batch.schema.items():
+        fixed = schema.get(name)
+        if overrides and name in overrides:
+            fixed = overrides[name]
+        elif fixed is None:
+            fixed = _first_batch_dtype(batch[name])
+        elif fixed.is_integer() and dtype.is_float():
+            fixed = pl.Float64()
+        schema[name] = fixed
+        if dtype != fixed:
+            casts[name] = fixed
+    return batch.cast(casts, strict=False) if casts else batch
+
+
+def iter_sheet_batches(
+    file_path: Union[str, Path],
+    sheet_name: Optional[str] = None,
+    batch_size: int = 10_000,
+    has_header: bool = True,
+    schema_overrides: Optional[Mapping[str, pl.DataType]] = None,
+) -> Iterator[pl.DataFrame]:
+    """
+    Yield a sheet as DataFrames of at most ``batch_size`` rows.
+
+    Rows are pulled from openpyxl's read-only ``iter_rows``, so only the
+    current batch is held in memory regardless of sheet size. Dtypes are
+    inferred from the first batch and later batches are cast to them (see
+    ``_conform_dtypes``); since an integer column may widen to Float64,
+    combine batches with ``how="vertical_relaxed"``.
+    Entirely empty rows are skipped, matching ``pl.read_excel``.
+
+    Args:
+        file_path: Path to the .xlsx file
+        sheet_name: Sheet to read; None reads the first sheet
+        batch_size: Maximum rows per yielded DataFrame
+        has_header: Whether the first non-empty row holds column names
+        schema_overrides: Dtypes every batch casts the named columns to
+    """
+    from openpyxl import load_workbook
+
+    if Path(file_path).suffix.lower() != ".xlsx":
+        raise ValueError("Streaming reads support .xlsx files only")
+
+    workbook = load_workbook(filename=str(file_path), read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        names: Optional[List[str]] = None
+        schema: Dict[str, Any] = {}
+        batch: List[Tuple[Any, ...]] = []
+        for row in worksheet.iter_rows(values_only=True):
+            if all(value is None for value in row):
+                continue
+            if names is None:
+                width = worksheet.max_column or len(row)
+                if has_header:
+                    names = _column_names(row, max(width, len(row)))
+                    continue
+                names = [f"column_{idx + 1}" for idx in range(max(width, len(row)))]
+            batch.append(row)
+            if len(batch) >= batch_size:
+                frame = _batch_frame(batch, names)
+                yield _conform_dtypes(frame, schema, schema_overrides)
+                batch = []
+        if batch and names is not None:
+            frame = _batch_frame(batch, names)
+            yield _conform_dtypes(frame, schema, schema_overrides)
+    finally:
+        workbook.close()
+
+
+def process_peak_rss_bytes() -> Optional[int]:
+    """
+    Peak resident set size of this process since it started, in bytes.
+
+    This is the process-wide high-water mark, not the usage of one call.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
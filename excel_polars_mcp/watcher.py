@@ -0,0 +1,163 @@
+"""Background prewarming of workbooks dropped into watched directories."""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from excel_polars_mcp import config
+from excel_polars_mcp.reader import prewarm_workbook
+
+WATCHED_SUFFIXES = (".xlsx", ".xls")
+
+# Nice value added to the watcher thread, below interactive tool calls
+WATCH_NICENESS = 10
+
+# (mtime_ns, size) of a file as last seen
+_Signature = Tuple[int, int]
+
+
+def _lower_thread_priority() -> None:
+    """Raise the calling thread's nice value where the OS allows per thread."""
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        tid = threading.get_native_id()
+        niceness = os.getpriority(os.PRIO_PROCESS, tid) + WATCH_NICENESS
+        os.setpriority(os.PRIO_PROCESS, tid, niceness)
+    except (AttributeError, OSError):
+        pass
+
+
+class DirectoryWatcher:
+    """
+    Poll directories for new or modified workbooks and prewarm their caches.
+
+    Polling needs no extra dependency and works on network shares, where
+    inotify events are unreliable. A workbook is prewarmed once its mtime
+    and size are unchanged across two consecutive scans, so a file still
+    being copied in is not parsed half-written; Excel's ``~$`` lock files
+    are ignored. Workbooks are prewarmed one at a time in a single daemon
+    thread with a raised nice value (on Linux), and a workbook that fails is
+    not retried until it changes.
+    """
+
+    def __init__(
+        self, directories: Sequence[Union[str, Path]], interval: float = 5.0
+    ) -> None:
+        self.directories = [Path(directory) for directory in directories]
+        self.interval = interval
+        self.warmed_files = 0
+        self.failed_files = 0
+        self.last_error: Optional[str] = None
+        self.last_scan: Optional[float] = None
+        self._pending: Dict[str, _Signature] = {}
+        self._done: Dict[str, _Signature] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def scan(self) -> Dict[str, _Signature]:
+        """Return the signature of every workbook under the directories."""
+        found: Dict[str, _Signature] = {}
+        for directory in self.directories:
+            for path in directory.rglob("*"):
+                if path.suffix.lower() not in WATCHED_SUFFIXES:
+                    continue
+                if path.name.startswith("~$"):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if path.is_file():
+                    found[str(path.resolve())] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def poll(self) -> List[str]:
+        """
+        Scan once and prewarm the workbooks that have settled since last time.
+
+        Returns:
+            Paths of the workbooks prewarmed by this call
+        """
+        found = self.scan()
+        self.last_scan = time.time()
+        ready = [
+            path
+            for path, signature in found.items()
+            if self._done.get(path) != signature
+            and self._pending.get(path) == signature
+        ]
+        self._pending = {
+            path: signature
+            for path, signature in found.items()
+            if self._done.get(path) != signature and path not in ready
+        }
+        # Forget deleted workbooks, so one recreated with the same signature
+        # is prewarmed again
+        self._done = {path: sig for path, sig in self._done.items() if path in found}
+
+        warmed: List[str] = []
+        for path in ready:
+            if self._stop.is_set():
+                self._pending[path] = found[path]
+                continue
+            try:
+                prewarm_workbook(path)
+            except Exception as exc:
+                self.failed_files += 1
+                self.last_error = f"{path}: {exc}"
+            else:
+                self.warmed_files += 1
+                warmed.append(path)
+            self._done[path] = found[path]
+        return warmed
+
+    def start(self) -> None:
+        """Poll every ``interval`` seconds in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="excel-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling once the workbook being prewarmed is done."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the watched directories and prewarming counters."""
+        return {
+            "directories": [str(directory) for directory in self.directories],
+            "interval": self.interval,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "last_scan": self.last_scan,
+            "pending_files": len(self._pending),
+            "warmed_files": self.warmed_files,
+            "failed_files": self.failed_files,
+            "last_error": self.last_error,
+        }
+
+    def _run(self) -> None:
+        _lower_thread_priority()
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as exc:
+                # A vanished or unreadable directory must not end the watch
+                self.last_error = str(exc)
+            self._stop.wait(self.interval)
+
+
+directory_watcher: Optional[DirectoryWatcher] = (
+    DirectoryWatcher(config.watch_dirs(), config.watch_interval())
+    if config.watch_dirs()
+    else None
+)
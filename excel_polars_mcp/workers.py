@@ -0,0 +1,97 @@
+"""Bounded worker pool for blocking parse and serialization work."""
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from excel_polars_mcp import config, profiling
+
+T = TypeVar("T")
+
+
+class PoolBusyError(RuntimeError):
+    """Raised when a call would exceed the pool's queue depth."""
+
+
+class WorkerPool:
+    """
+    Run blocking callables off the event loop with a concurrency limit.
+
+    At most ``max_workers`` calls execute at once and at most ``max_queue``
+    more may wait for a free worker; further calls fail fast with
+    PoolBusyError instead of piling up behind a slow workbook.
+
+    ``kind="process"`` uses a spawn-based process pool, so callables and
+    their arguments must be picklable module-level objects. Each process
+    then keeps its own parsed-sheet cache: a page served by another worker
+    re-parses the sheet, and cache hits are not visible to the server. Thread workers
+    run in a copy of the caller's context so context variables propagate,
+    and are profiled when the calling tool is (see ``profiling``).
+    """
+
+    def __init__(
+        self, max_workers: int, max_queue: int = 0, kind: str = "thread"
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.kind = kind
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Execute ``fn(*args, **kwargs)`` in the pool and await its result."""
+        if self._in_flight >= self.max_workers + self.max_queue:
+            raise PoolBusyError(
+                f"Server busy: {self._in_flight} calls in flight "
+                f"(limit {self.max_workers} running + {self.max_queue} queued)"
+            )
+        self._in_flight += 1
+        try:
+            call = functools.partial(fn, *args, **kwargs)
+            if self.kind == "thread":
+                call = profiling.wrap_worker_call(call)
+                call = functools.partial(contextvars.copy_context().run, call)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), call)
+        finally:
+            self._in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the pool configuration and the number of calls in flight."""
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the underlying executor, waiting for running calls."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="excel-worker"
+                )
+        return self._executor
+
+
+worker_pool = WorkerPool(
+    max_workers=config.worker_count(),
+    max_queue=config.worker_max_queue(),
+    kind=config.worker_kind(),
+)
@@ -0,0 +1,60 @@
+"""Shared fixtures for the test suite."""
+
+import os
+from pathlib import Path
+from typing import Callable, Dict
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import schemas
+from excel_polars_mcp.cache import sheet_cache
+from excel_polars_mcp.engines import reset_calibration
+from excel_polars_mcp.schemas import SchemaStore
+
+
+@pytest.fixture(scope="session", autouse=True)
+def engine_calibration_file(tmp_path_factory):
+    """Keep engine calibration results out of the user's cache directory."""
+    path = tmp_path_factory.mktemp("engines") / "engine_calibration.json"
+    previous = os.environ.get("EXCEL_POLARS_MCP_ENGINE_CALIBRATION")
+    os.environ["EXCEL_POLARS_MCP_ENGINE_CALIBRATION"] = str(path)
+    reset_calibration()
+    yield path
+    if previous is None:
+        del os.environ["EXCEL_POLARS_MCP_ENGINE_CALIBRATION"]
+    else:
+        os.environ["EXCEL_POLARS_MCP_ENGINE_CALIBRATION"] = previous
+    reset_calibration()
+
+
+@pytest.fixture(autouse=True)
+def schema_store(tmp_path, monkeypatch) -> SchemaStore:
+    """Give every test its own empty schema cache directory."""
+    store = SchemaStore(tmp_path / "schemas")
+    monkeypatch.setattr(schemas, "schema_store", store)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def clear_sheet_cache():
+    """Give every test an empty parsed-sheet cache."""
+    sheet_cache.clear()
+    yield
+    sheet_cache.clear()
+
+
+@pytest.fixture
+def make_workbook(tmp_path: Path) -> Callable[..., str]:
+    """Factory writing a multi-sheet workbook and returning its path."""
+
+    def _make(sheets: Dict[str, pl.DataFrame], name: str = "book.xlsx") -> str:
+        import xlsxwriter
+
+        path = tmp_path / name
+        with xlsxwriter.Workbook(path) as workbook:
+            for sheet_name, df in sheets.items():
+                df.write_excel(workbook, worksheet=sheet_name)
+        return str(path)
+
+    return _make
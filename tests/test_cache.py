@@ -0,0 +1,75 @@
+"""Tests for the parsed-sheet cache."""
+
+import os
+
+import polars as pl
+
+from excel_polars_mcp.cache import SheetCache, SheetKey, file_fingerprint, sheet_cache
+from excel_polars_mcp.reader import load_sheet
+
+
+def _key(name: str) -> SheetKey:
+    return SheetKey(file_fingerprint(__file__), name, True, 100)
+
+
+def test_lru_eviction_respects_budget():
+    """Least-recently-used frames are evicted once the budget is exceeded."""
+    df = pl.DataFrame({"x": list(range(1000))})
+    size = df.estimated_size()
+    cache = SheetCache(max_bytes=size * 2)
+
+    cache.put(_key("a"), df)
+    cache.put(_key("b"), df)
+    assert cache.get(_key("a")) is not None  # "a" becomes most recent
+    cache.put(_key("c"), df)
+
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) is not None
+    assert cache.get(_key("c")) is not None
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= stats["max_bytes"]
+    assert stats["evictions"] == 1
+
+
+def test_zero_budget_disables_cache():
+    """A zero budget never stores anything."""
+    cache = SheetCache(max_bytes=0)
+    cache.put(_key("a"), pl.DataFrame({"x": [1]}))
+    assert cache.get(_key("a")) is None
+
+
+def test_load_sheet_hits_cache(make_workbook):
+    """Repeat reads of an unchanged sheet are served from the cache."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3]})})
+
+    first = load_sheet(path, sheet_name="Data")
+    second = load_sheet(path, sheet_name="Data")
+
+    assert first is second
+    assert sheet_cache.stats()["hits"] == 1
+    assert sheet_cache.stats()["misses"] == 1
+
+
+def test_default_sheet_shares_first_sheet_entry(make_workbook):
+    """Omitting sheet_name reuses the entry of the first sheet, by name."""
+    path = make_workbook({
+        "First": pl.DataFrame({"a": [1]}),
+        "Second": pl.DataFrame({"b": [2]}),
+    })
+
+    assert load_sheet(path) is load_sheet(path, sheet_name="First")
+    assert sheet_cache.stats()["entries"] == 1
+
+
+def test_load_sheet_invalidates_on_modification(make_workbook):
+    """Rewriting the workbook changes the fingerprint and forces a re-parse."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3]})})
+    assert load_sheet(path, sheet_name="Data").height == 3
+
+    make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3, 4]})})
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_sheet(path, sheet_name="Data").height == 4
+    assert sheet_cache.stats()["misses"] == 2
@@ -0,0 +1,100 @@
+"""Tests for incremental conversion in examples/convert_actuarial_data.py."""
+
+import sys
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "examples"))
+
+import convert_actuarial_data as convert  # noqa: E402
+
+POLICIES = pl.DataFrame({"Policy_ID": ["P1", "P2"], "Face_Amount": [100, 200]})
+CLAIMS = pl.DataFrame({"Claim_ID": ["C1"], "Claim_Amount": [1000]})
+
+
+@pytest.fixture
+def workbook(make_workbook):
+    """Two-sheet workbook converted once into an output directory."""
+    path = make_workbook({"Policies": POLICIES, "Claims": CLAIMS})
+    output_dir = Path(path).parent / "out"
+    convert.convert_excel_to_polars(path, str(output_dir))
+    return path, output_dir
+
+
+def _outputs(output_dir: Path) -> dict:
+    """(size, mtime_ns) of every per-sheet output file."""
+    return {
+        path.name: (path.stat().st_size, path.stat().st_mtime_ns)
+        for path in output_dir.iterdir()
+        if path.name not in (convert.MANIFEST_NAME, "conversion_summary.md")
+    }
+
+
+def _forbid_excel_reads(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Workbook was read")
+
+    monkeypatch.setattr(convert.pl, "read_excel", fail)
+
+
+def test_unchanged_rerun_writes_nothing(workbook, monkeypatch):
+    """A second run over an unchanged workbook neither reads nor writes."""
+    path, output_dir = workbook
+    before = _outputs(output_dir)
+    assert len(before) == 8
+
+    _forbid_excel_reads(monkeypatch)
+    timings = convert.convert_excel_to_polars(path, str(output_dir))
+
+    assert timings["unchanged"] == ["Policies", "Claims"]
+    assert _outputs(output_dir) == before
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_stale_outputs_are_rewritten(workbook, workers):
+    """Only deleted or modified outputs are rewritten, in either pool mode."""
+    path, output_dir = workbook
+    before = _outputs(output_dir)
+    original_json = (output_dir / "claims.json").read_text()
+    (output_dir / "policies.csv").unlink()
+    (output_dir / "claims.json").write_text("{}")
+    touched = {"policies.csv", "claims.json"}
+
+    convert.convert_excel_to_polars(path, str(output_dir), workers=workers)
+
+    after = _outputs(output_dir)
+    assert set(after) == set(before)
+    assert {name: after[name] for name in before if name not in touched} == {
+        name: before[name] for name in before if name not in touched
+    }
+    assert pl.read_csv(output_dir / "policies.csv").equals(POLICIES)
+    assert (output_dir / "claims.json").read_text() == original_json
+
+
+def test_changed_sheet_is_reconverted(workbook, make_workbook):
+    """After a workbook edit, only sheets whose content changed are rewritten."""
+    path, output_dir = workbook
+    before = _outputs(output_dir)
+    policies = POLICIES.with_columns(pl.col("Face_Amount") * 2)
+    make_workbook({"Policies": policies, "Claims": CLAIMS})
+
+    timings = convert.convert_excel_to_polars(path, str(output_dir))
+
+    assert timings["unchanged"] == ["Claims"]
+    after = _outputs(output_dir)
+    claims_files = [name for name in before if name.startswith("claims")]
+    assert {name: after[name] for name in claims_files} == {
+        name: before[name] for name in claims_files
+    }
+    assert pl.read_parquet(output_dir / "policies.parquet").equals(policies)
+
+
+def test_force_rewrites_everything(workbook):
+    """force ignores the manifest and rereads the workbook."""
+    path, output_dir = workbook
+    timings = convert.convert_excel_to_polars(path, str(output_dir), force=True)
+
+    assert timings["unchanged"] == []
+    assert set(timings["sheets"]["Policies"]) >= {"Read", "Parquet", "Write"}
@@ -0,0 +1,68 @@
+"""Tests for Excel engine selection."""
+
+import json
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import engines
+from excel_polars_mcp.engines import resolve_engine
+from excel_polars_mcp.server import ReadExcelArgs, read_excel
+
+
+@pytest.fixture
+def data_file(make_workbook):
+    """Workbook with one small sheet."""
+    return make_workbook({"Data": pl.DataFrame({"a": [1, 2], "b": ["x", "y"]})})
+
+
+def test_explicit_engine_validation(data_file, tmp_path):
+    """Explicit engines are checked for existence and file-type support."""
+    assert resolve_engine("openpyxl", data_file) == "openpyxl"
+    with pytest.raises(ValueError, match="Unknown engine"):
+        resolve_engine("pandas", data_file)
+
+    xls_file = tmp_path / "legacy.xls"
+    xls_file.write_bytes(b"")
+    assert resolve_engine("auto", xls_file) == "calamine"
+    with pytest.raises(ValueError, match="cannot read .xls"):
+        resolve_engine("openpyxl", xls_file)
+
+
+def test_auto_picks_fastest_calibrated_engine(data_file, monkeypatch):
+    """Auto mode follows the calibration timings for the size bucket."""
+    monkeypatch.setattr(
+        engines, "_calibration", {"small": {"calamine": 0.5, "openpyxl": 0.1}}
+    )
+    assert resolve_engine("auto", data_file) == "openpyxl"
+
+
+def test_calibration_is_cached_on_disk(data_file, monkeypatch, tmp_path):
+    """A stored calibration is reused instead of re-running the benchmark."""
+    path = tmp_path / "calibration.json"
+    monkeypatch.setenv("EXCEL_POLARS_MCP_ENGINE_CALIBRATION", str(path))
+    monkeypatch.setattr(engines, "_calibration", None)
+    runs = []
+
+    def fake_calibrate():
+        runs.append(1)
+        return {"small": {"calamine": 0.01, "openpyxl": 0.2}}
+
+    monkeypatch.setattr(engines, "calibrate", fake_calibrate)
+
+    assert resolve_engine("auto", data_file) == "calamine"
+    assert json.loads(path.read_text())["timings"]["small"]["calamine"] == 0.01
+
+    engines.reset_calibration()
+    assert resolve_engine("auto", data_file) == "calamine"
+    assert len(runs) == 1
+
+
+@pytest.mark.asyncio
+async def test_read_excel_with_explicit_engine(data_file):
+    """The chosen engine is used and reported."""
+    result = await read_excel(ReadExcelArgs(file_path=data_file, engine="openpyxl"))
+
+    assert result["success"] is True
+    assert result["engine"] == "openpyxl"
+    assert result["data"] == {"a": [1, 2], "b": ["x", "y"]}
@@ -0,0 +1,123 @@
+"""Tests for column projection and row filters."""
+
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp.filters import FilterCondition, build_filter_expr
+from excel_polars_mcp.server import (
+    FilterRowsArgs,
+    ReadExcelArgs,
+    ReadExcelSheetArgs,
+    filter_rows,
+    read_excel,
+    read_excel_sheet,
+)
+
+
+@pytest.fixture
+def policies_file(make_workbook):
+    """Workbook with a small policies sheet."""
+    df = pl.DataFrame({
+        "Policy_ID": ["P1", "P2", "P3", "P4"],
+        "Policy_Type": ["Term Life", "Annuity", "Term Life", "Endowment"],
+        "Face_Amount": [100000, 250000, 500000, 750000],
+        "Annual_Premium": [500, 1200, 2400, 3000],
+    })
+    return make_workbook({"Policies": df})
+
+
+@pytest.mark.asyncio
+async def test_columns_projection(policies_file):
+    """Only the requested columns are returned, in the requested order."""
+    args = ReadExcelArgs(
+        file_path=policies_file, columns=["Annual_Premium", "Policy_Type"]
+    )
+    result = await read_excel(args)
+
+    assert result["success"] is True
+    assert result["columns"] == ["Annual_Premium", "Policy_Type"]
+    assert result["shape"] == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_filter_on_unprojected_column(policies_file):
+    """Filters may reference columns that are not returned."""
+    args = ReadExcelArgs(
+        file_path=policies_file,
+        columns=["Policy_ID"],
+        filter=[
+            FilterCondition(column="Policy_Type", op="eq", value="Term Life"),
+            FilterCondition(column="Face_Amount", op="gt", value=200000),
+        ],
+    )
+    result = await read_excel(args)
+
+    assert result["success"] is True
+    assert result["data"] == {"Policy_ID": ["P3"]}
+    assert result["total_rows"] == 1
+
+
+def test_build_filter_expr_ops():
+    """Each supported operator compiles to the expected predicate."""
+    df = pl.DataFrame({"x": [1, 2, None], "s": ["ab", "bc", "cd"]})
+
+    def rows(*conditions):
+        return df.filter(build_filter_expr(list(conditions))).height
+
+    assert build_filter_expr(None) is None
+    assert rows(FilterCondition(column="x", op="in", value=[1, 2])) == 2
+    assert rows(FilterCondition(column="x", op="is_null")) == 1
+    assert rows(FilterCondition(column="s", op="contains", value="c")) == 2
+    assert rows(FilterCondition(column="s", op="starts_with", value="b")) == 1
+    with pytest.raises(ValueError):
+        build_filter_expr([FilterCondition(column="x", op="in", value=1)])
+
+
+def test_temporal_values_are_parsed():
+    """ISO strings compare against date, datetime and time columns."""
+    df = pl.DataFrame({
+        "d": [date(2020, 1, 10), date(2020, 2, 10)],
+        "t": [datetime(2020, 1, 10, 9), datetime(2020, 1, 10, 17)],
+    }).with_columns(pl.col("t").dt.cast_time_unit("ms"), hour=pl.col("t").dt.time())
+
+    def rows(*conditions):
+        return df.filter(build_filter_expr(list(conditions), df.schema)).height
+
+    assert rows(FilterCondition(column="d", op="gt", value="2020-01-20")) == 1
+    assert rows(FilterCondition(column="d", op="in", value=["2020-02-10"])) == 1
+    assert rows(FilterCondition(column="t", op="lt", value="2020-01-10 12:00:00")) == 1
+    assert rows(FilterCondition(column="hour", op="ge", value="09:00:00")) == 2
+    with pytest.raises(ValueError, match="not a valid Date"):
+        build_filter_expr(
+            [FilterCondition(column="d", op="eq", value="soon")], df.schema
+        )
+
+
+@pytest.mark.asyncio
+async def test_date_range_filter(make_workbook):
+    """Date ranges work in eager and streaming reads and in filter_rows."""
+    path = make_workbook({
+        "Claims": pl.DataFrame({
+            "Claim_ID": ["C1", "C2", "C3"],
+            "Claim_Date": [date(2020, 1, 10), date(2020, 1, 25), date(2020, 3, 1)],
+        })
+    })
+    conditions = [
+        FilterCondition(column="Claim_Date", op="gt", value="2020-01-20"),
+        FilterCondition(column="Claim_Date", op="lt", value="2020-02-01"),
+    ]
+
+    eager = await read_excel(ReadExcelArgs(file_path=path, filter=conditions))
+    streamed = await read_excel_sheet(
+        ReadExcelSheetArgs(
+            file_path=path, sheet_name="Claims", filter=conditions, mode="streaming"
+        )
+    )
+    planned = await filter_rows(
+        FilterRowsArgs(file_path=path, sheet_name="Claims", filter=conditions)
+    )
+
+    for result in (eager, streamed, planned):
+        assert result["data"]["Claim_ID"] == ["C2"]
@@ -0,0 +1,116 @@
+"""Tests for per-tool metrics."""
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import metrics, server
+from excel_polars_mcp.metrics import Histogram, MetricsRegistry
+from excel_polars_mcp.server import (
+    ReadExcelArgs,
+    ServerStatsArgs,
+    read_excel,
+    server_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def registry(tmp_path, monkeypatch) -> MetricsRegistry:
+    """Record into a fresh registry that also writes a Prometheus file."""
+    fresh = MetricsRegistry(str(tmp_path / "metrics.prom"))
+    monkeypatch.setattr(metrics, "registry", fresh)
+    monkeypatch.setattr("excel_polars_mcp.server.registry", fresh)
+    return fresh
+
+
+def test_histogram_quantiles():
+    """Quantiles interpolate within buckets and never exceed the maximum."""
+    histogram = Histogram([1.0, 2.0, 4.0])
+    assert histogram.quantile(0.5) is None
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 0]
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.quantile(0.99) == 3.0
+    histogram.observe(100.0)
+    assert histogram.summary()["max"] == 100.0
+    assert histogram.quantile(1.0) == 100.0
+
+
+def test_histogram_quantiles_not_below_minimum():
+    """Estimates in the first bucket never fall below the smallest value."""
+    histogram = Histogram([1.0, 10.0])
+    for _ in range(20):
+        histogram.observe(1.0)
+
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(0.95) == 1.0
+    assert histogram.summary()["min"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_recorded(make_workbook, registry, tmp_path):
+    """Latency, phases, rows, bytes, cache hits and errors are all captured."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3]})})
+
+    await read_excel(ReadExcelArgs(file_path=path))
+    await read_excel(ReadExcelArgs(file_path=path, limit=2))
+    await read_excel(ReadExcelArgs(file_path=str(tmp_path / "missing.xlsx")))
+
+    stats = (await server_stats(ServerStatsArgs()))["tools"]["read_excel"]
+    assert stats["calls"] == 3
+    assert stats["errors"] == 1
+    assert stats["cache_hits"] >= 1 and stats["cache_misses"] >= 1
+    assert stats["latency_seconds"]["count"] == 3
+    assert stats["parse_seconds"]["count"] == 2
+    assert stats["serialize_seconds"]["count"] == 2
+    assert stats["rows"]["sum"] == 5
+    assert stats["payload_bytes"]["count"] == 2
+    # Small JSON frames are measured exactly: {"a":[1,2,3]} and {"a":[1,2]}
+    assert stats["payload_bytes"]["sum"] == 13 + 11
+
+    text = (tmp_path / "metrics.prom").read_text()
+    assert 'excel_polars_mcp_tool_calls_total{tool="read_excel"}' in text
+    assert 'excel_polars_mcp_tool_rows_bucket{tool="read_excel",le="+Inf"}' in text
+
+
+@pytest.mark.asyncio
+async def test_server_stats_reset(make_workbook, registry):
+    """reset returns the current metrics, then clears them."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1]})})
+    await read_excel(ReadExcelArgs(file_path=path))
+
+    result = await server_stats(ServerStatsArgs(reset=True))
+    assert result["success"] is True
+    assert result["tools"]["read_excel"]["calls"] == 1
+    assert "sheet_cache" in result and "worker_pool" in result
+    assert (await server_stats(ServerStatsArgs()))["tools"] == {}
+
+
+def test_prometheus_text_format(registry):
+    """Histogram buckets are cumulative and end with +Inf, _sum and _count."""
+    record = metrics.CallRecord()
+    record.phases["parse"] = 0.02
+    registry.observe("read_excel", record, 0.03, False, 10, 2048)
+    registry.observe("read_excel", record, 120.0, False, 10, 2048)
+
+    lines = registry.prometheus_text().splitlines()
+    name = "excel_polars_mcp_tool_latency_seconds"
+    assert "# TYPE excel_polars_mcp_tool_latency_seconds histogram" in lines
+    assert f'{name}_bucket{{tool="read_excel",le="0.05"}} 1' in lines
+    assert f'{name}_bucket{{tool="read_excel",le="+Inf"}} 2' in lines
+    assert f'{name}_count{{tool="read_excel"}} 2' in lines
+
+
+@pytest.mark.asyncio
+async def test_process_pool_omits_cache_metrics(tmp_path, monkeypatch):
+    """Per-worker caches are not reported as if they were the server's."""
+    fresh = MetricsRegistry(str(tmp_path / "metrics.prom"), cache_metrics=False)
+    monkeypatch.setattr("excel_polars_mcp.server.registry", fresh)
+    monkeypatch.setattr(server.worker_pool, "kind", "process")
+    fresh.observe("read_excel", metrics.CallRecord(), 0.01, False, 1, 10)
+
+    result = await server_stats(ServerStatsArgs())
+    assert result["sheet_cache"] is None
+    assert "cache_hits" not in result["tools"]["read_excel"]
+    assert "cache_hits" not in fresh.prometheus_text()
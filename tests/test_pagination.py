@@ -0,0 +1,76 @@
+"""Tests for paged sheet reads."""
+
+import os
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp.cache import sheet_cache
+from excel_polars_mcp.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from excel_polars_mcp.server import ReadExcelSheetArgs, read_excel_sheet
+
+
+@pytest.fixture
+def numbers_file(make_workbook):
+    """Workbook with a single 25-row sheet."""
+    return make_workbook({"Numbers": pl.DataFrame({"n": list(range(25))})})
+
+
+@pytest.mark.asyncio
+async def test_cursor_walks_every_page(numbers_file):
+    """Following next_cursor returns every row exactly once and parses once."""
+    args = ReadExcelSheetArgs(file_path=numbers_file, sheet_name="Numbers", limit=10)
+    seen = []
+    pages = 0
+    while True:
+        result = await read_excel_sheet(args)
+        assert result["success"] is True
+        assert result["total_rows"] == 25
+        seen.extend(result["data"]["n"])
+        pages += 1
+        if result["next_cursor"] is None:
+            break
+        args = ReadExcelSheetArgs(
+            file_path=numbers_file, sheet_name="Numbers", cursor=result["next_cursor"]
+        )
+
+    assert pages == 3
+    assert seen == list(range(25))
+    assert sheet_cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_offset_and_limit_window(numbers_file):
+    """An explicit offset/limit returns that window only."""
+    args = ReadExcelSheetArgs(
+        file_path=numbers_file, sheet_name="Numbers", offset=20, limit=10
+    )
+    result = await read_excel_sheet(args)
+
+    assert result["data"]["n"] == [20, 21, 22, 23, 24]
+    assert result["shape"] == (5, 1)
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_cursor_rejected_after_file_changes(numbers_file):
+    """A cursor issued before the workbook changed is refused."""
+    args = ReadExcelSheetArgs(file_path=numbers_file, sheet_name="Numbers", limit=10)
+    first = await read_excel_sheet(args)
+
+    stat = os.stat(numbers_file)
+    os.utime(numbers_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    args = ReadExcelSheetArgs(
+        file_path=numbers_file, sheet_name="Numbers", cursor=first["next_cursor"]
+    )
+    result = await read_excel_sheet(args)
+    assert "error" in result
+    assert "Cursor" in result["error"]
+
+
+def test_decode_rejects_garbage():
+    """Malformed tokens raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor", "digest")
+    assert decode_cursor(encode_cursor("digest", 5, 2), "digest") == (5, 2)
@@ -0,0 +1,152 @@
+"""Tests for the declarative aggregate, filter and join tools."""
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp.filters import FilterCondition
+from excel_polars_mcp.plans import Aggregation, ComputedColumn, SortKey
+from excel_polars_mcp.server import (
+    AggregateArgs,
+    FilterRowsArgs,
+    JoinSheetsArgs,
+    aggregate,
+    filter_rows,
+    join_sheets,
+)
+
+
+@pytest.fixture
+def actuarial_file(make_workbook):
+    """Workbook with policies and claims sheets."""
+    return make_workbook({
+        "Policies": pl.DataFrame({
+            "Policy_ID": ["P1", "P2", "P3", "P4"],
+            "Policy_Type": ["Term Life", "Annuity", "Term Life", "Annuity"],
+            "Face_Amount": [100000, 200000, 400000, 800000],
+            "Annual_Premium": [500, 1000, 1200, 4000],
+        }),
+        "Claims": pl.DataFrame({
+            "Claim_ID": ["C1", "C2", "C3"],
+            "Policy_ID": ["P1", "P3", "P4"],
+            "Claim_Amount": [10000, 450000, 80000],
+        }),
+    })
+
+
+@pytest.mark.asyncio
+async def test_aggregate_group_by_with_computed_columns(actuarial_file):
+    """Group counts, means and a row-level premium rate, sorted."""
+    result = await aggregate(AggregateArgs(
+        file_path=actuarial_file,
+        sheet_name="Policies",
+        compute=[
+            ComputedColumn(
+                name="rate",
+                left="Annual_Premium",
+                op="div",
+                right="Face_Amount",
+                scale=1000,
+            )
+        ],
+        group_by=["Policy_Type"],
+        aggregations=[
+            Aggregation(func="count"),
+            Aggregation(func="mean", column="Face_Amount", alias="avg_face"),
+            Aggregation(func="mean", column="rate", round=2),
+        ],
+        sort=[SortKey(column="Policy_Type")],
+    ))
+
+    assert result["success"] is True
+    assert result["data"] == {
+        "Policy_Type": ["Annuity", "Term Life"],
+        "count": [2, 2],
+        "avg_face": [500000.0, 250000.0],
+        "rate_mean": [5.0, 4.0],
+    }
+
+
+@pytest.mark.asyncio
+async def test_aggregate_filter_without_groups(actuarial_file):
+    """Without group_by a single summary row is returned."""
+    result = await aggregate(AggregateArgs(
+        file_path=actuarial_file,
+        sheet_name="Claims",
+        filter=[FilterCondition(column="Claim_Amount", op="gt", value=50000)],
+        aggregations=[
+            Aggregation(func="count"),
+            Aggregation(func="sum", column="Claim_Amount"),
+        ],
+    ))
+
+    assert result["data"] == {"count": [2], "Claim_Amount_sum": [530000]}
+
+
+@pytest.mark.asyncio
+async def test_filter_rows_sorted_and_limited(actuarial_file):
+    """Matching rows are projected, sorted and cut at limit."""
+    result = await filter_rows(FilterRowsArgs(
+        file_path=actuarial_file,
+        sheet_name="Policies",
+        filter=[FilterCondition(column="Face_Amount", op="ge", value=200000)],
+        columns=["Policy_ID", "Face_Amount"],
+        sort=[SortKey(column="Face_Amount", descending=True)],
+        limit=2,
+    ))
+
+    assert result["data"] == {
+        "Policy_ID": ["P4", "P3"],
+        "Face_Amount": [800000, 400000],
+    }
+    assert result["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_join_sheets_loss_ratio(actuarial_file):
+    """Join claims to policies and derive loss ratios per policy type."""
+    result = await join_sheets(JoinSheetsArgs(
+        file_path=actuarial_file,
+        left_sheet="Policies",
+        right_sheet="Claims",
+        on=["Policy_ID"],
+        group_by=["Policy_Type"],
+        aggregations=[
+            Aggregation(func="sum", column="Claim_Amount", alias="claims"),
+            Aggregation(func="sum", column="Face_Amount", alias="face"),
+        ],
+        derive=[
+            ComputedColumn(
+                name="loss_ratio_percent",
+                left="claims",
+                op="div",
+                right="face",
+                scale=100,
+                round=2,
+            )
+        ],
+        sort=[SortKey(column="loss_ratio_percent", descending=True)],
+    ))
+
+    assert result["success"] is True
+    assert result["data"]["Policy_Type"] == ["Term Life", "Annuity"]
+    assert result["data"]["loss_ratio_percent"] == [92.0, 10.0]
+
+
+@pytest.mark.asyncio
+async def test_join_sheets_requires_keys(actuarial_file):
+    """A join without keys is reported as an error."""
+    result = await join_sheets(JoinSheetsArgs(
+        file_path=actuarial_file, left_sheet="Policies", right_sheet="Claims"
+    ))
+
+    assert "Failed to join sheets" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_aggregate_rejects_column_free_sum(actuarial_file):
+    """Only count may omit its column."""
+    result = await aggregate(AggregateArgs(
+        file_path=actuarial_file, aggregations=[Aggregation(func="sum")]
+    ))
+
+    assert "requires a column" in result["error"]
@@ -0,0 +1,121 @@
+"""Tests for metadata-only sheet probing."""
+
+import struct
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp.probe import probe_sheets
+from excel_polars_mcp.server import ListSheetsArgs, list_sheets
+
+_END_OF_CHAIN = 0xFFFFFFFE
+_FREE = 0xFFFFFFFF
+
+
+def _biff_record(record_type: int, body: bytes) -> bytes:
+    return struct.pack("<HH", record_type, len(body)) + body
+
+
+def _boundsheet(position: int, name: str, state: int = 0) -> bytes:
+    encoded = name.encode("latin-1")
+    return _biff_record(
+        0x0085, struct.pack("<IBBBB", position, state, 0, len(encoded), 0) + encoded
+    )
+
+
+def _workbook_stream(sheets):
+    """Build a BIFF8 Workbook stream for (name, state, rows, cols) tuples."""
+    bof = _biff_record(0x0809, struct.pack("<HH", 0x0600, 0x0005) + b"\0" * 12)
+    eof = _biff_record(0x000A, b"")
+    globals_size = len(bof) + len(eof) + sum(
+        len(_boundsheet(0, name)) for name, *_ in sheets
+    )
+
+    boundsheets = b""
+    substreams = b""
+    for name, state, rows, cols in sheets:
+        boundsheets += _boundsheet(globals_size + len(substreams), name, state)
+        dimensions = _biff_record(0x0200, struct.pack("<IIHHH", 0, rows, 0, cols, 0))
+        substreams += bof + dimensions + eof
+    return bof + boundsheets + eof + substreams
+
+
+def _compound_file(stream: bytes) -> bytes:
+    """Wrap a stream as "Workbook" in a minimal version-3 OLE2 container."""
+    sector = 512
+    stream = stream.ljust(max(4096, -(-len(stream) // sector) * sector), b"\0")
+    stream_sectors = len(stream) // sector
+
+    header = bytearray(512)
+    header[0:8] = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+    struct.pack_into("<HHHHH", header, 0x18, 0x3E, 3, 0xFFFE, 9, 6)
+    struct.pack_into(
+        "<8I", header, 0x2C, 1, 1, 0, 4096, _END_OF_CHAIN, 0, _END_OF_CHAIN, 0
+    )
+    struct.pack_into("<109I", header, 0x4C, 0, *([_FREE] * 108))
+
+    fat = [0xFFFFFFFD, _END_OF_CHAIN]
+    fat += [2 + i + 1 for i in range(stream_sectors - 1)] + [_END_OF_CHAIN]
+    fat += [_FREE] * (128 - len(fat))
+
+    def entry(name: str, kind: int, start: int, size: int) -> bytes:
+        raw = bytearray(128)
+        encoded = (name + "\0").encode("utf-16-le")
+        raw[: len(encoded)] = encoded
+        struct.pack_into("<HBB", raw, 0x40, len(encoded), kind, 1)
+        struct.pack_into("<III", raw, 0x44, _FREE, _FREE, _FREE)
+        struct.pack_into("<II", raw, 0x74, start, size)
+        return bytes(raw)
+
+    directory = entry("Root Entry", 5, _END_OF_CHAIN, 0)
+    directory += entry("Workbook", 2, 2, len(stream))
+    directory = directory.ljust(sector, b"\0")
+
+    return bytes(header) + struct.pack("<128I", *fat) + directory + stream
+
+
+def test_probe_xlsx_dimensions(make_workbook):
+    """Names, order and used-range sizes come from workbook metadata."""
+    path = make_workbook({
+        "Policies": pl.DataFrame({"a": list(range(10)), "b": list(range(10))}),
+        "Claims": pl.DataFrame({"x": [1, 2, 3]}),
+    })
+    sheets = probe_sheets(path)
+
+    assert [s["name"] for s in sheets] == ["Policies", "Claims"]
+    assert (sheets[0]["rows"], sheets[0]["columns"]) == (11, 2)
+    assert (sheets[1]["rows"], sheets[1]["columns"]) == (4, 1)
+    assert sheets[0]["state"] == "visible"
+
+
+def test_probe_xls_reads_biff_directory(tmp_path):
+    """Legacy workbooks list every sheet from BOUNDSHEET/DIMENSIONS records."""
+    path = tmp_path / "legacy.xls"
+    path.write_bytes(
+        _compound_file(
+            _workbook_stream([("Life_Table", 0, 102, 5), ("Hidden", 1, 7, 3)])
+        )
+    )
+    sheets = probe_sheets(path)
+
+    assert [s["name"] for s in sheets] == ["Life_Table", "Hidden"]
+    assert (sheets[0]["rows"], sheets[0]["columns"]) == (102, 5)
+    assert sheets[1]["state"] == "hidden"
+
+
+@pytest.mark.asyncio
+async def test_list_sheets_includes_sheet_info(make_workbook):
+    """list_sheets returns names plus per-sheet dimensions."""
+    path = make_workbook({"Only": pl.DataFrame({"a": [1, 2]})})
+    result = await list_sheets(ListSheetsArgs(file_path=path))
+
+    assert result["sheets"] == ["Only"]
+    assert result["sheet_info"][0]["dimension"] == "A1:A3"
+
+
+def test_probe_rejects_non_compound_xls(tmp_path):
+    """A .xls file without an OLE2 header is reported as invalid."""
+    path = tmp_path / "bogus.xls"
+    path.write_bytes(b"not a workbook")
+    with pytest.raises(ValueError):
+        probe_sheets(path)
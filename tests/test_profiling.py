@@ -0,0 +1,92 @@
+"""Tests for on-demand profiling of tool calls."""
+
+import functools
+import pstats
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import profiling
+from excel_polars_mcp.server import ReadExcelArgs, ReadManyArgs, read_excel, read_many
+
+
+@pytest.fixture(autouse=True)
+def profile_dir(tmp_path, monkeypatch):
+    """Write captures to a temporary directory."""
+    directory = tmp_path / "profiles"
+    monkeypatch.setenv("EXCEL_POLARS_MCP_PROFILE_DIR", str(directory))
+    return directory
+
+
+@pytest.mark.asyncio
+async def test_profile_arg_saves_capture(make_workbook):
+    """A flagged call writes a pstats file and report, and returns as usual."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3]})})
+
+    plain = await read_excel(ReadExcelArgs(file_path=path))
+    profiled = await read_excel(ReadExcelArgs(file_path=path, profile=True))
+
+    assert profiled == plain
+    capture = profiling.recent_captures()[-1]
+    assert capture["tool"] == "read_excel"
+    stats = pstats.Stats(capture["profile_path"])
+    assert any(name == "_select_rows" for _, _, name in stats.stats)
+    report = Path(capture["report_path"]).read_text()
+    assert "allocation sites" in report
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.asyncio
+async def test_latency_threshold(make_workbook, profile_dir, monkeypatch):
+    """With a threshold, only calls at least that slow are kept."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1]})})
+
+    monkeypatch.setenv("EXCEL_POLARS_MCP_PROFILE_THRESHOLD_MS", "60000")
+    await read_excel(ReadExcelArgs(file_path=path))
+    assert not profile_dir.exists()
+
+    monkeypatch.setenv("EXCEL_POLARS_MCP_PROFILE_THRESHOLD_MS", "1")
+    # A cold parse of the sheet takes longer than a millisecond
+    await read_excel(ReadExcelArgs(file_path=path, sheet_name="Data"))
+    assert len(list(profile_dir.glob("*-read_excel-*.prof"))) == 1
+
+
+def test_overlapping_profiled_calls():
+    """A call overlapping another profiled one runs unprofiled, not failing."""
+    first, second = profiling.ProfileSession(), profiling.ProfileSession()
+    barrier = threading.Barrier(2, timeout=10)
+
+    def work(value):
+        barrier.wait()
+        return value
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(session.run, functools.partial(work, value))
+            for session, value in ((first, 1), (second, 2))
+        ]
+        results = [future.result() for future in futures]
+
+    assert results == [1, 2]
+    assert len(first.profiles) + len(second.profiles) == 1
+    assert first.partial != second.partial
+
+
+@pytest.mark.asyncio
+async def test_profiled_read_many_matches_unprofiled(make_workbook, tmp_path):
+    """Parallel reads under one profiled call return the usual result."""
+    for month in (1, 2, 3):
+        make_workbook({"Data": pl.DataFrame({"a": [month]})}, f"{month}.xlsx")
+    pattern = str(tmp_path / "*.xlsx")
+
+    plain = await read_many(ReadManyArgs(glob=pattern, sheet_name="Data"))
+    profiled = await read_many(
+        ReadManyArgs(glob=pattern, sheet_name="Data", profile=True)
+    )
+
+    assert profiled == plain
+    assert profiling.recent_captures()[-1]["tool"] == "read_many"
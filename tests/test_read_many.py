@@ -0,0 +1,78 @@
+"""Tests for reading one sheet from many workbooks in a single call."""
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp.serialization import decode_frame
+from excel_polars_mcp.server import ReadManyArgs, read_many
+
+
+@pytest.fixture
+def monthly_files(make_workbook, tmp_path):
+    """Three monthly workbooks whose columns and dtypes drift."""
+    make_workbook(
+        {"Claims": pl.DataFrame({"id": [1, 2], "amount": [10, 20]})}, "2024-01.xlsx"
+    )
+    make_workbook(
+        {"Claims": pl.DataFrame({"id": [3], "amount": [2.5], "region": ["N"]})},
+        "2024-02.xlsx",
+    )
+    make_workbook({"Other": pl.DataFrame({"x": [1]})}, "2024-03.xlsx")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_read_many_separate(monthly_files):
+    """Each file gets its own result; one lacking the sheet is an error entry."""
+    result = await read_many(
+        ReadManyArgs(glob=str(monthly_files / "2024-*.xlsx"), sheet_name="Claims")
+    )
+
+    assert result["success"] is True
+    first, second = (str(monthly_files / f"2024-0{m}.xlsx") for m in (1, 2))
+    assert result["file_paths"] == [first, second]
+    assert result["files"][first]["data"] == {"id": [1, 2], "amount": [10, 20]}
+    assert result["files"][second]["total_rows"] == 1
+    assert list(result["errors"]) == [str(monthly_files / "2024-03.xlsx")]
+
+
+@pytest.mark.asyncio
+async def test_read_many_concat_aligns_schemas(monthly_files):
+    """Concatenation matches columns by name and tags rows with their file."""
+    first, second = (str(monthly_files / f"2024-0{m}.xlsx") for m in (1, 2))
+    result = await read_many(
+        ReadManyArgs(
+            file_paths=[first, second, first, str(monthly_files / "missing.xlsx")],
+            sheet_name="Claims",
+            combine="concat",
+            format="arrow_ipc",
+        )
+    )
+
+    assert result["success"] is True
+    df = decode_frame(result["data"], "arrow_ipc")
+    assert df.columns == ["source_file", "id", "amount", "region"]
+    assert df["source_file"].to_list() == [first, first, second]
+    assert df["amount"].to_list() == [10.0, 20.0, 2.5]
+    assert df["region"].to_list() == [None, None, "N"]
+    assert "File not found" in result["errors"][str(monthly_files / "missing.xlsx")]
+
+    limited = await read_many(
+        ReadManyArgs(
+            file_paths=[first, second], sheet_name="Claims", combine="concat", limit=2
+        )
+    )
+    assert limited["shape"] == (2, 4)
+    assert limited["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_read_many_rejects_empty_and_oversized(monthly_files):
+    """No matches, or more than max_files, fail the whole call."""
+    none = await read_many(ReadManyArgs(glob=str(monthly_files / "*.csv")))
+    assert "error" in none
+
+    many = await read_many(
+        ReadManyArgs(glob=str(monthly_files / "*.xlsx"), max_files=2)
+    )
+    assert "max_files" in many["error"]
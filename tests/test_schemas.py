@@ -0,0 +1,165 @@
+"""Tests for schema overrides, sampled inference and the schema cache."""
+
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import reader, schemas
+from excel_polars_mcp.cache import sheet_cache
+from excel_polars_mcp.schemas import normalize_overrides, parse_dtype
+from excel_polars_mcp.server import ReadExcelArgs, read_excel
+
+
+def test_parse_dtype():
+    """Dtype names round-trip through str() and anything else is rejected."""
+    assert parse_dtype("Int64") == pl.Int64
+    assert parse_dtype("Datetime(time_unit='ms')") == pl.Datetime("ms")
+    assert parse_dtype(str(pl.Decimal(12, 2))) == pl.Decimal(12, 2)
+    assert parse_dtype("List(Float64)") == pl.List(pl.Float64)
+    for bad in ("Int65", "__import__('os')", "col", "1 + 1"):
+        with pytest.raises(ValueError, match="Unknown dtype"):
+            parse_dtype(bad)
+    assert normalize_overrides({"b": "Utf8", "a": "Int32"}) == (
+        ("a", "Int32"),
+        ("b", "String"),
+    )
+
+
+def _late_text(tmp_path) -> str:
+    """Integers and whole numbers for the first rows, then text and decimals."""
+    import xlsxwriter
+
+    path = str(tmp_path / "late.xlsx")
+    with xlsxwriter.Workbook(path) as workbook:
+        sheet = workbook.add_worksheet("Data")
+        sheet.write_row(0, 0, ["mixed", "amount"])
+        for row in range(1, 301):
+            sheet.write(row, 0, row if row < 290 else "N/A")
+            sheet.write(row, 1, row if row < 250 else row + 0.5)
+    return path
+
+
+def test_sampled_inference_keeps_late_values(tmp_path):
+    """Head inference nulls late text; sampling the whole sheet keeps it."""
+    path = _late_text(tmp_path)
+
+    head = reader.load_sheet(path, "Data")
+    assert head.schema["mixed"] == pl.Int64
+    assert head["mixed"].null_count() == 11
+
+    sampled = reader.load_sheet(path, "Data", schema_inference="sampled")
+    assert sampled.schema["mixed"] == pl.String
+    assert sampled.schema["amount"] == pl.Float64
+    assert sampled["mixed"][-1] == "N/A"
+    assert sampled["amount"][-1] == 300.5
+
+
+def test_sampled_inference_checks_every_row(tmp_path):
+    """A single text cell far from the head still types the column as String."""
+    import xlsxwriter
+
+    path = str(tmp_path / "one_text_cell.xlsx")
+    with xlsxwriter.Workbook(path) as workbook:
+        sheet = workbook.add_worksheet("Data")
+        sheet.write(0, 0, "id")
+        for row in range(1, 5_001):
+            sheet.write(row, 0, "N/A" if row == 3333 else row)
+
+    sampled = reader.load_sheet(path, "Data", schema_inference="sampled")
+    assert sampled.schema["id"] == pl.String
+    assert sampled["id"][3332] == "N/A"
+    assert sampled["id"].null_count() == 0
+
+
+def test_sampled_schema_is_cached_per_workbook_version(tmp_path, monkeypatch):
+    """A stored schema is reused until the workbook changes."""
+    path = _late_text(tmp_path)
+    reader.load_sheet(path, "Data", schema_inference="sampled")
+    sheet_cache.clear()
+
+    calls = []
+    infer = schemas.infer_sampled_schema
+    monkeypatch.setattr(
+        schemas,
+        "infer_sampled_schema",
+        lambda *args, **kwargs: calls.append(1) or infer(*args, **kwargs),
+    )
+    df = reader.load_sheet(path, "Data", schema_inference="sampled")
+    assert calls == []
+    assert df.schema["mixed"] == pl.String
+
+    _late_text(tmp_path)
+    sheet_cache.clear()
+    reader.load_sheet(path, "Data", schema_inference="sampled")
+    assert calls == [1]
+
+
+def test_schema_overrides(tmp_path):
+    """Overrides win over inference and unknown columns are skipped."""
+    path = _late_text(tmp_path)
+
+    df = reader.load_sheet(
+        path, "Data", schema_overrides={"mixed": "String", "other": "Int8"}
+    )
+    assert df.schema["mixed"] == pl.String
+    assert df["mixed"][-1] == "N/A"
+
+    subset = reader.load_sheet(
+        path, "Data", columns=["amount"], schema_overrides={"mixed": "String"}
+    )
+    assert subset.columns == ["amount"]
+
+    sampled = reader.load_sheet(
+        path,
+        "Data",
+        schema_overrides={"amount": "String"},
+        schema_inference="sampled",
+    )
+    assert sampled.schema["amount"] == pl.String
+    assert sampled.schema["mixed"] == pl.String
+
+
+@pytest.mark.asyncio
+async def test_read_excel_schema_args(tmp_path):
+    """The tool accepts overrides and sampled inference; bad dtypes are errors."""
+    path = _late_text(tmp_path)
+
+    result = await read_excel(
+        ReadExcelArgs(file_path=path, schema_inference="sampled", limit=1)
+    )
+    assert result["success"] is True
+    assert result["schema"]["mixed"] == "String"
+
+    result = await read_excel(
+        ReadExcelArgs(file_path=path, schema_overrides={"mixed": "Int99"})
+    )
+    assert "Unknown dtype" in result["error"]
+
+
+def test_sampled_inference_of_date_cells(make_workbook):
+    """Real date and datetime cells are typed as Date and Datetime."""
+    path = make_workbook({
+        "Data": pl.DataFrame({
+            "day": [date(2024, 1, day) for day in range(1, 4)],
+            "at": [datetime(2024, 1, 1, hour, 30) for hour in range(3)],
+        })
+    })
+
+    df = reader.load_sheet(path, "Data", schema_inference="sampled")
+    assert df.schema["day"] == pl.Date
+    assert df.schema["at"] == pl.Datetime("us")
+    assert df["day"][-1] == date(2024, 1, 3)
+
+
+def test_read_workbook_with_schema_options(tmp_path):
+    """Sheets parsed one by one for overrides or sampling are returned and cached."""
+    path = _late_text(tmp_path)
+
+    frames = reader.read_workbook(path, schema_overrides={"mixed": "String"})
+    assert frames["Data"].schema["mixed"] == pl.String
+    assert frames["Data"]["mixed"][-1] == "N/A"
+    assert sheet_cache.stats()["entries"] == 1
+
+    sampled = reader.read_workbook(path, schema_inference="sampled")
+    assert sampled["Data"].schema["amount"] == pl.Float64
@@ -0,0 +1,119 @@
+"""Tests for columnar response formats."""
+
+from datetime import date
+
+import polars as pl
+import pydantic_core
+import pytest
+
+from excel_polars_mcp.serialization import (
+    available_compressions,
+    decode_frame,
+    encode_frame,
+    frame_payload,
+    payload_data_bytes,
+)
+from excel_polars_mcp.server import ReadExcelArgs, read_excel
+
+
+@pytest.mark.parametrize("fmt", ["json", "arrow_ipc", "parquet"])
+def test_round_trip(fmt):
+    """Every format decodes back to the original frame."""
+    df = pl.DataFrame({
+        "id": [1, 2, 3],
+        "name": ["a", "b", None],
+        "when": [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)],
+    })
+    assert decode_frame(encode_frame(df, fmt), fmt).equals(df)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["arrow_ipc", "parquet"])
+async def test_read_excel_binary_format(make_workbook, fmt):
+    """Binary formats return a base64 payload matching the JSON result."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})})
+
+    as_json = await read_excel(ReadExcelArgs(file_path=path))
+    as_binary = await read_excel(ReadExcelArgs(file_path=path, format=fmt))
+
+    assert as_binary["success"] is True
+    assert as_binary["format"] == fmt
+    assert as_binary["encoding"] == "base64"
+    assert decode_frame(as_binary["data"], fmt).to_dict(as_series=False) == (
+        as_json["data"]
+    )
+
+
+@pytest.mark.parametrize("fmt", ["json", "arrow_ipc", "parquet"])
+def test_compressed_payload_round_trip(fmt):
+    """Payloads above the threshold are compressed and decode to the frame."""
+    df = pl.DataFrame({"id": list(range(5_000)), "kind": ["Term Life"] * 5_000})
+
+    payload = frame_payload(df, fmt, compression=["gzip"], compress_min_bytes=1024)
+
+    assert payload["compression"] == "gzip"
+    assert payload["encoding"] == "base64"
+    assert payload["compressed_bytes"] < payload["uncompressed_bytes"]
+    assert payload["compression_ratio"] > 1
+    assert decode_frame(payload["data"], fmt, "gzip").equals(df)
+
+
+def test_compression_threshold_and_negotiation():
+    """Small payloads and unknown compressions are sent uncompressed."""
+    df = pl.DataFrame({"a": [1, 2, 3]})
+
+    small = frame_payload(df, "json", compression=["gzip"], compress_min_bytes=1024)
+    assert "compression" not in small
+    assert small["data"] == {"a": [1, 2, 3]}
+
+    unknown = frame_payload(df, "parquet", compression=["brotli"])
+    assert "compression" not in unknown
+    assert decode_frame(unknown["data"], "parquet").equals(df)
+
+    # zstd is preferred but optional; gzip is always available
+    chosen = frame_payload(df, "json", compression=["zstd", "gzip"])["compression"]
+    assert chosen == ("zstd" if "zstd" in available_compressions() else "gzip")
+
+
+def test_zstd_round_trip():
+    """zstd is used when the zstandard package is installed."""
+    pytest.importorskip("zstandard")
+    df = pl.DataFrame({"a": list(range(1_000))})
+
+    payload = frame_payload(df, "arrow_ipc", compression=["zstd"])
+    assert payload["compression"] == "zstd"
+    assert decode_frame(payload["data"], "arrow_ipc", "zstd").equals(df)
+
+
+@pytest.mark.asyncio
+async def test_read_excel_compression(make_workbook):
+    """The read tools negotiate compression with compress_min_bytes."""
+    path = make_workbook({"Data": pl.DataFrame({"a": list(range(2_000))})})
+
+    result = await read_excel(
+        ReadExcelArgs(file_path=path, compression=["gzip"], compress_min_bytes=0)
+    )
+    assert result["compression"] == "gzip"
+    assert decode_frame(result["data"], "json", "gzip")["a"].to_list() == list(
+        range(2_000)
+    )
+
+    # The default threshold leaves small results uncompressed
+    plain = await read_excel(ReadExcelArgs(file_path=path, compression=["gzip"]))
+    assert "compression" not in plain
+
+
+def test_payload_data_bytes():
+    """Base64 data is measured exactly; large JSON data is extrapolated."""
+    df = pl.DataFrame({"id": range(5_000), "name": ["policy"] * 5_000})
+
+    columnar = frame_payload(df, "arrow_ipc")
+    assert payload_data_bytes(df, columnar) == len(columnar["data"])
+
+    small = frame_payload(df.head(10))
+    exact = len(pydantic_core.to_json(small["data"]))
+    assert payload_data_bytes(df.head(10), small) == exact
+
+    estimate = payload_data_bytes(df, frame_payload(df))
+    actual = len(pydantic_core.to_json(df.to_dict(as_series=False)))
+    assert estimate == pytest.approx(actual, rel=0.1)
@@ -0,0 +1,81 @@
+"""Tests for the Parquet sidecar store."""
+
+import os
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import reader, sidecar
+from excel_polars_mcp.cache import sheet_cache
+from excel_polars_mcp.filters import FilterCondition
+from excel_polars_mcp.server import ReadExcelArgs, read_excel
+from excel_polars_mcp.sidecar import SidecarStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Enable a sidecar store in a temporary directory."""
+    sidecar_store = SidecarStore(tmp_path / "sidecars")
+    monkeypatch.setattr(sidecar, "sidecar_store", sidecar_store)
+    return sidecar_store
+
+
+@pytest.fixture
+def data_file(make_workbook):
+    """Workbook with one small sheet."""
+    return make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})})
+
+
+def _forbid_excel_parsing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Excel file was parsed")
+
+    monkeypatch.setattr(reader.pl, "read_excel", fail)
+
+
+def test_sidecar_survives_memory_cache_loss(store, data_file, monkeypatch):
+    """After a restart (empty memory cache) reads come from Parquet."""
+    first = reader.load_sheet(data_file, sheet_name="Data")
+    assert len(list(store.cache_dir.glob("*.parquet"))) == 1
+
+    sheet_cache.clear()
+    _forbid_excel_parsing(monkeypatch)
+
+    assert reader.load_sheet(data_file, sheet_name="Data").equals(first)
+
+
+def test_touched_file_keeps_sidecar(store, data_file, monkeypatch):
+    """A new mtime with identical content is revalidated by hash."""
+    reader.load_sheet(data_file, sheet_name="Data")
+    stat = os.stat(data_file)
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    sheet_cache.clear()
+    _forbid_excel_parsing(monkeypatch)
+
+    assert reader.load_sheet(data_file, sheet_name="Data").height == 3
+
+
+def test_modified_file_invalidates_sidecar(store, data_file, make_workbook):
+    """Changed content discards the sidecar and re-parses the workbook."""
+    reader.load_sheet(data_file, sheet_name="Data")
+    make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3, 4], "b": list("wxyz")})})
+    sheet_cache.clear()
+
+    assert reader.load_sheet(data_file, sheet_name="Data").height == 4
+
+
+@pytest.mark.asyncio
+async def test_filtered_read_scans_sidecar(store, data_file, monkeypatch):
+    """Filtered reads are served by scanning the sidecar."""
+    reader.load_sheet(data_file, sheet_name=None)
+    sheet_cache.clear()
+    _forbid_excel_parsing(monkeypatch)
+
+    result = await read_excel(
+        ReadExcelArgs(
+            file_path=data_file,
+            columns=["b"],
+            filter=[FilterCondition(column="a", op="ge", value=2)],
+        )
+    )
+    assert result["data"] == {"b": ["y", "z"]}
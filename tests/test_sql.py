@@ -0,0 +1,109 @@
+"""Tests for the SQL query tool."""
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import reader
+from excel_polars_mcp.server import QuerySqlArgs, query_sql
+
+
+@pytest.fixture
+def actuarial_file(make_workbook):
+    """Workbook with policies and claims sheets."""
+    return make_workbook({
+        "Policies": pl.DataFrame({
+            "Policy_ID": ["P1", "P2", "P3", "P4"],
+            "Policy_Type": ["Term Life", "Annuity", "Term Life", "Annuity"],
+            "Face_Amount": [100000, 250000, 500000, 750000],
+        }),
+        "Claims": pl.DataFrame({
+            "Claim_ID": ["C1", "C2", "C3"],
+            "Policy_ID": ["P1", "P3", "P3"],
+            "Claim_Amount": [1000, 2000, 3000],
+        }),
+    })
+
+
+@pytest.mark.asyncio
+async def test_query_sql_aggregates(actuarial_file):
+    """Only the aggregated result set is returned."""
+    result = await query_sql(QuerySqlArgs(
+        query=(
+            "SELECT Policy_Type, SUM(Face_Amount) AS total FROM Policies "
+            "GROUP BY Policy_Type ORDER BY Policy_Type"
+        ),
+        file_paths=[actuarial_file],
+    ))
+
+    assert result["success"] is True
+    assert result["data"] == {
+        "Policy_Type": ["Annuity", "Term Life"],
+        "total": [1000000, 600000],
+    }
+    assert result["tables"] == ["Policies", "Claims"]
+    assert result["truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_query_sql_join_and_limit(actuarial_file):
+    """Joins across sheets work and results are cut at limit."""
+    result = await query_sql(QuerySqlArgs(
+        query=(
+            "SELECT c.Claim_ID, p.Policy_Type FROM Claims c "
+            "JOIN Policies p ON c.Policy_ID = p.Policy_ID ORDER BY c.Claim_ID"
+        ),
+        file_paths=[actuarial_file],
+        limit=2,
+    ))
+
+    assert result["data"] == {
+        "Claim_ID": ["C1", "C2"],
+        "Policy_Type": ["Term Life", "Term Life"],
+    }
+    assert result["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_query_sql_loads_only_referenced_sheets(actuarial_file, monkeypatch):
+    """Sheets the query does not mention are never parsed."""
+    loaded = []
+    original = reader.pl.read_excel
+
+    def tracking_read_excel(*args, **kwargs):
+        loaded.append(kwargs.get("sheet_name"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(reader.pl, "read_excel", tracking_read_excel)
+    result = await query_sql(QuerySqlArgs(
+        query="SELECT COUNT(*) AS n FROM Claims", file_paths=[actuarial_file]
+    ))
+
+    assert result["data"] == {"n": [3]}
+    assert loaded == ["Claims"]
+
+
+@pytest.mark.asyncio
+async def test_query_sql_multiple_workbooks(make_workbook):
+    """With several workbooks, tables are prefixed with the file stem."""
+    first = make_workbook({"Data": pl.DataFrame({"a": [1, 2]})}, name="north.xlsx")
+    second = make_workbook({"Data": pl.DataFrame({"a": [3]})}, name="south.xlsx")
+    result = await query_sql(QuerySqlArgs(
+        query=(
+            "SELECT SUM(a) AS total FROM "
+            "(SELECT a FROM north_Data UNION ALL SELECT a FROM south_Data)"
+        ),
+        file_paths=[first, second],
+    ))
+
+    assert result["tables"] == ["north_Data", "south_Data"]
+    assert result["data"] == {"total": [6]}
+
+
+@pytest.mark.asyncio
+async def test_query_sql_reports_errors(actuarial_file):
+    """Invalid SQL returns an error instead of raising."""
+    result = await query_sql(QuerySqlArgs(
+        query="SELECT * FROM Missing", file_paths=[actuarial_file]
+    ))
+
+    assert "Failed to run SQL query" in result["error"]
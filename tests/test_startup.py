@@ -0,0 +1,85 @@
+"""Tests that server startup stays fast and defers heavy imports."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from excel_polars_mcp import lazy, server
+
+# Seconds the server module may add to ``import fastmcp``; loading Polars
+# eagerly alone costs about a quarter of this
+IMPORT_BUDGET_SECONDS = 0.5
+
+HEAVY_MODULES = ("polars", "fastexcel", "openpyxl")
+
+_IMPORT_TIMER = """
+import json, sys, time
+
+import fastmcp.server.server
+
+start = time.perf_counter()
+import excel_polars_mcp.server
+
+elapsed = time.perf_counter() - start
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def _time_server_import() -> dict:
+    script = _IMPORT_TIMER.format(heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_server_import_defers_heavy_modules():
+    """Importing the server loads neither Polars nor any Excel engine."""
+    assert _time_server_import()["loaded"] == []
+
+
+def test_server_import_within_budget():
+    """The server module imports within budget on top of FastMCP itself."""
+    # Best of three, so a busy machine does not fail the check by chance
+    seconds = min(_time_server_import()["seconds"] for _ in range(3))
+    assert seconds < IMPORT_BUDGET_SECONDS
+
+
+def test_lazy_module_loads_on_first_use():
+    """A lazy module imports on attribute access and then delegates to it."""
+    module = lazy.LazyModule("json")
+    assert "not loaded" in repr(module)
+    assert module.dumps([1]) == "[1]"
+    assert module.load() is json
+    assert "(loaded)" in repr(module)
+
+
+def test_warm_up_imports_in_background():
+    """The warm-up thread leaves the requested modules imported."""
+    thread = lazy.start_warm_up(("polars", "colorsys", "no_such_module"))
+    thread.join(timeout=30)
+    assert not thread.is_alive()
+    assert "colorsys" in sys.modules
+    assert lazy.polars.load() is sys.modules["polars"]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_starts_after_handshake(monkeypatch):
+    """The warm-up starts once the handshake is answered, and only once."""
+    started = []
+    monkeypatch.setattr(server, "start_warm_up", lambda: started.append(1))
+    middleware = server.WarmUpAfterHandshake()
+    app = FastMCP("warm-up", middleware=[middleware])
+
+    assert started == []
+    async with Client(app):
+        assert started == [1]
+    async with Client(app):
+        assert started == [1]
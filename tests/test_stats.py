@@ -0,0 +1,142 @@
+"""Tests for single-pass column statistics."""
+
+import datetime as dt
+from decimal import Decimal
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import reader, sidecar
+from excel_polars_mcp.cache import sheet_cache
+from excel_polars_mcp.server import DescribeSheetArgs, describe_sheet
+from excel_polars_mcp.sidecar import SidecarStore
+from excel_polars_mcp.stats import describe_frame, quantile_rank_error
+
+
+def test_describe_frame_covers_all_dtypes():
+    """Narrow ints, unsigned, Decimal, dates and booleans all get statistics."""
+    df = pl.DataFrame({
+        "small": pl.Series([1, 2, None], dtype=pl.Int16),
+        "unsigned": pl.Series([10, 20, 30], dtype=pl.UInt32),
+        "amount": pl.Series(
+            [Decimal("1.50"), Decimal("2.50"), None], dtype=pl.Decimal(10, 2)
+        ),
+        "issued": [dt.date(2020, 1, 1), None, dt.date(2021, 6, 30)],
+        "status": ["Active", "Lapsed", "Active"],
+        "smoker": [True, False, True],
+    })
+    summary = describe_frame(df)
+    stats = summary["columns"]
+
+    assert summary["rows"] == 3
+    assert stats["small"] == {
+        "dtype": "Int16",
+        "count": 2,
+        "null_count": 1,
+        "min": 1,
+        "max": 2,
+        "mean": 1.5,
+        "std": pytest.approx(0.7071, abs=1e-4),
+        "p25": 1.0,
+        "p50": 2.0,
+        "p75": 2.0,
+    }
+    assert stats["unsigned"]["mean"] == 20.0
+    assert stats["amount"]["max"] == Decimal("2.50")
+    assert stats["issued"]["min"] == dt.date(2020, 1, 1)
+    assert stats["issued"]["null_count"] == 1
+    assert stats["status"]["n_unique"] == 2
+    assert stats["smoker"]["true_count"] == 2
+
+
+def test_describe_frame_lazy_and_column_subset():
+    """LazyFrames are accepted and unknown columns are rejected."""
+    lazy = pl.LazyFrame({"a": [3, 1, 2], "b": ["x", "y", "z"]})
+
+    summary = describe_frame(lazy, ["a"])
+    assert list(summary["columns"]) == ["a"]
+    assert summary["columns"]["a"]["min"] == 1
+
+    with pytest.raises(ValueError, match="Unknown columns: c"):
+        describe_frame(lazy, ["c"])
+
+
+def test_approximate_mode_within_error_bounds():
+    """Sketched n_unique and sampled quantiles stay within the stated bounds."""
+    rows = 200_000
+    lazy = pl.LazyFrame({
+        "value": pl.int_range(rows, eager=True).shuffle(seed=1),
+        "key": pl.int_range(rows, eager=True).cast(pl.String),
+    })
+    summary = describe_frame(
+        lazy, quantiles=[0.1, 0.5, 0.9], approximate=True, sample_size=20_000
+    )
+    bounds = summary["error_bounds"]
+    value, key = summary["columns"]["value"], summary["columns"]["key"]
+
+    assert summary["approximate"] is True
+    assert value["min"] == 0 and value["max"] == rows - 1
+    assert 15_000 < bounds["quantile_sample_rows"] < 25_000
+    assert bounds["quantile_rank_error"] == pytest.approx(
+        quantile_rank_error(bounds["quantile_sample_rows"])
+    )
+    for q in (0.1, 0.5, 0.9):
+        rank = value[f"p{q * 100:g}"] / rows
+        assert abs(rank - q) <= bounds["quantile_rank_error"]
+    # Four standard errors
+    relative = abs(key["n_unique"] - rows) / rows
+    assert relative <= 4 * bounds["n_unique_relative_std_error"]
+
+
+def test_approximate_mode_small_frame_is_exact():
+    """A frame smaller than the sample is used whole, with zero rank error."""
+    summary = describe_frame(pl.DataFrame({"a": [1, 2, 3, 4]}), approximate=True)
+
+    assert summary["error_bounds"]["quantile_rank_error"] == 0.0
+    assert summary["columns"]["a"]["p50"] == describe_frame(
+        pl.DataFrame({"a": [1, 2, 3, 4]})
+    )["columns"]["a"]["p50"]
+
+
+@pytest.mark.asyncio
+async def test_describe_sheet_tool(make_workbook):
+    """The tool reports statistics for the parsed sheet."""
+    path = make_workbook({
+        "Policies": pl.DataFrame({
+            "Policy_ID": ["P1", "P2", "P3"],
+            "Face_Amount": [100000, 250000, 500000],
+        })
+    })
+    result = await describe_sheet(DescribeSheetArgs(file_path=path))
+
+    assert result["success"] is True
+    assert result["rows"] == 3
+    assert result["columns"]["Face_Amount"]["max"] == 500000
+    assert result["columns"]["Policy_ID"]["n_unique"] == 3
+
+    approximate = await describe_sheet(
+        DescribeSheetArgs(file_path=path, approximate=True, quantiles=[0.5])
+    )
+    assert approximate["approximate"] is True
+    assert approximate["columns"]["Face_Amount"]["p50"] == 250000
+    assert "error_bounds" in approximate
+
+
+@pytest.mark.asyncio
+async def test_describe_sheet_scans_sidecar(tmp_path, make_workbook, monkeypatch):
+    """With a valid sidecar the sheet is neither parsed nor loaded eagerly."""
+    monkeypatch.setattr(sidecar, "sidecar_store", SidecarStore(tmp_path / "sc"))
+    path = make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3]})})
+    reader.load_sheet(path, sheet_name="Data")
+    sheet_cache.clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Sheet was loaded eagerly")
+
+    monkeypatch.setattr(reader, "load_sheet", fail)
+    result = await describe_sheet(
+        DescribeSheetArgs(file_path=path, sheet_name="Data")
+    )
+
+    assert result["success"] is True
+    assert result["columns"]["a"]["mean"] == 2.0
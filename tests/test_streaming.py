@@ -0,0 +1,151 @@
+"""Tests for bounded-memory streaming reads."""
+
+from datetime import date, datetime, timedelta
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import server
+from excel_polars_mcp.filters import FilterCondition
+from excel_polars_mcp.serialization import decode_frame
+from excel_polars_mcp.server import ReadExcelSheetArgs, read_excel_sheet
+from excel_polars_mcp.streaming import iter_sheet_batches
+
+
+@pytest.fixture
+def claims_file(make_workbook):
+    """Workbook with a 95-row claims sheet."""
+    df = pl.DataFrame({
+        "Claim_ID": [f"CLM{i:03d}" for i in range(95)],
+        "Claim_Amount": [i * 1000 for i in range(95)],
+        "Claim_Date": [date(2024, 1, 1) + timedelta(days=i) for i in range(95)],
+        "Reported": [datetime(2024, 1, 1, 9) + timedelta(hours=i) for i in range(95)],
+    })
+    return make_workbook({"Claims": df})
+
+
+def test_batches_are_bounded(claims_file):
+    """Batches never exceed batch_size and cover every row."""
+    batches = list(iter_sheet_batches(claims_file, "Claims", batch_size=20))
+
+    assert [batch.height for batch in batches] == [20, 20, 20, 20, 15]
+    assert batches[0].columns == [
+        "Claim_ID", "Claim_Amount", "Claim_Date", "Reported"
+    ]
+    combined = pl.concat(batches, how="vertical_relaxed")
+    assert combined["Claim_Amount"].to_list() == [i * 1000 for i in range(95)]
+
+
+@pytest.mark.asyncio
+async def test_streaming_pages_match_eager(claims_file):
+    """Streaming mode returns the same page as eager mode, with metadata."""
+    common = dict(
+        file_path=claims_file,
+        sheet_name="Claims",
+        filter=[FilterCondition(column="Claim_Amount", op="ge", value=10_000)],
+        offset=5,
+        limit=30,
+        format="arrow_ipc",
+    )
+    eager = await read_excel_sheet(ReadExcelSheetArgs(**common))
+    streamed = await read_excel_sheet(
+        ReadExcelSheetArgs(**common, mode="streaming", batch_size=16)
+    )
+
+    assert streamed["success"] is True
+    page = decode_frame(streamed["data"], "arrow_ipc")
+    assert page.equals(decode_frame(eager["data"], "arrow_ipc"))
+    assert page.schema["Claim_Date"] == pl.Date
+    assert streamed["next_cursor"] is not None
+    assert streamed["total_rows"] is None
+    assert streamed["streaming"]["batches_read"] < 95 // 16 + 1
+    assert streamed["streaming"]["peak_batch_bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_streaming_last_page(claims_file):
+    """The final page reports the total and no cursor."""
+    args = ReadExcelSheetArgs(
+        file_path=claims_file, sheet_name="Claims", mode="streaming", offset=90
+    )
+    result = await read_excel_sheet(args)
+
+    assert result["shape"] == (5, 4)
+    assert result["total_rows"] == 95
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_streaming_dtypes_are_fixed_by_first_batch(make_workbook):
+    """A column empty in one batch keeps its dtype, so string filters work."""
+    path = make_workbook({
+        "Notes": pl.DataFrame({
+            "id": list(range(40)),
+            "note": ["late fee" if i % 3 == 0 else "ok" for i in range(20)]
+            + [None] * 20,
+            "amount": [float(i) for i in range(20)] + [i + 0.5 for i in range(20)],
+        })
+    })
+
+    batches = list(iter_sheet_batches(path, "Notes", batch_size=10))
+    assert {batch.schema["note"] for batch in batches} == {pl.String}
+    assert batches[-1].schema["amount"] == pl.Float64
+
+    condition = FilterCondition(column="note", op="contains", value="fee")
+    eager = await read_excel_sheet(
+        ReadExcelSheetArgs(file_path=path, sheet_name="Notes", filter=[condition])
+    )
+    streamed = await read_excel_sheet(
+        ReadExcelSheetArgs(
+            file_path=path,
+            sheet_name="Notes",
+            filter=[condition],
+            mode="streaming",
+            batch_size=10,
+        )
+    )
+    assert streamed["success"] is True
+    assert streamed["data"] == eager["data"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_applies_schema_options(tmp_path):
+    """Overrides and sampled inference type streamed pages like eager ones."""
+    import xlsxwriter
+
+    path = str(tmp_path / "late.xlsx")
+    with xlsxwriter.Workbook(path) as workbook:
+        sheet = workbook.add_worksheet("Data")
+        sheet.write_row(0, 0, ["id", "code"])
+        for row in range(1, 301):
+            sheet.write_row(row, 0, [row, "N/A" if row == 250 else row])
+
+    for options in (
+        {"schema_overrides": {"id": "Float64"}},
+        {"schema_inference": "sampled"},
+    ):
+        common = dict(file_path=path, sheet_name="Data", format="arrow_ipc", **options)
+        eager = await read_excel_sheet(ReadExcelSheetArgs(**common))
+        streamed = await read_excel_sheet(
+            ReadExcelSheetArgs(**common, mode="streaming", batch_size=50)
+        )
+        assert streamed["success"] is True
+        expected = decode_frame(eager["data"], "arrow_ipc")
+        assert decode_frame(streamed["data"], "arrow_ipc").equals(expected)
+
+    assert expected.schema["code"] == pl.String
+
+
+@pytest.mark.asyncio
+async def test_streaming_pages_are_bounded_by_default(claims_file, monkeypatch):
+    """Without a limit, streaming returns a default-size page and a cursor."""
+    monkeypatch.setattr(server, "DEFAULT_PAGE_ROWS", 40)
+    args = ReadExcelSheetArgs(
+        file_path=claims_file, sheet_name="Claims", mode="streaming", batch_size=16
+    )
+    result = await read_excel_sheet(args)
+
+    assert result["shape"] == (40, 4)
+    assert result["limit"] == 40
+    assert result["next_cursor"] is not None
+    assert result["streaming"]["process_peak_rss_bytes"] > 0
@@ -0,0 +1,106 @@
+"""Tests for prewarming workbooks in watched directories."""
+
+import os
+from datetime import date
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import reader, schemas, sidecar
+from excel_polars_mcp.cache import sheet_cache
+from excel_polars_mcp.server import ReadExcelArgs, read_excel
+from excel_polars_mcp.sidecar import SidecarStore
+from excel_polars_mcp.watcher import DirectoryWatcher
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Enable a sidecar store in a temporary directory."""
+    sidecar_store = SidecarStore(tmp_path / "sidecars")
+    monkeypatch.setattr(sidecar, "sidecar_store", sidecar_store)
+    return sidecar_store
+
+
+def test_settled_workbooks_are_prewarmed(
+    store, schema_store, make_workbook, tmp_path, monkeypatch
+):
+    """A new workbook is prewarmed on the scan after it stops changing."""
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    path = make_workbook({"One": df, "Two": df})
+    (tmp_path / "~$book.xlsx").write_bytes(b"lock")
+    watcher = DirectoryWatcher([tmp_path])
+
+    assert watcher.poll() == []
+    assert watcher.poll() == [str(os.path.realpath(path))]
+    assert watcher.poll() == []
+    assert len(list(store.cache_dir.glob("*.parquet"))) == 2
+    assert len(list(schema_store.cache_dir.glob("*.json"))) == 2
+    assert watcher.stats()["warmed_files"] == 1
+    assert watcher.stats()["failed_files"] == 0
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Workbook was read")
+
+    sheet_cache.clear()
+    monkeypatch.setattr(reader.pl, "read_excel", fail)
+    assert reader.load_sheet(path, sheet_name="Two").equals(df)
+    # Sampled reads parse once more, but reuse the stored schema
+    monkeypatch.setattr(reader.pl, "read_excel", pl.read_excel)
+    monkeypatch.setattr(schemas, "infer_sampled_schema", fail)
+    sampled = reader.load_sheet(path, sheet_name="Two", schema_inference="sampled")
+    assert sampled.equals(df)
+
+
+@pytest.mark.asyncio
+async def test_default_read_uses_prewarmed_sidecar(
+    store, make_workbook, tmp_path, monkeypatch
+):
+    """A read without sheet_name finds the first sheet's prewarmed sidecar."""
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    path = make_workbook({"First": df, "Second": df})
+    watcher = DirectoryWatcher([tmp_path])
+    watcher.poll()
+    watcher.poll()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Workbook was read")
+
+    sheet_cache.clear()
+    monkeypatch.setattr(reader.pl, "read_excel", fail)
+    result = await read_excel(ReadExcelArgs(file_path=path))
+    assert result["data"] == {"a": [1, 2, 3]}
+
+
+def test_modified_workbook_is_prewarmed_again(store, make_workbook, tmp_path):
+    """Changing a workbook re-prewarms it; a broken one is counted, not retried."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1]})})
+    watcher = DirectoryWatcher([tmp_path])
+    watcher.poll()
+    watcher.poll()
+
+    make_workbook({"Data": pl.DataFrame({"a": [1, 2]})})
+    os.utime(path, ns=(0, 10**18))
+    assert watcher.poll() == []
+    assert len(watcher.poll()) == 1
+
+    (tmp_path / "broken.xlsx").write_bytes(b"not a workbook")
+    watcher.poll()
+    assert watcher.poll() == []
+    assert watcher.poll() == []
+    stats = watcher.stats()
+    assert stats["warmed_files"] == 2
+    assert stats["failed_files"] == 1
+    assert "broken.xlsx" in stats["last_error"]
+
+
+def test_workbook_with_dates_is_prewarmed(store, schema_store, make_workbook, tmp_path):
+    """Date columns are inferred while prewarming instead of failing the file."""
+    df = pl.DataFrame({"day": [date(2024, 1, 1), date(2024, 2, 1)], "n": [1, 2]})
+    path = make_workbook({"Data": df})
+    watcher = DirectoryWatcher([tmp_path])
+    watcher.poll()
+
+    assert watcher.poll() == [str(os.path.realpath(path))]
+    assert watcher.stats()["failed_files"] == 0
+    sampled = reader.load_sheet(path, "Data", schema_inference="sampled")
+    assert sampled.schema["day"] == pl.Date
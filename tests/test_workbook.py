@@ -0,0 +1,61 @@
+"""Tests for single-pass multi-sheet reads."""
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import reader
+from excel_polars_mcp.server import ReadWorkbookArgs, read_workbook
+
+
+@pytest.fixture
+def actuarial_file(make_workbook):
+    """Workbook with three small sheets."""
+    return make_workbook({
+        "Life_Table": pl.DataFrame({"Age": [0, 1], "qx": [0.006, 0.0005]}),
+        "Policies": pl.DataFrame({"Policy_ID": ["P1", "P2", "P3"]}),
+        "Claims": pl.DataFrame({"Claim_ID": ["C1"], "Claim_Amount": [1000]}),
+    })
+
+
+def test_read_workbook_parses_once(actuarial_file, monkeypatch):
+    """All sheets come from one pl.read_excel call, then from the cache."""
+    calls = []
+    original = pl.read_excel
+
+    def counting_read_excel(*args, **kwargs):
+        calls.append(kwargs.get("sheet_name"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(reader.pl, "read_excel", counting_read_excel)
+
+    frames = reader.read_workbook(actuarial_file)
+    assert list(frames) == ["Life_Table", "Policies", "Claims"]
+    assert calls == [["Life_Table", "Policies", "Claims"]]
+
+    assert reader.load_sheet(actuarial_file, "Claims").equals(frames["Claims"])
+    reader.read_workbook(actuarial_file, ["Policies"])
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_read_workbook_tool_selected_sheets(actuarial_file):
+    """The tool returns only the selected sheets, in order."""
+    args = ReadWorkbookArgs(
+        file_path=actuarial_file, sheet_names=["Claims", "Life_Table"]
+    )
+    result = await read_workbook(args)
+
+    assert result["success"] is True
+    assert result["sheet_names"] == ["Claims", "Life_Table"]
+    assert result["sheets"]["Claims"]["data"] == {
+        "Claim_ID": ["C1"],
+        "Claim_Amount": [1000],
+    }
+    assert result["sheets"]["Life_Table"]["shape"] == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_read_workbook_missing_file():
+    """A missing file reports an error."""
+    result = await read_workbook(ReadWorkbookArgs(file_path="nonexistent.xlsx"))
+    assert "File not found" in result["error"]
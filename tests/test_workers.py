@@ -0,0 +1,75 @@
+"""Tests for the bounded worker pool."""
+
+import asyncio
+import threading
+import time
+
+import polars as pl
+import pytest
+
+from excel_polars_mcp import server
+from excel_polars_mcp.server import ReadExcelArgs, read_excel
+from excel_polars_mcp.workers import PoolBusyError, WorkerPool
+
+
+@pytest.mark.asyncio
+async def test_slow_reads_run_in_parallel(make_workbook, monkeypatch):
+    """Two slow reads overlap instead of running back to back."""
+    path = make_workbook({"Data": pl.DataFrame({"a": [1, 2, 3]})})
+    delay = 0.5
+
+    def slow_scan_sheet(*args, **kwargs):
+        time.sleep(delay)
+        return pl.DataFrame({"a": [1, 2, 3]}).lazy()
+
+    monkeypatch.setattr(server, "scan_sheet", slow_scan_sheet)
+    monkeypatch.setattr(server, "worker_pool", WorkerPool(max_workers=2))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        read_excel(ReadExcelArgs(file_path=path)),
+        read_excel(ReadExcelArgs(file_path=path)),
+    )
+    elapsed = time.perf_counter() - start
+
+    assert all(result["success"] for result in results)
+    assert elapsed < delay * 1.8
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive():
+    """The event loop keeps ticking while a blocking call runs in the pool."""
+    pool = WorkerPool(max_workers=1)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    await pool.run(time.sleep, 0.2)
+    task.cancel()
+    pool.shutdown()
+
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_is_enforced():
+    """Calls beyond running plus queued capacity are rejected."""
+    pool = WorkerPool(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    first = asyncio.ensure_future(pool.run(release.wait))
+    second = asyncio.ensure_future(pool.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PoolBusyError):
+        await pool.run(release.wait)
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert pool.stats()["in_flight"] == 0
+    pool.shutdown()
@@ -6,7 +6,6 @@ Quick viewer to show the contents of the actuarial Excel file.
 from pathlib import Path
 
 import polars as pl
-from openpyxl import load_workbook
 
 
 def view_actuarial_data():
@@ -21,11 +20,10 @@ def view_actuarial_data():
     print("📊 ACTUARIAL DATA EXCEL FILE CONTENTS")
     print("=" * 50)
     
-    # Get sheet names using openpyxl
+    # Read every sheet in one pass (the archive is opened only once)
     try:
-        workbook = load_workbook(filename=excel_path, read_only=True)
-        sheets = workbook.sheetnames
-        workbook.close()
+        frames = pl.read_excel(source=excel_path, sheet_id=0, has_header=True)
+        sheets = list(frames)
     except Exception as e:
         print(f"❌ Error reading file: {e}")
         return
@@ -38,12 +36,7 @@ def view_actuarial_data():
         print("-" * 40)
         
         try:
-            # Read sheet with polars
-            df = pl.read_excel(
-                source=excel_path,
-                sheet_name=sheet_name,
-                has_header=True
-            )
+            df = frames[sheet_name]
             
             print(f"   📊 Shape: {df.shape} (rows × columns)")
             print(f"   📝 Columns: {', '.join(df.columns)}")